@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            benchmarks.http_layer
+:Synopsis:          Offline throughput, latency and memory benchmarks for the HTTP layer against a local mock server
+:Usage:             ``python benchmarks/http_layer.py [--scenario get_ticket] [--latency 0.005] [--save results.json]``
+:Example:           ``python benchmarks/http_layer.py --error-rate 0.02 --compare baseline.json``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import sys
+import json
+import time
+import argparse
+import itertools
+import subprocess
+
+from freshpy import FreshPy
+from freshpy.utils import retry
+
+from mock_server import MockFreshservice
+
+# Import the resource module used to measure the peak memory usage (which is unavailable on Windows)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Define constants
+DEFAULT_WARMUP = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+BENCHMARK_API_KEY = 'benchmark-api-key'
+SCENARIOS = {}
+
+
+class Benchmark(object):
+    """This class times repeated calls of a function in the style of the ``benchmark`` fixture of pytest-benchmark."""
+    def __init__(self, iterations, warmup=DEFAULT_WARMUP, on_measure_start=None):
+        """This method instantiates the benchmark.
+
+        :param iterations: The number of measured calls
+        :type iterations: int
+        :param warmup: The number of calls made before measuring (e.g. to open pooled connections)
+        :type warmup: int
+        :param on_measure_start: A function called after the warmup and before the measured calls
+        :type on_measure_start: function, None
+        """
+        self.iterations = iterations
+        self.warmup = warmup
+        self.on_measure_start = on_measure_start
+        self.timings = []
+        self.elapsed = 0.0
+
+    def __call__(self, function, *args, **kwargs):
+        """This method calls a function repeatedly and records the duration of each measured call.
+
+        :param function: The function to benchmark
+        :type function: function
+        :returns: The value returned by the last call
+        """
+        result = None
+        for _ in range(self.warmup):
+            function(*args, **kwargs)
+        if self.on_measure_start:
+            self.on_measure_start()
+        started = time.perf_counter()
+        for _ in range(self.iterations):
+            call_started = time.perf_counter()
+            result = function(*args, **kwargs)
+            self.timings.append(time.perf_counter() - call_started)
+        self.elapsed = time.perf_counter() - started
+        return result
+
+
+def scenario(name, iterations):
+    """This function registers a benchmark scenario with its default number of iterations.
+
+    :param name: The name of the scenario
+    :type name: str
+    :param iterations: The default number of measured calls
+    :type iterations: int
+    :returns: The decorator that registers the scenario function
+    """
+    def _register(_function):
+        SCENARIOS[name] = (_function, iterations)
+        return _function
+    return _register
+
+
+@scenario('get_ticket', 300)
+def bench_get_ticket(benchmark, client, server):
+    """This function benchmarks the retrieval of individual tickets."""
+    ticket_indexes = itertools.count()
+    benchmark(lambda: client.tickets.get_ticket(server.get_ticket_id(next(ticket_indexes))))
+
+
+@scenario('get_tickets_pagination', 10)
+def bench_get_tickets_pagination(benchmark, client, server):
+    """This function benchmarks the retrieval of every ticket by following the paginated results."""
+    tickets = benchmark(lambda: list(client.tickets.iter_tickets()))
+    assert len(tickets) == server.ticket_count
+
+
+@scenario('get_tickets_prefetch', 10)
+def bench_get_tickets_prefetch(benchmark, client, server):
+    """This function benchmarks the retrieval of every ticket while requesting pages concurrently."""
+    tickets = benchmark(lambda: list(client.tickets.iter_tickets(prefetch=True)))
+    assert len(tickets) == server.ticket_count
+
+
+@scenario('get_all_agents', 20)
+def bench_get_all_agents(benchmark, client, server):
+    """This function benchmarks the retrieval of the agents returned by a single (unpaginated) request."""
+    agents = benchmark(client.agents.get_all_agents)
+    assert len(agents['agents']) == min(server.agent_count, server.default_per_page)
+
+
+@scenario('agent_email_lookup', 300)
+def bench_agent_email_lookup(benchmark, client, server):
+    """This function benchmarks the lookup of agent IDs using email addresses."""
+    agent_indexes = itertools.count()
+    benchmark(lambda: client.agents.get_agent_id(server.get_agent_email(next(agent_indexes))))
+
+
+def run_scenario(name, iterations=None, server_options=None, client_options=None):
+    """This function runs a single scenario against a new mock server and returns its results.
+
+    :param name: The name of the scenario
+    :type name: str
+    :param iterations: The number of measured calls (the default for the scenario is used when not defined)
+    :type iterations: int, None
+    :param server_options: The keyword arguments for the :py:class:`benchmarks.mock_server.MockFreshservice` class
+    :type server_options: dict, None
+    :param client_options: The keyword arguments for the :py:class:`freshpy.core.FreshPy` class
+    :type client_options: dict, None
+    :returns: A dictionary with the results of the scenario
+    """
+    function, default_iterations = SCENARIOS[name]
+    client_options = dict(client_options or {})
+    client_options.setdefault('retry_policy', retry.RetryPolicy(backoff_base=0.01, backoff_max=0.1))
+    with MockFreshservice(**(server_options or {})) as server:
+        with FreshPy(server.url, BENCHMARK_API_KEY, **client_options) as client:
+            benchmark = Benchmark(iterations or default_iterations, on_measure_start=server.reset_counters)
+            function(benchmark, client, server)
+            request_count, error_count = server.request_count, server.error_count
+    return {
+        'scenario': name,
+        'iterations': benchmark.iterations,
+        'requests': request_count,
+        'errors': error_count,
+        'calls_per_sec': round(benchmark.iterations / benchmark.elapsed, 2),
+        'requests_per_sec': round(request_count / benchmark.elapsed, 2),
+        'p50_ms': round(get_percentile(benchmark.timings, 50) * 1000, 3),
+        'p99_ms': round(get_percentile(benchmark.timings, 99) * 1000, 3),
+        'peak_rss_mb': get_peak_rss_mb(),
+    }
+
+
+def run_isolated(name, arguments):
+    """This function runs a scenario in a separate process so that its peak memory usage is measured on its own.
+
+    :param name: The name of the scenario
+    :type name: str
+    :param arguments: The command-line arguments to pass through to the process
+    :type arguments: list
+    :returns: A dictionary with the results of the scenario
+    """
+    command = [sys.executable, __file__, '--in-process', '--json', '--scenario', name] + arguments
+    completed = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(completed.stdout)[0]
+
+
+def get_percentile(values, percentile):
+    """This function returns a percentile of a list of values using the nearest-rank method.
+
+    :param values: The values
+    :type values: list
+    :param percentile: The percentile (between ``0`` and ``100``)
+    :type percentile: int, float
+    :returns: The value at the percentile or ``0.0`` when there are no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(percentile / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def get_peak_rss_mb():
+    """This function returns the peak resident set size of the current process in megabytes.
+
+    :returns: The peak RSS rounded to one decimal place or ``None`` if it cannot be measured
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss = peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+    return round(peak_rss / (1024 * 1024), 1)
+
+
+def compare_results(results, baseline, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """This function compares results with a baseline and returns the regressions that exceed a threshold.
+
+    :param results: The list of scenario results
+    :type results: list
+    :param baseline: The list of scenario results from a previous run
+    :type baseline: list
+    :param threshold: The fractional change that is reported as a regression (``0.1`` by default)
+    :type threshold: float
+    :returns: A list of messages that describe the regressions
+    """
+    baseline = {result['scenario']: result for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result['scenario'])
+        if not previous:
+            continue
+        if result['requests_per_sec'] < previous['requests_per_sec'] * (1 - threshold):
+            regressions.append(f"{result['scenario']}: requests/sec fell from {previous['requests_per_sec']} to "
+                               f"{result['requests_per_sec']}")
+        if result['p99_ms'] > previous['p99_ms'] * (1 + threshold):
+            regressions.append(f"{result['scenario']}: p99 latency rose from {previous['p99_ms']}ms to "
+                               f"{result['p99_ms']}ms")
+    return regressions
+
+
+def print_results(results):
+    """This function prints the results of the scenarios as a table.
+
+    :param results: The list of scenario results
+    :type results: list
+    :returns: None
+    """
+    print(f"{'scenario':<26}{'calls':>7}{'requests':>10}{'errors':>8}{'req/s':>11}{'p50 ms':>10}{'p99 ms':>10}"
+          f"{'peak MB':>9}")
+    for result in results:
+        print(f"{result['scenario']:<26}{result['iterations']:>7}{result['requests']:>10}{result['errors']:>8}"
+              f"{result['requests_per_sec']:>11.1f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+              f"{result['peak_rss_mb'] if result['peak_rss_mb'] is not None else '-':>9}")
+
+
+def main():
+    """This function parses the command-line arguments and runs the selected scenarios.
+
+    :returns: The exit code (``1`` when regressions are found)
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the freshpy HTTP layer against a local mock server.')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='The scenario(s) to run (all scenarios are run when not defined)')
+    parser.add_argument('--iterations', type=int, help='The number of measured calls for each scenario')
+    parser.add_argument('--tickets', type=int, default=1000, help='The number of tickets served')
+    parser.add_argument('--agents', type=int, default=250, help='The number of agents served')
+    parser.add_argument('--latency', type=float, default=0.0, help='The seconds the server waits before responding')
+    parser.add_argument('--per-page', type=int, default=30, help='The default page size of the server')
+    parser.add_argument('--rate-limit', type=int, default=100000, help='The requests permitted per minute')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='The fraction of requests that fail')
+    parser.add_argument('--in-process', action='store_true', help='Run every scenario in the current process')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    parser.add_argument('--save', help='The path of a file where the results are saved as JSON')
+    parser.add_argument('--compare', help='The path of a saved baseline to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='The fractional change reported as a regression')
+    args = parser.parse_args()
+
+    server_options = {'ticket_count': args.tickets, 'agent_count': args.agents, 'latency': args.latency,
+                      'default_per_page': args.per_page, 'rate_limit': args.rate_limit, 'error_rate': args.error_rate}
+    passthrough = ['--tickets', str(args.tickets), '--agents', str(args.agents), '--latency', str(args.latency),
+                   '--per-page', str(args.per_page), '--rate-limit', str(args.rate_limit),
+                   '--error-rate', str(args.error_rate)]
+    if args.iterations:
+        passthrough += ['--iterations', str(args.iterations)]
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        if args.in_process:
+            results.append(run_scenario(name, args.iterations, server_options))
+        else:
+            results.append(run_isolated(name, passthrough))
+
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print_results(results)
+    if args.save:
+        with open(args.save, 'w') as results_file:
+            json.dump(results, results_file, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare_results(results, json.load(baseline_file), args.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
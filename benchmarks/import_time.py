@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            benchmarks.import_time
+:Synopsis:          Cold-start benchmark that guards the import time of the freshpy package and its deferred imports
+:Usage:             ``python benchmarks/import_time.py [--runs 20] [--max-ms 50] [--save results.json]``
+:Example:           ``python benchmarks/import_time.py --compare baseline.json``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+
+# Define constants
+DEFAULT_RUNS = 20
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+DEFERRED_MODULES = ('requests', 'urllib3', 'httpx', 'numpy', 'pyarrow', 'opentelemetry')
+SCENARIOS = {
+    'import_freshpy': 'import freshpy',
+    'import_core_object': 'from freshpy import FreshPy',
+    'instantiate_core_object': "from freshpy import FreshPy; FreshPy('example.freshservice.com', 'api-key')",
+}
+MEASURE_SCRIPT = """
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'elapsed': elapsed, 'modules': [name for name in {deferred!r} if name in sys.modules]}}))
+"""
+
+
+def measure_once(statement):
+    """This function executes a statement in a new interpreter and measures how long it takes.
+
+    :param statement: The Python statement to execute (e.g. ``import freshpy``)
+    :type statement: str
+    :returns: A tuple with the elapsed seconds and the list of deferred modules that were imported
+    """
+    script = MEASURE_SCRIPT.format(statement=statement, deferred=DEFERRED_MODULES)
+    completed = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+    result = json.loads(completed.stdout)
+    return result['elapsed'], result['modules']
+
+
+def run_scenario(name, runs=DEFAULT_RUNS):
+    """This function measures a scenario in several new interpreters and returns its results.
+
+    :param name: The name of the scenario
+    :type name: str
+    :param runs: The number of interpreters to start
+    :type runs: int
+    :returns: A dictionary with the results of the scenario
+    """
+    timings, imported = [], set()
+    for _ in range(runs):
+        elapsed, modules = measure_once(SCENARIOS[name])
+        timings.append(elapsed)
+        imported.update(modules)
+    timings.sort()
+    return {
+        'scenario': name,
+        'runs': runs,
+        'median_ms': round(timings[len(timings) // 2] * 1000, 3),
+        'min_ms': round(timings[0] * 1000, 3),
+        'max_ms': round(timings[-1] * 1000, 3),
+        'deferred_imported': sorted(imported),
+    }
+
+
+def check_results(results, max_ms=None, baseline=None, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """This function returns the violations of the import-time budget and the deferred imports.
+
+    :param results: The list of scenario results
+    :type results: list
+    :param max_ms: The maximum median import time in milliseconds (not checked when not defined)
+    :type max_ms: float, None
+    :param baseline: The list of scenario results from a previous run
+    :type baseline: list, None
+    :param threshold: The fractional increase of the median that is reported as a regression
+    :type threshold: float
+    :returns: A list of messages that describe the violations
+    """
+    baseline = {result['scenario']: result for result in baseline or []}
+    violations = []
+    for result in results:
+        if result['deferred_imported']:
+            violations.append(f"{result['scenario']}: imported {', '.join(result['deferred_imported'])}")
+        if max_ms is not None and result['median_ms'] > max_ms:
+            violations.append(f"{result['scenario']}: median of {result['median_ms']}ms exceeds {max_ms}ms")
+        previous = baseline.get(result['scenario'])
+        if previous and result['median_ms'] > previous['median_ms'] * (1 + threshold):
+            violations.append(f"{result['scenario']}: median rose from {previous['median_ms']}ms to "
+                              f"{result['median_ms']}ms")
+    return violations
+
+
+def print_results(results):
+    """This function prints the results of the scenarios as a table.
+
+    :param results: The list of scenario results
+    :type results: list
+    :returns: None
+    """
+    print(f"{'scenario':<26}{'runs':>6}{'median ms':>11}{'min ms':>9}{'max ms':>9}  deferred imports")
+    for result in results:
+        print(f"{result['scenario']:<26}{result['runs']:>6}{result['median_ms']:>11.2f}{result['min_ms']:>9.2f}"
+              f"{result['max_ms']:>9.2f}  {', '.join(result['deferred_imported']) or '-'}")
+
+
+def main():
+    """This function parses the command-line arguments and runs the selected scenarios.
+
+    :returns: The exit code (``1`` when the budget is exceeded or a deferred module is imported)
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the import time of the freshpy package.')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='The scenario(s) to run (all scenarios are run when not defined)')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='The number of interpreters to start')
+    parser.add_argument('--max-ms', type=float, help='The maximum median time in milliseconds for each scenario')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    parser.add_argument('--save', help='The path of a file where the results are saved as JSON')
+    parser.add_argument('--compare', help='The path of a saved baseline to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='The fractional increase reported as a regression')
+    args = parser.parse_args()
+
+    results = [run_scenario(name, args.runs) for name in args.scenario or list(SCENARIOS)]
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print_results(results)
+    if args.save:
+        with open(args.save, 'w') as results_file:
+            json.dump(results, results_file, indent=2)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+    violations = check_results(results, args.max_ms, baseline, args.threshold)
+    for violation in violations:
+        print(f'VIOLATION {violation}')
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            benchmarks.json_decoding
+:Synopsis:          Micro-benchmark comparing the JSON backends available to the freshpy package
+:Usage:             ``python benchmarks/json_decoding.py [--iterations 2000]``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import os
+import json
+import timeit
+import argparse
+
+from freshpy.utils import json_backend
+
+# Define constants
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'examples', 'api_responses')
+DEFAULT_ITERATIONS = 2000
+TICKETS_PER_PAGE = 100
+
+
+def load_example_payloads():
+    """This function loads the example API responses as raw bytes keyed by file name.
+
+    :returns: A dictionary of the raw response bodies
+    """
+    payloads = {}
+    for file_name in sorted(os.listdir(EXAMPLES_DIR)):
+        if file_name.endswith('.json'):
+            with open(os.path.join(EXAMPLES_DIR, file_name), 'rb') as example_file:
+                payloads[file_name] = example_file.read()
+    return payloads
+
+
+def build_ticket_page(per_page=TICKETS_PER_PAGE):
+    """This function builds a page of tickets resembling a response that embeds the ``stats`` and ``requester`` data.
+
+    :param per_page: The number of tickets in the page
+    :type per_page: int
+    :returns: The raw response body
+    """
+    tickets = []
+    for ticket_id in range(1, per_page + 1):
+        tickets.append({
+            'id': ticket_id,
+            'subject': f'Unable to access the VPN from the branch office ({ticket_id})',
+            'description_text': 'The VPN client reports an authentication failure after the latest update. ' * 4,
+            'status': 2 + ticket_id % 4,
+            'priority': 1 + ticket_id % 4,
+            'group_id': 14000000000 + ticket_id % 7,
+            'responder_id': 14000100000 + ticket_id % 25,
+            'requester_id': 14000200000 + ticket_id,
+            'created_at': '2026-09-01T10:00:00Z',
+            'updated_at': '2026-09-02T10:00:00Z',
+            'due_by': '2026-09-04T10:00:00Z',
+            'fr_due_by': '2026-09-02T10:00:00Z',
+            'is_escalated': False,
+            'tags': ['vpn', 'network'],
+            'custom_fields': {'location': 'Branch', 'asset_tag': f'AST-{ticket_id:05d}', 'impacted_users': 3},
+            'stats': {
+                'resolved_at': None,
+                'first_responded_at': '2026-09-01T11:30:00Z',
+                'agent_responded_at': '2026-09-01T11:30:00Z',
+                'status_updated_at': '2026-09-02T10:00:00Z',
+            },
+            'requester': {
+                'id': 14000200000 + ticket_id,
+                'name': 'Jane Example',
+                'email': f'user{ticket_id}@example.com',
+                'mobile': None,
+                'phone': '555-0100',
+            },
+        })
+    return json.dumps({'tickets': tickets}).encode('utf-8')
+
+
+def run_benchmark(iterations=DEFAULT_ITERATIONS):
+    """This function times each available backend against each payload and prints the results.
+
+    :param iterations: The number of times each payload is decoded
+    :type iterations: int
+    :returns: A dictionary of the decoding times in microseconds keyed by payload and backend
+    """
+    payloads = load_example_payloads()
+    payloads[f'tickets_page_{TICKETS_PER_PAGE}.json'] = build_ticket_page()
+    backends = json_backend.get_available_backends()
+    results = {}
+    print(f"{'payload':<36}{'bytes':>9}" + ''.join(f'{backend:>12}' for backend in backends) + f"{'speedup':>10}")
+    for name, payload in payloads.items():
+        timings = {}
+        for backend in backends:
+            decoder = json_backend.get_decoder(backend)
+            timings[backend] = timeit.timeit(lambda: decoder(payload), number=iterations) / iterations * 1e6
+        results[name] = timings
+        speedup = timings['json'] / min(timings.values())
+        print(f'{name:<36}{len(payload):>9}' + ''.join(f'{timings[backend]:>10.2f}us' for backend in backends) +
+              f'{speedup:>9.2f}x')
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the JSON backends available to the freshpy package.')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help='The number of times each payload is decoded')
+    run_benchmark(parser.parse_args().iterations)
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            benchmarks.mock_server
+:Synopsis:          Local stand-in for the Freshservice API that serves synthetic tickets and agents for benchmarks
+:Usage:             ``python benchmarks/mock_server.py [--port 8080] [--latency 0.02] [--error-rate 0.01]``
+:Example:           ``with MockFreshservice(latency=0.01) as server: FreshPy(server.url, 'key')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Define constants
+DEFAULT_TICKET_COUNT = 1000
+DEFAULT_AGENT_COUNT = 250
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+DEFAULT_RATE_LIMIT = 100000
+RATE_LIMIT_WINDOW = 60
+ERROR_STATUSES = (429, 502, 503, 504)
+API_PREFIX = '/api/v2/'
+
+
+class MockFreshservice(object):
+    """This class runs a threaded HTTP server that mimics the Freshservice endpoints used by the package.
+
+    .. note:: The server supports ticket and agent lookups, paginated lists with ``Link`` headers, agent lookups by
+              email address, the rate limit headers and randomly injected error responses.
+    """
+    def __init__(self, host='127.0.0.1', port=0, ticket_count=DEFAULT_TICKET_COUNT, agent_count=DEFAULT_AGENT_COUNT,
+                 latency=0.0, default_per_page=DEFAULT_PER_PAGE, max_per_page=MAX_PER_PAGE,
+                 rate_limit=DEFAULT_RATE_LIMIT, error_rate=0.0, error_statuses=ERROR_STATUSES, seed=0):
+        """This method instantiates the mock server without starting it.
+
+        :param host: The host address on which to listen
+        :type host: str
+        :param port: The port on which to listen (a free port is selected when ``0``)
+        :type port: int
+        :param ticket_count: The number of synthetic tickets to serve
+        :type ticket_count: int
+        :param agent_count: The number of synthetic agents to serve
+        :type agent_count: int
+        :param latency: The number of seconds to wait before sending each response
+        :type latency: int, float
+        :param default_per_page: The page size used when the ``per_page`` parameter is not supplied
+        :type default_per_page: int
+        :param max_per_page: The largest page size that is honored
+        :type max_per_page: int
+        :param rate_limit: The number of requests permitted per minute (reported in the rate limit headers)
+        :type rate_limit: int
+        :param error_rate: The fraction of requests (between ``0`` and ``1``) that receive an error response
+        :type error_rate: float
+        :param error_statuses: The status codes from which injected errors are chosen (the statuses retried by the
+                               default :py:class:`freshpy.utils.retry.RetryPolicy` are used when not defined)
+        :type error_statuses: tuple, list
+        :param seed: The seed for the random number generator used to inject errors
+        :type seed: int
+        """
+        self.ticket_count = ticket_count
+        self.agent_count = agent_count
+        self.latency = latency
+        self.default_per_page = default_per_page
+        self.max_per_page = max_per_page
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.request_count = 0
+        self.error_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._tickets = [build_ticket(ticket_id, agent_count) for ticket_id in range(1, ticket_count + 1)]
+        self._agents = [build_agent(agent_number) for agent_number in range(agent_count)]
+        self._agents_by_email = {agent['email']: agent for agent in self._agents}
+        self._server = ThreadingHTTPServer((host, port), _create_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        """This property returns the base URL of the server, which can be supplied as the domain of the core object.
+
+        :returns: The base URL (e.g. ``http://127.0.0.1:54321``)
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        """This method starts the server when entering a ``with`` block."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """This method stops the server when exiting a ``with`` block."""
+        self.stop()
+
+    def start(self):
+        """This method starts serving requests in a background thread.
+
+        :returns: The :py:class:`benchmarks.mock_server.MockFreshservice` object
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """This method stops the server and closes its socket.
+
+        :returns: None
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counters(self):
+        """This method resets the request and error counters.
+
+        :returns: None
+        """
+        with self._lock:
+            self.request_count = 0
+            self.error_count = 0
+
+    def get_ticket_id(self, index):
+        """This method returns the ID of a ticket served by the mock server.
+
+        :param index: Any integer, which wraps around the number of tickets
+        :type index: int
+        :returns: The ticket ID
+        """
+        return self._tickets[index % self.ticket_count]['id']
+
+    def get_agent_email(self, index):
+        """This method returns the email address of an agent served by the mock server.
+
+        :param index: Any integer, which wraps around the number of agents
+        :type index: int
+        :returns: The email address
+        """
+        return self._agents[index % self.agent_count]['email']
+
+    def handle(self, path, query):
+        """This method determines the response for a request.
+
+        :param path: The path of the request relative to the API prefix (e.g. ``tickets/1``)
+        :type path: str
+        :param query: The parsed query string
+        :type query: dict
+        :returns: A tuple with the status code, the JSON body and a dictionary of additional headers
+        """
+        with self._lock:
+            self.request_count += 1
+            now = time.monotonic()
+            if now - self._window_start >= RATE_LIMIT_WINDOW:
+                self._window_start, self._window_count = now, 0
+            self._window_count += 1
+            headers = {
+                'X-RateLimit-Total': str(self.rate_limit),
+                'X-RateLimit-Remaining': str(max(self.rate_limit - self._window_count, 0)),
+                'X-RateLimit-Used-CurrentRequest': '1',
+            }
+            inject_error = self.error_rate and self._random.random() < self.error_rate
+            if inject_error or self._window_count > self.rate_limit:
+                self.error_count += 1
+                status = 429 if not inject_error else self._random.choice(self.error_statuses)
+                headers['Retry-After'] = '0' if inject_error else str(int(RATE_LIMIT_WINDOW - now +
+                                                                          self._window_start) + 1)
+                return status, {'code': 'injected_error' if inject_error else 'rate_limited'}, headers
+        match = re.fullmatch(r'(tickets|agents)/(\d+)', path)
+        if match:
+            return self._get_item(match.group(1), int(match.group(2)), headers)
+        if path in ('tickets', 'agents'):
+            if path == 'agents' and 'email' in query:
+                agent = self._agents_by_email.get(query['email'][0])
+                return 200, {'agents': [agent] if agent else []}, headers
+            return self._get_page(path, query, headers)
+        return 404, {'code': 'not_found', 'message': f'The {path} endpoint is not supported'}, headers
+
+    def _get_item(self, _collection, _item_id, _headers):
+        """This method returns the response for a single ticket or agent.
+
+        :param _collection: The collection name (``tickets`` or ``agents``)
+        :type _collection: str
+        :param _item_id: The ID of the ticket or agent
+        :type _item_id: int
+        :param _headers: The headers to include in the response
+        :type _headers: dict
+        :returns: A tuple with the status code, the JSON body and the headers
+        """
+        _items = self._tickets if _collection == 'tickets' else self._agents
+        _index = _item_id - _items[0]['id'] if _items else -1
+        if not 0 <= _index < len(_items):
+            return 404, {'code': 'access_denied', 'message': 'You are not authorized to perform this action.'}, \
+                _headers
+        return 200, {_collection[:-1]: _items[_index]}, _headers
+
+    def _get_page(self, _collection, _query, _headers):
+        """This method returns a page of tickets or agents along with the ``Link`` header for the next page.
+
+        :param _collection: The collection name (``tickets`` or ``agents``)
+        :type _collection: str
+        :param _query: The parsed query string
+        :type _query: dict
+        :param _headers: The headers to include in the response
+        :type _headers: dict
+        :returns: A tuple with the status code, the JSON body and the headers
+        """
+        _items = self._tickets if _collection == 'tickets' else self._agents
+        _per_page = min(int(_query.get('per_page', [self.default_per_page])[0]), self.max_per_page)
+        _page = int(_query.get('page', ['1'])[0])
+        _page_items = _items[(_page - 1) * _per_page:_page * _per_page]
+        if _page * _per_page < len(_items):
+            _headers['Link'] = f'<{self.url}{API_PREFIX}{_collection}?per_page={_per_page}&page={_page + 1}>; ' \
+                               f'rel="next"'
+        return 200, {_collection: _page_items}, _headers
+
+
+def build_ticket(ticket_id, agent_count=DEFAULT_AGENT_COUNT):
+    """This function builds a synthetic ticket resembling the data returned by the API.
+
+    :param ticket_id: The ticket ID
+    :type ticket_id: int
+    :param agent_count: The number of agents to which tickets are assigned
+    :type agent_count: int
+    :returns: The JSON object for the ticket
+    """
+    day = 1 + ticket_id % 28
+    return {
+        'id': ticket_id,
+        'subject': f'Unable to access the VPN from the branch office ({ticket_id})',
+        'description_text': 'The VPN client reports an authentication failure after the latest update.',
+        'type': 'Incident',
+        'status': 2 + ticket_id % 4,
+        'priority': 1 + ticket_id % 4,
+        'source': 2,
+        'urgency': 1 + ticket_id % 3,
+        'impact': 1 + ticket_id % 3,
+        'group_id': 14000000000 + ticket_id % 12,
+        'responder_id': 14000100000 + ticket_id % max(agent_count, 1),
+        'requester_id': 14000200000 + ticket_id,
+        'department_id': 14000300000 + ticket_id % 8,
+        'workspace_id': 2,
+        'created_at': f'2026-09-{day:02d}T10:00:00Z',
+        'updated_at': f'2026-09-{day:02d}T14:30:00Z',
+        'due_by': f'2026-09-{day:02d}T18:00:00Z',
+        'fr_due_by': f'2026-09-{day:02d}T12:00:00Z',
+        'is_escalated': ticket_id % 10 == 0,
+        'tags': ['vpn', 'network'],
+        'cc_emails': [],
+        'custom_fields': {'location': 'Branch', 'asset_tag': f'AST-{ticket_id:05d}'},
+    }
+
+
+def build_agent(agent_number):
+    """This function builds a synthetic agent resembling the data returned by the API.
+
+    :param agent_number: The sequential number of the agent
+    :type agent_number: int
+    :returns: The JSON object for the agent
+    """
+    return {
+        'id': 14000100000 + agent_number,
+        'first_name': 'Agent',
+        'last_name': f'{agent_number:04d}',
+        'email': f'agent{agent_number:04d}@example.com',
+        'active': agent_number % 20 != 0,
+        'occasional': False,
+        'job_title': 'Service Desk Analyst',
+        'department_ids': [14000300000 + agent_number % 8],
+        'member_of': [14000000000 + agent_number % 12],
+        'time_zone': 'Eastern Time (US & Canada)',
+        'language': 'en',
+        'created_at': '2026-01-05T09:00:00Z',
+        'updated_at': '2026-09-01T09:00:00Z',
+    }
+
+
+def _create_handler(_server):
+    """This function creates the request handler class bound to a mock server.
+
+    :param _server: The mock server that determines the responses
+    :type _server: class[benchmarks.mock_server.MockFreshservice]
+    :returns: The request handler class
+    """
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            """This method suppresses the default request logging."""
+
+        def do_GET(self):
+            """This method handles a GET request."""
+            _parsed_url = urlparse(self.path)
+            _path = _parsed_url.path[len(API_PREFIX):] if _parsed_url.path.startswith(API_PREFIX) else \
+                _parsed_url.path.lstrip('/')
+            _status, _body, _headers = _server.handle(_path, parse_qs(_parsed_url.query))
+            if _server.latency:
+                time.sleep(_server.latency)
+            _content = json.dumps(_body).encode('utf-8')
+            self.send_response(_status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(_content)))
+            for _name, _value in _headers.items():
+                self.send_header(_name, _value)
+            self.end_headers()
+            self.wfile.write(_content)
+
+    return _Handler
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run a local stand-in for the Freshservice API.')
+    parser.add_argument('--host', default='127.0.0.1', help='The host address on which to listen')
+    parser.add_argument('--port', type=int, default=8080, help='The port on which to listen')
+    parser.add_argument('--tickets', type=int, default=DEFAULT_TICKET_COUNT, help='The number of tickets to serve')
+    parser.add_argument('--agents', type=int, default=DEFAULT_AGENT_COUNT, help='The number of agents to serve')
+    parser.add_argument('--latency', type=float, default=0.0, help='The seconds to wait before each response')
+    parser.add_argument('--per-page', type=int, default=DEFAULT_PER_PAGE, help='The default page size')
+    parser.add_argument('--rate-limit', type=int, default=DEFAULT_RATE_LIMIT, help='The requests permitted per minute')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='The fraction of requests that fail')
+    args = parser.parse_args()
+    mock_server = MockFreshservice(args.host, args.port, args.tickets, args.agents, args.latency, args.per_page,
+                                   rate_limit=args.rate_limit, error_rate=args.error_rate)
+    mock_server.start()
+    print(f'Serving the mock Freshservice API at {mock_server.url} (press Ctrl+C to stop)')
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        mock_server.stop()
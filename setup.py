@@ -64,7 +64,6 @@ setuptools.setup(
         "Natural Language :: English",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -75,13 +74,29 @@ setuptools.setup(
         "Topic :: Office/Business",
         "Topic :: Software Development :: Libraries :: Python Modules"
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     install_requires=[
         "urllib3>=1.26.7",
         "requests>=2.23.0",
         "setuptools>=52.0.0"
     ],
     extras_require={
+        'async': [
+            'httpx>=0.23.0'
+        ],
+        'json': [
+            'orjson>=3.6.0'
+        ],
+        'brotli': [
+            'brotli>=1.0.9'
+        ],
+        'columnar': [
+            'numpy>=1.21.0',
+            'pyarrow>=8.0.0'
+        ],
+        'tracing': [
+            'opentelemetry-api>=1.20.0'
+        ],
         'sphinx': [
             'Sphinx>=3.4.0',
             'sphinxcontrib-applehelp>=1.0.2',
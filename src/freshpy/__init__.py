@@ -4,13 +4,51 @@
 :Synopsis:          This is the ``__init__`` module for the freshpy package
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     29 Jan 2025
+:Modified Date:     18 Oct 2026
 """
 
-from .core import FreshPy
+import importlib
+
 from .utils import version
 
-__all__ = ['core', 'FreshPy', 'api', 'agents', 'tickets']
+__all__ = ['core', 'FreshPy', 'async_core', 'AsyncFreshPy', 'api', 'async_api', 'agents', 'analytics',
+           'filters', 'records', 'store', 'sync', 'tickets']
+
+# Define the classes that are imported from their modules the first time they are accessed
+_LAZY_CLASSES = {'FreshPy': 'core', 'AsyncFreshPy': 'async_core'}
 
 # Define the package version by pulling from the freshpy.utils.version module
 __version__ = version.get_full_version()
+
+
+def __getattr__(name):
+    """This function imports the core objects and modules of the package the first time they are accessed.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Deferring these imports keeps ``import freshpy`` fast for short-lived processes, as the
+              :py:mod:`requests` package and the optional packages are only imported when they are needed.
+
+    :param name: The name of the attribute (e.g. ``FreshPy``)
+    :type name: str
+    :returns: The class or module
+    :raises: :py:exc:`AttributeError`
+    """
+    if name in _LAZY_CLASSES:
+        value = getattr(importlib.import_module(f'.{_LAZY_CLASSES[name]}', __name__), name)
+    elif name in __all__:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """This function lists the attributes of the package including those that have not been imported yet.
+
+    .. versionadded:: 2.1.0
+
+    :returns: The sorted list of attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
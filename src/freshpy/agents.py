@@ -4,19 +4,30 @@
 :Synopsis:          Functions for interacting with Freshservice agents
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     29 Jan 2025
+:Modified Date:     18 Oct 2026
 """
 
-from . import api, errors
+import time
+import threading
+
+from . import api, errors, records
 from .utils import core_utils, log_utils
 
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
 
+# Define constants
+DEFAULT_DIRECTORY_REFRESH_INTERVAL = 3600
+AGENT_GROUP_FIELDS = ['member_of', 'group_ids']
+
 
-def get_user_info(freshpy_object, lookup_value, verify_ssl=True):
+def get_user_info(freshpy_object, lookup_value, verify_ssl=True, as_records=False):
     """This function retrieves user data for a specific agent.
 
+    .. versionchanged:: 2.1.0
+       The user is now resolved through the agent directory of the core object when one has been built, and the
+       ``as_records`` parameter was introduced.
+
     .. versionadded:: 2.0.0
 
     :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
@@ -25,23 +36,71 @@ def get_user_info(freshpy_object, lookup_value, verify_ssl=True):
     :tyype lookup_value: str, int
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
-    :returns: JSON data with the agent user data
+    :param as_records: Determines if compact :py:class:`freshpy.records.Agent` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: JSON data (or a record) with the agent user data
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
              :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
     """
+    # Resolve the user through the agent directory when available
+    agent_directory = getattr(freshpy_object, 'agent_directory', None)
+    if agent_directory is not None:
+        agent_data = agent_directory.lookup(lookup_value)
+        if agent_data is not None:
+            return records.to_records(agent_data, records.Agent) if as_records else agent_data
+
     # Identify the lookup value and retrieve the data
-    if isinstance(lookup_value, str) and '@' in lookup_value:
-        agent_data = _get_user_info_by_email(freshpy_object, lookup_value, verify_ssl)
-        agent_data = agent_data['agents'][0]
-    elif isinstance(lookup_value, int) or (isinstance(lookup_value, str) and lookup_value.isdigit()):
-        uri = f'agents/{lookup_value}'
-        agent_data = api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
-        agent_data = agent_data['agent'] if 'agent' in agent_data else agent_data
-    else:
-        raise errors.exceptions.InvalidFieldError('An invalid Agent ID or email address was provided.')
+    uri = _get_user_info_uri(lookup_value)
+    agent_data = _parse_user_info(api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl))
+    if agent_directory is not None:
+        agent_directory.add(agent_data)
 
     # Return the agent user data
-    return agent_data
+    return records.to_records(agent_data, records.Agent) if as_records else agent_data
+
+
+def _get_user_info_uri(_lookup_value):
+    """This function constructs the URI used to retrieve user data for a specific agent.
+
+    .. versionadded:: 2.1.0
+
+    :param _lookup_value: An Agent ID or email address with which to look up the user
+    :type _lookup_value: str, int
+    :returns: The constructed URI
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+    """
+    if isinstance(_lookup_value, str) and '@' in _lookup_value:
+        return _get_email_lookup_uri(_lookup_value)
+    elif _is_agent_id(_lookup_value):
+        return f'agents/{_lookup_value}'
+    raise errors.exceptions.InvalidFieldError('An invalid Agent ID or email address was provided.')
+
+
+def _parse_user_info(_agent_data):
+    """This function extracts the agent user data from the JSON response of a lookup by Agent ID or email address.
+
+    .. versionadded:: 2.1.0
+
+    :param _agent_data: The JSON data returned by the API
+    :type _agent_data: dict
+    :returns: JSON data with the agent user data
+    """
+    if 'agents' in _agent_data:
+        return _agent_data['agents'][0]
+    return _agent_data['agent'] if 'agent' in _agent_data else _agent_data
+
+
+def _is_agent_id(_lookup_value):
+    """This function determines if a lookup value is a numeric Agent ID.
+
+    .. versionadded:: 2.1.0
+
+    :param _lookup_value: The lookup value to evaluate
+    :type _lookup_value: str, int
+    :returns: Boolean value indicating if the lookup value is an Agent ID
+    """
+    return isinstance(_lookup_value, int) or (isinstance(_lookup_value, str) and _lookup_value.isdigit())
 
 
 def _get_user_info_by_email(_freshpy_object, _email, _verify_ssl=True):
@@ -59,18 +118,33 @@ def _get_user_info_by_email(_freshpy_object, _email, _verify_ssl=True):
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
              :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
     """
+    # Retrieve the agent data based on the email address
+    _uri = _get_email_lookup_uri(_email)
+    return api.get_request_with_retries(_freshpy_object, _uri, verify_ssl=_verify_ssl)
+
+
+def _get_email_lookup_uri(_email):
+    """This function constructs the URI used to query agents by email address.
+
+    .. versionadded:: 2.1.0
+
+    :param _email: The email address to be used in the query filter
+    :type _email: str
+    :returns: The constructed URI
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+    """
     # Validate the provided email address
     if not isinstance(_email, str) or '@' not in _email:
         raise errors.exceptions.InvalidFieldError('An invalid email address was provided.')
-
-    # Retrieve the agent data based on the email address
-    _uri = f'agents?email={core_utils.url_encode(_email)}'
-    return api.get_request_with_retries(_freshpy_object, _uri, verify_ssl=_verify_ssl)
+    return f'agents?email={core_utils.url_encode(_email)}'
 
 
-def get_all_agents(freshpy_object, only_active=None, only_inactive=None, verify_ssl=True):
+def get_all_agents(freshpy_object, only_active=None, only_inactive=None, verify_ssl=True, as_records=False):
     """This function returns data for all agents with an optional filters for active or inactive users.
 
+    .. versionchanged:: 2.1.0
+       Added the ``as_records`` parameter.
+
     .. versionadded:: 2.0.0
 
     :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
@@ -81,28 +155,87 @@ def get_all_agents(freshpy_object, only_active=None, only_inactive=None, verify_
     :type only_inactive: bool, None
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
-    :returns: JSON data with user data for all agents
+    :param as_records: Determines if compact :py:class:`freshpy.records.Agent` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: JSON data (or a list of records) with user data for all agents
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
     """
-    # Define the filter string if necessary
-    filter_string = ''
-    if only_active is not None or only_inactive is not None:
-        if only_active is True and only_inactive is True:
-            exc_msg = 'You cannot use both the only_active and only_inactive filters in the same call.'
-            raise errors.exceptions.InvalidFilterError(exc_msg)
-        elif only_active is True:
-            filter_string = '?active=true'
-        elif only_inactive is True:
-            filter_string = '?active=false'
-
     # Construct the URI and perform the API call
-    uri = 'agents' + filter_string
-    return api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    uri = 'agents' + _get_active_filter_string(only_active, only_inactive)
+    agent_data = api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    return records.to_records(agent_data, records.Agent) if as_records else agent_data
+
+
+def iter_agents(freshpy_object, only_active=None, only_inactive=None, per_page=api.MAX_PER_PAGE, prefetch=False,
+                verify_ssl=True, stream=False, as_records=False):
+    """This function returns a generator that yields agents one at a time while automatically paginating.
+
+    .. versionadded:: 2.1.0
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param only_active: Filters for only active agents when ``True``
+    :type only_active: bool, None
+    :param only_inactive: Filters for only inactive agents when ``True``
+    :type only_inactive: bool, None
+    :param per_page: The number of results to request per page (``100`` by default)
+    :type per_page: str, int
+    :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+    :type prefetch: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param stream: Determines if each page should be decoded incrementally as it is downloaded, which lowers the
+                   peak memory usage for large pages but disables ``prefetch`` (``False`` by default)
+    :type stream: bool
+    :param as_records: Determines if compact :py:class:`freshpy.records.Agent` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: A generator that yields the JSON object (or record) for each agent
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+             :py:exc:`freshpy.errors.exceptions.InvalidFilterError`
+    """
+    uri = 'agents' + _get_active_filter_string(only_active, only_inactive)
+    if stream:
+        agent_data = api.iterate_records(freshpy_object, uri, 'agents', per_page=per_page, verify_ssl=verify_ssl)
+    else:
+        agent_data = (agent for page_records in api.iterate_pages(freshpy_object, uri, 'agents', per_page=per_page,
+                                                                  prefetch=prefetch, verify_ssl=verify_ssl)
+                      for agent in page_records)
+    yield from records.iter_records(agent_data, records.Agent) if as_records else agent_data
+
+
+def _get_active_filter_string(_only_active=None, _only_inactive=None):
+    """This function defines the query string used to filter agents by their active status.
+
+    .. versionadded:: 2.1.0
+
+    :param _only_active: Filters for only active agents when ``True``
+    :type _only_active: bool, None
+    :param _only_inactive: Filters for only inactive agents when ``True``
+    :type _only_inactive: bool, None
+    :returns: The filter query string (which is empty when no filter is required)
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidFilterError`
+    """
+    _filter_string = ''
+    if _only_active is not None or _only_inactive is not None:
+        if _only_active is True and _only_inactive is True:
+            _exc_msg = 'You cannot use both the only_active and only_inactive filters in the same call.'
+            raise errors.exceptions.InvalidFilterError(_exc_msg)
+        elif _only_active is True:
+            _filter_string = '?active=true'
+        elif _only_inactive is True:
+            _filter_string = '?active=false'
+    return _filter_string
 
 
 def get_agent_id(freshpy_object, email, verify_ssl=True):
     """This function retrieves the Agent ID value for a specific agent.
 
+    .. versionchanged:: 2.1.0
+       The agent is now resolved through the agent directory of the core object when one has been built.
+
     .. versionadded:: 2.0.0
 
     :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
@@ -116,19 +249,43 @@ def get_agent_id(freshpy_object, email, verify_ssl=True):
              :py:exc:`freshpy.errors.exceptions.NotFoundResponseError`,
              :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
     """
+    # Resolve the agent through the agent directory when available
+    agent_directory = getattr(freshpy_object, 'agent_directory', None)
+    if agent_directory is not None:
+        agent_data = agent_directory.lookup(email)
+        if agent_data is not None:
+            return agent_data['id']
+
     # Retrieve the agent data based on the email address
     agent_data = _get_user_info_by_email(freshpy_object, email, verify_ssl)
 
+    # Parse the retrieved data to obtain and return the agent ID
+    agent_id = _parse_agent_id(agent_data)
+    if agent_directory is not None:
+        agent_directory.add(agent_data['agents'][0])
+    return agent_id
+
+
+def _parse_agent_id(_agent_data):
+    """This function extracts the Agent ID from the JSON response of a lookup by email address.
+
+    .. versionadded:: 2.1.0
+
+    :param _agent_data: The JSON data returned by the API
+    :type _agent_data: dict
+    :returns: The Agent ID of the agent as an integer
+    :raises: :py:exc:`freshpy.errors.exceptions.NotFoundResponseError`
+    """
     # Raise an exception if no data was found for the user (API response was 404)
-    if 'status_code' in agent_data and agent_data['status_code'] == 404:
+    if 'status_code' in _agent_data and _agent_data['status_code'] == 404:
         raise errors.exceptions.NotFoundResponseError('An agent ID was not found for the provided email address.')
 
     # Parse the retrieved data to obtain and return the agent ID
     try:
-        agent_data = agent_data['agents'][0]['id']
+        _agent_data = _agent_data['agents'][0]['id']
     except IndexError:
         raise errors.exceptions.NotFoundResponseError('An agent ID was not found for the provided email address.')
-    return agent_data
+    return _agent_data
 
 
 def get_assignment_history(freshpy_object, lookup_value, verify_ssl=True):
@@ -148,7 +305,7 @@ def get_assignment_history(freshpy_object, lookup_value, verify_ssl=True):
              :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
     """
     # Identify the agent ID for the user
-    if isinstance(lookup_value, int) or (isinstance(lookup_value, str) and lookup_value.isdigit()):
+    if _is_agent_id(lookup_value):
         agent_id = lookup_value
     elif isinstance(lookup_value, str) and '@' in lookup_value:
         agent_id = get_agent_id(freshpy_object, lookup_value, verify_ssl)
@@ -156,5 +313,252 @@ def get_assignment_history(freshpy_object, lookup_value, verify_ssl=True):
         raise errors.exceptions.InvalidFieldError('An invalid Agent ID or email address was provided.')
 
     # Construct the URI and perform the API call
-    uri = f'users/{agent_id}/assignment-history'
+    uri = _get_assignment_history_uri(agent_id)
     return api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+
+
+def _get_assignment_history_uri(_agent_id):
+    """This function constructs the URI used to retrieve the user assignment history for a specific agent.
+
+    .. versionadded:: 2.1.0
+
+    :param _agent_id: The Agent ID of the agent
+    :type _agent_id: str, int
+    :returns: The constructed URI
+    """
+    return f'users/{_agent_id}/assignment-history'
+
+
+class AgentDirectory(object):
+    """This class indexes all agents by ID, email address and group so that lookups can avoid API calls.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The directory is fully refreshed when it becomes older than its refresh interval, and agents that are
+              missing from the directory are added individually as they are retrieved from the API. Only one thread
+              performs a stale refresh while the other threads continue to be served by the existing indexes, and
+              agents added during a refresh are retained when the new indexes are swapped in.
+    """
+    def __init__(self, freshpy_object, refresh_interval=DEFAULT_DIRECTORY_REFRESH_INTERVAL, only_active=None,
+                 verify_ssl=True, load=True):
+        """This method instantiates the :py:class:`freshpy.agents.AgentDirectory` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+        :type freshpy_object: class[freshpy.FreshPy]
+        :param refresh_interval: The number of seconds after which the directory is refreshed (or ``None`` to
+                                 only refresh on demand)
+        :type refresh_interval: int, float, None
+        :param only_active: Filters for only active agents when ``True``
+        :type only_active: bool, None
+        :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+        :type verify_ssl: bool
+        :param load: Determines if the directory should be populated immediately (``True`` by default)
+        :type load: bool
+        """
+        self.freshpy_object = freshpy_object
+        self.refresh_interval = refresh_interval
+        self.only_active = only_active
+        self.verify_ssl = verify_ssl
+        self.last_refresh = None
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._by_id, self._by_email, self._by_group = {}, {}, {}
+        self._added_during_refresh = None
+        if load:
+            self.refresh()
+
+    def __len__(self):
+        """This method returns the number of agents in the directory.
+
+        .. versionadded:: 2.1.0
+        """
+        return len(self._by_id)
+
+    def __contains__(self, lookup_value):
+        """This method determines if an Agent ID or email address exists in the directory.
+
+        .. versionadded:: 2.1.0
+        """
+        return self._get_indexed(lookup_value) is not None
+
+    def refresh(self):
+        """This method retrieves all agents from the API and rebuilds the indexes.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: Refreshes are serialized, so a call made while another thread is refreshing the directory waits for
+                  that refresh to complete before performing its own.
+
+        :returns: The number of agents in the directory as an integer
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.GETRequestError`
+        """
+        with self._refresh_lock:
+            return self._rebuild_indexes()
+
+    def is_stale(self):
+        """This method determines if the directory is older than its refresh interval.
+
+        .. versionadded:: 2.1.0
+
+        :returns: Boolean value indicating if the directory should be refreshed
+        """
+        if self.last_refresh is None:
+            return True
+        if not self.refresh_interval:
+            return False
+        return (time.monotonic() - self.last_refresh) > self.refresh_interval
+
+    def add(self, agent):
+        """This method adds or updates a single agent in the directory.
+
+        .. versionadded:: 2.1.0
+
+        :param agent: The JSON data for the agent
+        :type agent: dict
+        :returns: None
+        """
+        if isinstance(agent, dict) and 'id' in agent:
+            with self._lock:
+                self._remove_agent(agent['id'])
+                self._index_agent(agent, self._by_id, self._by_email, self._by_group)
+                if self._added_during_refresh is not None:
+                    self._added_during_refresh[agent['id']] = agent
+
+    def lookup(self, lookup_value):
+        """This method returns the data for an agent using an Agent ID or email address without calling the API.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: The directory is refreshed first if it has become stale, unless another thread is already
+                  refreshing it, in which case the existing indexes are used.
+
+        :param lookup_value: An Agent ID or email address with which to look up the agent
+        :type lookup_value: str, int
+        :returns: The JSON data for the agent or ``None`` if the agent is not in the directory
+        """
+        self._refresh_if_stale()
+        return self._get_indexed(lookup_value)
+
+    def get_group_members(self, group_id):
+        """This method returns the agents that are members of a specific group.
+
+        .. versionadded:: 2.1.0
+
+        :param group_id: The numeric ID of the group
+        :type group_id: str, int
+        :returns: A list of JSON data for the agents in the group
+        """
+        self._refresh_if_stale()
+        with self._lock:
+            return [self._by_id[agent_id] for agent_id in sorted(self._by_group.get(int(group_id), ()))]
+
+    def _refresh_if_stale(self):
+        """This method refreshes the directory when it is stale and no other thread is already refreshing it.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: A thread only waits for a refresh in progress when the directory has never been populated, as there
+                  are no indexes to serve in the meantime.
+
+        :returns: None
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.GETRequestError`
+        """
+        if not self.is_stale() or not self._refresh_lock.acquire(blocking=self.last_refresh is None):
+            return
+        try:
+            # Another thread may have completed the refresh while this thread was waiting
+            if self.is_stale():
+                self._rebuild_indexes()
+        finally:
+            self._refresh_lock.release()
+
+    def _rebuild_indexes(self):
+        """This method retrieves all agents from the API and swaps in the new indexes.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: This method must be called while holding the refresh lock.
+
+        :returns: The number of agents in the directory as an integer
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.GETRequestError`
+        """
+        with self._lock:
+            self._added_during_refresh = {}
+        _by_id, _by_email, _by_group = {}, {}, {}
+        try:
+            for _agent in iter_agents(self.freshpy_object, only_active=self.only_active, prefetch=True,
+                                      verify_ssl=self.verify_ssl):
+                self._index_agent(_agent, _by_id, _by_email, _by_group)
+            with self._lock:
+                self._by_id, self._by_email, self._by_group = _by_id, _by_email, _by_group
+                for _agent in self._added_during_refresh.values():
+                    self._remove_agent(_agent['id'])
+                    self._index_agent(_agent, self._by_id, self._by_email, self._by_group)
+                self.last_refresh = time.monotonic()
+                _agent_count = len(self._by_id)
+        finally:
+            with self._lock:
+                self._added_during_refresh = None
+        logger.debug(f'The agent directory was refreshed with {_agent_count} agents')
+        return _agent_count
+
+    def _get_indexed(self, _lookup_value):
+        """This method returns the indexed data for an Agent ID or email address.
+
+        .. versionadded:: 2.1.0
+
+        :param _lookup_value: An Agent ID or email address with which to look up the agent
+        :type _lookup_value: str, int
+        :returns: The JSON data for the agent or ``None`` if the agent is not in the directory
+        """
+        with self._lock:
+            if _is_agent_id(_lookup_value):
+                return self._by_id.get(int(_lookup_value))
+            if isinstance(_lookup_value, str):
+                return self._by_email.get(_lookup_value.lower())
+        return None
+
+    def _remove_agent(self, _agent_id):
+        """This method removes an agent from every index.
+
+        .. versionadded:: 2.1.0
+
+        :param _agent_id: The Agent ID of the agent to remove
+        :type _agent_id: int
+        :returns: None
+        """
+        _agent = self._by_id.pop(_agent_id, None)
+        if _agent is None:
+            return
+        if _agent.get('email'):
+            self._by_email.pop(_agent['email'].lower(), None)
+        for _members in self._by_group.values():
+            _members.discard(_agent_id)
+
+    @staticmethod
+    def _index_agent(_agent, _by_id, _by_email, _by_group):
+        """This method adds an agent to the supplied indexes.
+
+        .. versionadded:: 2.1.0
+
+        :param _agent: The JSON data for the agent
+        :type _agent: dict
+        :param _by_id: The index of agents keyed by Agent ID
+        :type _by_id: dict
+        :param _by_email: The index of agents keyed by lowercase email address
+        :type _by_email: dict
+        :param _by_group: The index of Agent IDs keyed by group ID
+        :type _by_group: dict
+        :returns: None
+        """
+        _by_id[_agent['id']] = _agent
+        if _agent.get('email'):
+            _by_email[_agent['email'].lower()] = _agent
+        for _field in AGENT_GROUP_FIELDS:
+            for _group_id in _agent.get(_field) or ():
+                _by_group.setdefault(_group_id, set()).add(_agent['id'])
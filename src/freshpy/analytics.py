@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.analytics
+:Synopsis:          Vectorized SLA and due date analytics for tickets using NumPy
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from datetime import datetime, timezone
+
+from . import errors, records
+from .utils import columnar
+
+# Import the optional NumPy package
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Define constants
+SLA_COLUMNS = {
+    'id': 'int',
+    'status': 'int',
+    'priority': 'int',
+    'impact': 'int',
+    'urgency': 'int',
+    'group_id': 'int',
+    'responder_id': 'int',
+    'created_at': 'timestamp',
+    'due_by': 'timestamp',
+    'fr_due_by': 'timestamp',
+    'stats.first_responded_at': 'timestamp',
+    'stats.resolved_at': 'timestamp',
+    'stats.closed_at': 'timestamp',
+}
+GROUP_BY_FIELDS = {
+    'agent_id': 'responder_id',
+    'responder_id': 'responder_id',
+    'group_id': 'group_id',
+    'priority': 'priority',
+    'status': 'status',
+    'impact': 'impact',
+    'urgency': 'urgency',
+}
+DURATION_METRICS = ['first_response_hours', 'resolution_hours']
+DEFAULT_PERCENTILES = (50, 90, 95)
+
+
+def get_sla_arrays(ticket_data):
+    """This function parses the SLA-related fields of tickets into NumPy arrays in a single pass.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The ``stats`` fields are only returned by the API when tickets are retrieved with the
+              ``include='stats'`` embedding option. Missing timestamps are represented as ``NaT``.
+
+    :param ticket_data: The tickets as a list (or generator) of JSON objects or :py:class:`freshpy.records.Ticket`
+                        records, a response containing a list (e.g. ``{'tickets': [...]}``) or a dictionary of arrays
+                        returned by :py:func:`freshpy.tickets.export_columnar` in the ``numpy`` format
+    :type ticket_data: dict, list, tuple, generator
+    :returns: A dictionary of :py:class:`numpy.ndarray` objects keyed by the columns in
+              :py:data:`freshpy.analytics.SLA_COLUMNS`
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    _require_numpy()
+    if isinstance(ticket_data, dict):
+        if 'tickets' in ticket_data:
+            ticket_data = ticket_data['tickets']
+        elif ticket_data and all(isinstance(value, numpy.ndarray) for value in ticket_data.values()):
+            return _complete_columns(ticket_data)
+    buffer = columnar.ColumnBuffer(SLA_COLUMNS)
+    for ticket in ticket_data:
+        buffer.append(ticket.to_dict() if isinstance(ticket, records.Record) else ticket)
+    return buffer.flush_numpy()
+
+
+def compute_sla_metrics(ticket_data, now=None):
+    """This function computes the first response and resolution durations and SLA breach flags for tickets.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A ticket that has not been responded to (or resolved) is considered to be in breach once the current
+              time has passed its due date. The resolution time uses the ``closed_at`` timestamp when the
+              ``resolved_at`` timestamp is not defined.
+
+    :param ticket_data: The tickets in any format accepted by :py:func:`freshpy.analytics.get_sla_arrays`
+    :type ticket_data: dict, list, tuple, generator
+    :param now: The time used to evaluate open tickets (the current UTC time is used when not defined)
+    :type now: str, datetime.datetime, numpy.datetime64, None
+    :returns: A dictionary of :py:class:`numpy.ndarray` objects with the ``id`` and grouping columns, the
+              ``first_response_hours`` and ``resolution_hours`` durations (``NaN`` when not applicable) and the
+              ``first_response_breached`` and ``resolution_breached`` flags along with the
+              ``has_first_response_sla`` and ``has_resolution_sla`` flags that indicate if the due dates are defined
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    arrays = get_sla_arrays(ticket_data)
+    now = _get_datetime64(now)
+    created_at = arrays['created_at']
+    first_responded_at = arrays['stats.first_responded_at']
+    resolved_at = numpy.where(numpy.isnat(arrays['stats.resolved_at']), arrays['stats.closed_at'],
+                              arrays['stats.resolved_at'])
+    metrics = {column: arrays[column] for column in ['id'] + sorted(set(GROUP_BY_FIELDS.values()))}
+    metrics['first_response_hours'] = _get_hours(created_at, first_responded_at)
+    metrics['resolution_hours'] = _get_hours(created_at, resolved_at)
+    metrics['has_first_response_sla'] = ~numpy.isnat(arrays['fr_due_by'])
+    metrics['has_resolution_sla'] = ~numpy.isnat(arrays['due_by'])
+    metrics['first_response_breached'] = _get_breach_flags(first_responded_at, arrays['fr_due_by'], now)
+    metrics['resolution_breached'] = _get_breach_flags(resolved_at, arrays['due_by'], now)
+    return metrics
+
+
+def get_breach_rates(ticket_data, group_by=None, now=None):
+    """This function calculates the first response and resolution SLA breach rates with optional grouping.
+
+    .. versionadded:: 2.1.0
+
+    :param ticket_data: The tickets in any format accepted by :py:func:`freshpy.analytics.get_sla_arrays` or the
+                        metrics returned by :py:func:`freshpy.analytics.compute_sla_metrics`
+    :type ticket_data: dict, list, tuple, generator
+    :param group_by: The field by which to group the tickets (e.g. ``group_id`` or ``agent_id``)
+    :type group_by: str, None
+    :param now: The time used to evaluate open tickets (the current UTC time is used when not defined)
+    :type now: str, datetime.datetime, numpy.datetime64, None
+    :returns: A dictionary with the ``tickets`` count, the ``first_response_breaches`` and ``resolution_breaches``
+              counts and the ``first_response_breach_rate`` and ``resolution_breach_rate`` values (``None`` when no
+              tickets have the due date defined), which is keyed by the group values when ``group_by`` is defined
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+             :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`
+    """
+    metrics = _get_metrics(ticket_data, now)
+    group_keys, group_index = _get_groups(metrics, group_by)
+    group_count = len(group_keys)
+    totals = numpy.bincount(group_index, minlength=group_count)
+    counts = {}
+    for sla_type in ('first_response', 'resolution'):
+        eligible = numpy.bincount(group_index, weights=metrics[f'has_{sla_type}_sla'], minlength=group_count)
+        breaches = numpy.bincount(group_index, weights=metrics[f'{sla_type}_breached'], minlength=group_count)
+        counts[sla_type] = (eligible, breaches)
+    rates = {}
+    for position, group_key in enumerate(group_keys):
+        group_rates = {'tickets': int(totals[position])}
+        for sla_type, (eligible, breaches) in counts.items():
+            group_rates[f'{sla_type}_breaches'] = int(breaches[position])
+            group_rates[f'{sla_type}_breach_rate'] = \
+                float(breaches[position] / eligible[position]) if eligible[position] else None
+        rates[group_key] = group_rates
+    return rates if group_by else rates.get(None, {})
+
+
+def get_duration_percentiles(ticket_data, metric='resolution_hours', group_by=None, percentiles=DEFAULT_PERCENTILES,
+                             now=None):
+    """This function calculates percentiles of the first response or resolution durations with optional grouping.
+
+    .. versionadded:: 2.1.0
+
+    :param ticket_data: The tickets in any format accepted by :py:func:`freshpy.analytics.get_sla_arrays` or the
+                        metrics returned by :py:func:`freshpy.analytics.compute_sla_metrics`
+    :type ticket_data: dict, list, tuple, generator
+    :param metric: The duration metric (``first_response_hours`` or ``resolution_hours``)
+    :type metric: str
+    :param group_by: The field by which to group the tickets (e.g. ``group_id`` or ``agent_id``)
+    :type group_by: str, None
+    :param percentiles: The percentiles to calculate (``50``, ``90`` and ``95`` by default)
+    :type percentiles: tuple, list
+    :param now: The time used to evaluate open tickets (the current UTC time is used when not defined)
+    :type now: str, datetime.datetime, numpy.datetime64, None
+    :returns: A dictionary with the ``count`` of tickets with a duration and the percentile values in hours (e.g.
+              ``p90``) that are ``None`` when there are no durations, which is keyed by the group values when
+              ``group_by`` is defined
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+             :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`
+    """
+    if metric not in DURATION_METRICS:
+        raise errors.exceptions.CurrentlyUnsupportedError(f'{metric} metric')
+    metrics = _get_metrics(ticket_data, now)
+    group_keys, group_index = _get_groups(metrics, group_by)
+    durations = metrics[metric]
+    valid = ~numpy.isnan(durations)
+    durations, group_index = durations[valid], group_index[valid]
+    order = numpy.argsort(group_index, kind='stable')
+    boundaries = numpy.cumsum(numpy.bincount(group_index, minlength=len(group_keys)))[:-1]
+    results = {}
+    for group_key, group_durations in zip(group_keys, numpy.split(durations[order], boundaries)):
+        values = numpy.percentile(group_durations, percentiles) if len(group_durations) else [None] * len(percentiles)
+        group_results = {'count': len(group_durations)}
+        for percentile, value in zip(percentiles, values):
+            group_results[f'p{percentile}'] = None if value is None else float(value)
+        results[group_key] = group_results
+    return results if group_by else results.get(None, {})
+
+
+def _require_numpy():
+    """This function ensures that the optional :py:mod:`numpy` package is installed.
+
+    .. versionadded:: 2.1.0
+
+    :returns: None
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    if numpy is None:
+        raise errors.exceptions.MissingDependencyError(package='numpy')
+
+
+def _complete_columns(_arrays):
+    """This function adds any missing SLA columns to a dictionary of arrays as empty (``NaN`` or ``NaT``) values.
+
+    .. versionadded:: 2.1.0
+
+    :param _arrays: A dictionary of :py:class:`numpy.ndarray` objects keyed by column name
+    :type _arrays: dict
+    :returns: The dictionary of arrays with every column in :py:data:`freshpy.analytics.SLA_COLUMNS`
+    """
+    _length = len(next(iter(_arrays.values())))
+    _completed = dict(_arrays)
+    for _column, _column_type in SLA_COLUMNS.items():
+        if _column not in _completed:
+            _empty_value = numpy.datetime64('NaT', 's') if _column_type == 'timestamp' else numpy.nan
+            _completed[_column] = numpy.full(_length, _empty_value)
+    return _completed
+
+
+def _get_metrics(_ticket_data, _now=None):
+    """This function returns the SLA metrics for ticket data unless the metrics have already been computed.
+
+    .. versionadded:: 2.1.0
+
+    :param _ticket_data: The ticket data or the metrics returned by :py:func:`freshpy.analytics.compute_sla_metrics`
+    :type _ticket_data: dict, list, tuple, generator
+    :param _now: The time used to evaluate open tickets
+    :type _now: str, datetime.datetime, numpy.datetime64, None
+    :returns: The dictionary of metrics
+    """
+    if isinstance(_ticket_data, dict) and 'resolution_breached' in _ticket_data:
+        return _ticket_data
+    return compute_sla_metrics(_ticket_data, _now)
+
+
+def _get_groups(_metrics, _group_by=None):
+    """This function returns the distinct group values and the group position of each ticket.
+
+    .. versionadded:: 2.1.0
+
+    :param _metrics: The dictionary of metrics
+    :type _metrics: dict
+    :param _group_by: The field by which to group the tickets
+    :type _group_by: str, None
+    :returns: A tuple with the list of group values (where a missing value is ``None``) and the array of positions
+    :raises: :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`
+    """
+    _ticket_count = len(_metrics['id'])
+    if not _group_by:
+        return [None], numpy.zeros(_ticket_count, dtype='int64')
+    if _group_by not in GROUP_BY_FIELDS:
+        raise errors.exceptions.CurrentlyUnsupportedError(f'{_group_by} grouping')
+    _values, _group_index = numpy.unique(_metrics[GROUP_BY_FIELDS[_group_by]], return_inverse=True)
+    _group_keys = [None if _value != _value else int(_value) for _value in _values.tolist()]
+    return _group_keys, _group_index.reshape(-1)
+
+
+def _get_datetime64(_value=None):
+    """This function converts a timestamp into a NumPy ``datetime64[s]`` value in UTC.
+
+    .. versionadded:: 2.1.0
+
+    :param _value: The timestamp (e.g. ``2024-01-31T17:45:00Z``) or ``None`` for the current time
+    :type _value: str, datetime.datetime, numpy.datetime64, None
+    :returns: The :py:class:`numpy.datetime64` value
+    """
+    if _value is None:
+        _value = datetime.now(timezone.utc)
+    if isinstance(_value, datetime):
+        if _value.tzinfo is not None:
+            _value = _value.astimezone(timezone.utc).replace(tzinfo=None)
+        return numpy.datetime64(_value, 's')
+    if isinstance(_value, str):
+        _value = _value.rstrip('Z')
+    return numpy.datetime64(_value, 's')
+
+
+def _get_hours(_start, _end):
+    """This function calculates the number of hours between two arrays of timestamps.
+
+    .. versionadded:: 2.1.0
+
+    :param _start: The array of start timestamps
+    :type _start: numpy.ndarray
+    :param _end: The array of end timestamps
+    :type _end: numpy.ndarray
+    :returns: The array of hours where the value is ``NaN`` if either timestamp is missing
+    """
+    return (_end - _start) / numpy.timedelta64(1, 'h')
+
+
+def _get_breach_flags(_completed_at, _due_by, _now):
+    """This function determines which tickets were (or are) completed after their due date.
+
+    .. versionadded:: 2.1.0
+
+    :param _completed_at: The array of timestamps when the response or resolution occurred (if any)
+    :type _completed_at: numpy.ndarray
+    :param _due_by: The array of due dates
+    :type _due_by: numpy.ndarray
+    :param _now: The time used to evaluate tickets that have not been completed
+    :type _now: numpy.datetime64
+    :returns: The boolean array of breach flags (which are ``False`` when the due date is not defined)
+    """
+    _effective_time = numpy.where(numpy.isnat(_completed_at), _now, _completed_at)
+    return ~numpy.isnat(_due_by) & (_effective_time > _due_by)
@@ -4,24 +4,52 @@
 :Synopsis:          This module handles interactions with the Freshservice REST API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     29 Jan 2025
+:Modified Date:     18 Oct 2026
 """
 
-import requests
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from . import errors
-from .utils import log_utils
+from .utils import core_utils, json_backend, json_stream, log_utils, metrics, retry, tracing
+from .utils import cache as cache_module
+from .utils import hooks as hooks_module
+
+# Import the optional Brotli package used by urllib3 to decompress responses
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
 
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
 
+# Define constants
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+MAX_PER_PAGE = 100
+DEFAULT_PREFETCH_WORKERS = 4
+ACCEPT_ENCODING = 'br, gzip, deflate' if brotli is not None else 'gzip, deflate'
+
+# Define the modules that depend on requests, which are imported when the first session is created
+requests = None
+transport = None
+
 
 def define_headers():
     """This function defines the headers to use in API calls.
 
+    .. versionchanged:: 2.1.0
+       The ``Accept-Encoding`` header is now defined to request compressed responses, which includes ``br`` when
+       the optional :py:mod:`brotli` package is installed.
+
     .. versionadded:: 1.0.0
     """
-    headers = {'Content-Type': 'application/json'}
+    headers = {'Content-Type': 'application/json', 'Accept-Encoding': ACCEPT_ENCODING}
     return headers
 
 
@@ -34,9 +62,82 @@ def define_auth(api_key):
     return credentials
 
 
-def get_request_with_retries(fresh_object, uri, headers=None, return_json=True, verify_ssl=True):
+def create_session(api_key=None, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                   keep_alive=True, pool_block=False):
+    """This function creates a :py:class:`requests.Session` with a pooled :py:class:`requests.adapters.HTTPAdapter`.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The session uses the :py:class:`freshpy.utils.transport.TimedHTTPAdapter` adapter so that the time
+              spent opening connections can be reported to request hooks.
+
+    :param api_key: The API key to use for authentication on every request made through the session
+    :type api_key: str, None
+    :param pool_connections: The number of connection pools to cache (i.e. the number of distinct hosts)
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections to keep open in each pool
+    :type pool_maxsize: int
+    :param keep_alive: Determines if connections should be kept alive and reused between calls (``True`` by default)
+    :type keep_alive: bool
+    :param pool_block: Determines if requests should wait for a free connection when the pool is exhausted
+    :type pool_block: bool
+    :returns: The configured :py:class:`requests.Session` object
+    """
+    _import_transport()
+    session = requests.Session()
+    adapter = transport.TimedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                         pool_block=pool_block)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(define_headers())
+    session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+    if api_key:
+        session.auth = define_auth(api_key)
+    return session
+
+
+def _get_session(_fresh_object):
+    """This function returns the session owned by the core object or the :py:mod:`requests` module as a fallback.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The transport module is always imported here (rather than only when a session is created) because
+              the connection timer is used for every request, including those sent through a session that was
+              assigned to the core object directly.
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :returns: The :py:class:`requests.Session` object or the :py:mod:`requests` module
+    """
+    _import_transport()
+    _session = getattr(_fresh_object, 'session', None)
+    return _session if _session is not None else requests
+
+
+def _import_transport():
+    """This function imports the :py:mod:`requests` package and the transport module the first time they are needed.
+
+    .. versionadded:: 2.1.0
+
+    :returns: None
+    """
+    global requests, transport
+    if transport is None:
+        import requests as _requests
+        from .utils import transport as _transport
+        requests, transport = _requests, _transport
+
+
+def get_request_with_retries(fresh_object, uri, headers=None, return_json=True, verify_ssl=True, stream=False):
     """This function performs a GET request and will retry several times if a failure occurs.
 
+    .. versionchanged:: 2.1.0
+       The request is now performed using the pooled session owned by the core object, requests are paced by the
+       rate limiter of the core object and failed attempts are retried according to its retry policy. The JSON
+       data is also served from and stored in the response cache of the core object when it is enabled (where expired
+       entries are revalidated using conditional requests), and the ``stream`` parameter was introduced to defer
+       downloading the response body. Each attempt is also reported to the request hooks of the core object and
+       wrapped in an OpenTelemetry span when the ``opentelemetry-api`` package is installed.
+
     .. versionchanged:: 2.0.0
        Added error handling for 404 responses and exceptions when converting response to JSON.
 
@@ -54,51 +155,651 @@ def get_request_with_retries(fresh_object, uri, headers=None, return_json=True,
     :type return_json: bool
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
+    :param stream: Determines if the response body should only be downloaded as it is consumed (``False`` by default)
+    :type stream: bool
     :returns: The JSON data from the response or the raw :py:mod:`requests` response.
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
     """
     # Define headers if not supplied
     headers = define_headers() if not headers else headers
 
-    # Construct the credentials dictionary
-    credentials = define_auth(fresh_object.api_key)
-
     # Construct the query URL
     query_url = fresh_object.base_url + uri
 
-    # Perform the API call
-    retries, response = 0, None
-    while retries <= 5:
-        try:
-            response = requests.get(query_url, headers=headers, auth=credentials, verify=verify_ssl)
-            break
-        except Exception as exc_msg:
-            _report_failed_attempt(exc_msg, 'get', retries)
-            retries += 1
-    if retries == 6:
-        _raise_exception_for_repeated_timeouts()
-    if return_json:
-        if response.status_code == 404:
-            response = {
-                'status': 'error',
-                'status_code': 404,
-                'error_message': 'Data not found',
-            }
+    # Return the cached data if available or add the conditional request headers for an expired entry
+    cache = getattr(fresh_object, 'cache', None) if return_json else None
+    cached_entry = None
+    if cache is not None:
+        cached_data = cache.get(query_url)
+        if cached_data is not None:
+            return cached_data
+        cached_entry = cache.get_entry(query_url)
+        if cached_entry is not None:
+            headers = {**headers, **cache_module.get_conditional_headers(cached_entry[1])}
+
+    # Perform the API call within a span that also includes the time spent decoding the response
+    with tracing.start_span(tracing.REQUEST_SPAN, _get_span_attributes(uri, query_url)):
+        response, event = _send_get_request(fresh_object, uri, headers, verify_ssl, stream)
+        if not return_json:
+            _emit_response(fresh_object, event)
+            return response
+
+        # Decode the JSON data while measuring the time spent decoding
+        decode_started = time.perf_counter()
+        if cache is not None and response.status_code < 400:
+            data = _get_cacheable_json(cache, query_url, cache.get_ttl(uri), response, cached_entry,
+                                       _get_json_decoder(fresh_object))
         else:
+            data = _parse_json_response(response, _get_json_decoder(fresh_object))
+        _emit_response(fresh_object, event, decode_started)
+        return data
+
+
+def _send_get_request(_fresh_object, _uri, _headers=None, _verify_ssl=True, _stream=False):
+    """This function performs a GET request with retries and reports each attempt to the request hooks.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The ``on_response`` event for the final attempt is not emitted by this function so that the caller can
+              add the time spent decoding the response using the :py:func:`freshpy.api._emit_response` function.
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _uri: The URI to query
+    :type _uri: str
+    :param _headers: The HTTP headers to utilize in the REST API call
+    :type _headers: dict, None
+    :param _verify_ssl: Determines if SSL verification should occur
+    :type _verify_ssl: bool
+    :param _stream: Determines if the response body should only be downloaded as it is consumed
+    :type _stream: bool
+    :returns: A tuple with the raw :py:mod:`requests` response and the
+              :py:class:`freshpy.utils.hooks.RequestEvent` object for the final attempt (or ``None`` when no hooks
+              are registered)
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    """
+    _headers = define_headers() if not _headers else _headers
+    _credentials = define_auth(_fresh_object.api_key)
+    _query_url = _fresh_object.base_url + _uri
+    _session = _get_session(_fresh_object)
+    _rate_limiter = getattr(_fresh_object, 'rate_limiter', None)
+    _retry_policy = getattr(_fresh_object, 'retry_policy', None) or retry.RetryPolicy()
+    _hooks = _get_hooks(_fresh_object)
+    _endpoint = hooks_module.get_endpoint_template(_uri) if _hooks else None
+    _attempt, _response, _event = 0, None, None
+    while True:
+        _attempt += 1
+        if _hooks:
+            _event = hooks_module.RequestEvent('GET', _query_url, _endpoint, _attempt)
+            _hooks.emit('on_request_start', _event)
+        _wait = _rate_limiter.acquire() if _rate_limiter else 0.0
+        if _hooks and _wait > 0:
+            _event.delay = _wait
+            _hooks.emit('on_throttle', _event)
+        _failure = None
+        with tracing.start_span(tracing.ATTEMPT_SPAN, _get_span_attributes(_uri, _query_url, _attempt, _wait)) as _span:
+            transport.connection_timer.elapsed = 0.0
+            _started = time.perf_counter()
             try:
-                response = response.json()
-            except Exception as exc_msg:
-                response = {
-                    'status': 'exception',
-                    'status_code': None,
-                    'error_message': exc_msg,
-                }
-    return response
+                _response = _session.get(_query_url, headers=_headers, auth=_credentials, verify=_verify_ssl,
+                                         stream=_stream)
+            except Exception as _exc_msg:
+                tracing.record_exception(_span, _exc_msg)
+                _failure = _exc_msg
+            else:
+                tracing.set_response_attributes(_span, _response, _stream)
+        if _failure is not None:
+            _report_failed_attempt(_failure, 'get', _attempt, _retry_policy)
+            if _attempt >= _retry_policy.max_attempts:
+                _raise_exception_for_repeated_timeouts(_attempt)
+            _delay = _retry_policy.get_delay(_attempt)
+            if _hooks:
+                _event.exception, _event.delay = _failure, _delay
+                _hooks.emit('on_retry', _event)
+            time.sleep(_delay)
+            continue
+        if _rate_limiter:
+            _rate_limiter.update_from_headers(_response.headers)
+        if not _stream:
+            _record_transfer(_fresh_object, _response)
+        if _hooks:
+            _measure_response(_event, _response, _started, _stream)
+        if _retry_policy.is_retryable_status(_response.status_code) and _attempt < _retry_policy.max_attempts:
+            if _stream:
+                _response.close()
+            if _hooks:
+                _hooks.emit('on_response', _event)
+            _wait_before_retry(_retry_policy, _rate_limiter, _response, _attempt, _hooks, _event)
+            continue
+        break
+    return _response, _event
+
+
+def _get_span_attributes(_uri, _query_url, _attempt=None, _wait=None, _page=None):
+    """This function returns the attributes for a tracing span around a request, attempt or page.
 
+    .. versionadded:: 2.1.0
 
-def _report_failed_attempt(_exc_msg, _request_type, _retries):
+    :param _uri: The URI relative to the API base URL
+    :type _uri: str
+    :param _query_url: The full query URL
+    :type _query_url: str, None
+    :param _attempt: The attempt number (if applicable)
+    :type _attempt: int, None
+    :param _wait: The number of seconds the request was paced by the rate limiter (if applicable)
+    :type _wait: float, None
+    :param _page: The page number (if applicable)
+    :type _page: int, None
+    :returns: A dictionary of span attributes or ``None`` when tracing is not available
+    """
+    if not tracing.is_enabled():
+        return None
+    return {
+        'http.request.method': 'GET',
+        'url.full': _query_url,
+        'freshpy.endpoint': hooks_module.get_endpoint_template(_uri),
+        'freshpy.attempt': _attempt,
+        'freshpy.rate_limit.wait': _wait or None,
+        'freshpy.page': _page,
+    }
+
+
+def _get_hooks(_fresh_object):
+    """This function returns the hook manager of the core object when at least one callback is registered.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :returns: The :py:class:`freshpy.utils.hooks.HookManager` object or ``None`` when there are no callbacks
+    """
+    _hooks = getattr(_fresh_object, 'hooks', None)
+    return _hooks if _hooks else None
+
+
+def _measure_response(_event, _response, _started, _stream=False):
+    """This function adds the status code, timing breakdown and size of a response to a request event.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The time until the response headers were received is taken from the ``elapsed`` attribute of the
+              :py:mod:`requests` response and the time spent opening a connection is subtracted from it to
+              produce the ``ttfb`` value. The body of a streamed response has not been downloaded yet, so its
+              ``download`` value and sizes are added by the caller.
+
+    :param _event: The event for the request attempt
+    :type _event: class[freshpy.utils.hooks.RequestEvent]
+    :param _response: The raw :py:mod:`requests` response
+    :param _started: The value of :py:func:`time.perf_counter` before the request was sent
+    :type _started: float
+    :param _stream: Determines if the response body is being streamed
+    :type _stream: bool
+    :returns: None
+    """
+    _total = time.perf_counter() - _started
+    _elapsed = getattr(_response, 'elapsed', None)
+    _headers_received = _elapsed.total_seconds() if _elapsed is not None else _total
+    _event.status_code = _response.status_code
+    _event.connect = getattr(transport.connection_timer, 'elapsed', 0.0)
+    _event.ttfb = max(_headers_received - _event.connect, 0.0)
+    _event.total = _total
+    if not _stream:
+        _event.download = max(_total - _headers_received, 0.0)
+        _event.decoded_bytes = len(_response.content)
+        _event.wire_bytes = metrics.get_wire_bytes(_response, _event.decoded_bytes)
+
+
+def _emit_response(_fresh_object, _event, _decode_started=None):
+    """This function emits the ``on_response`` event for the final attempt of a request.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _event: The event for the final attempt (or ``None`` when no hooks are registered)
+    :type _event: class[freshpy.utils.hooks.RequestEvent], None
+    :param _decode_started: The value of :py:func:`time.perf_counter` before the response was decoded (if decoded)
+    :type _decode_started: float, None
+    :returns: None
+    """
+    if _event is None:
+        return
+    if _decode_started is not None:
+        _event.decode = time.perf_counter() - _decode_started
+        _event.total = (_event.total or 0.0) + _event.decode
+    _fresh_object.hooks.emit('on_response', _event)
+
+
+def _decode_page(_fresh_object, _response, _event, _data_key):
+    """This function returns the list of records in a page of results and reports the response to the hooks.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _response: The raw :py:mod:`requests` (or :py:mod:`httpx`) response for the page
+    :param _event: The event for the final attempt (or ``None`` when no hooks are registered)
+    :type _event: class[freshpy.utils.hooks.RequestEvent], None
+    :param _data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type _data_key: str
+    :returns: The list of records (which is empty when the page was not found)
+    :raises: :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    _decode_started = time.perf_counter()
+    try:
+        return _get_page_records(_response, _data_key, _get_json_decoder(_fresh_object))
+    finally:
+        _emit_response(_fresh_object, _event, _decode_started)
+
+
+def _get_cacheable_json(_cache, _query_url, _ttl, _response, _cached_entry=None, _decoder=None):
+    """This function returns the JSON data for a successful response and stores it in the response cache.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A ``304 Not Modified`` response renews the cached entry, and a response whose body has the same content
+              hash as the cached entry reuses the cached data rather than decoding the body again. The data is only
+              stored when it was decoded successfully, so the error dictionary for a malformed body is never cached.
+
+    :param _cache: The response cache of the core object
+    :type _cache: class[freshpy.utils.cache.ResponseCache]
+    :param _query_url: The full query URL used as the cache key
+    :type _query_url: str
+    :param _ttl: The number of seconds the entry remains valid
+    :type _ttl: int, float
+    :param _response: The raw :py:mod:`requests` (or compatible) response
+    :param _cached_entry: The cached data and validators returned by the cache for an expired entry (if any)
+    :type _cached_entry: tuple, None
+    :param _decoder: The function used to decode the JSON data
+    :type _decoder: function, None
+    :returns: The JSON data
+    """
+    if _cached_entry is not None and _response.status_code == 304:
+        _cached_data = _cache.revalidate(_query_url, _ttl)
+        if _cached_data is None:
+            # The entry was evicted or invalidated during the request so the data held by the caller is stored again
+            _cached_data = _cached_entry[0]
+            _cache.set(_query_url, _cached_data, _ttl, _cached_entry[1])
+        return _cached_data
+    _validators = cache_module.get_response_validators(_response)
+    if _cached_entry is not None and _cached_entry[1].get('content_hash') == _validators['content_hash']:
+        _cached_data = _cache.revalidate(_query_url, _ttl, _validators)
+        if _cached_data is not None:
+            return _cached_data
+    try:
+        _data = json_backend.decode_response(_response, _decoder)
+    except Exception:
+        # Return the error dictionary without caching it so that the next call requests the data again
+        return _parse_json_response(_response, _decoder)
+    _cache.set(_query_url, _data, _ttl, _validators)
+    return _data
+
+
+def _record_transfer(_fresh_object, _response, _decoded_bytes=None):
+    """This function records the wire and decoded bytes of a response in the transfer statistics of the core object.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _response: The :py:mod:`requests` (or :py:mod:`httpx`) response whose body has been consumed
+    :param _decoded_bytes: The number of decompressed bytes consumed from a streamed body (if applicable)
+    :type _decoded_bytes: int, None
+    :returns: None
+    """
+    _transfer_stats = getattr(_fresh_object, 'transfer_stats', None)
+    if _transfer_stats is not None:
+        _transfer_stats.record_response(_response, _decoded_bytes)
+
+
+def _count_bytes(_chunks, _counter):
+    """This function yields the chunks of a response body while adding their lengths to a counter.
+
+    .. versionadded:: 2.1.0
+
+    :param _chunks: An iterable of ``bytes`` chunks
+    :type _chunks: generator
+    :param _counter: A single-item list that holds the running total
+    :type _counter: list
+    :returns: A generator that yields each chunk
+    """
+    for _chunk in _chunks:
+        _counter[0] += len(_chunk)
+        yield _chunk
+
+
+def _get_json_decoder(_fresh_object):
+    """This function returns the JSON decoder function configured in the core object, if any.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :returns: The decoder function or ``None`` if the standard library should be used
+    """
+    return getattr(_fresh_object, 'json_decoder', None)
+
+
+def _parse_json_response(_response, _decoder=None):
+    """This function converts a response to JSON data and returns an error dictionary when that is not possible.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The raw :py:mod:`requests` (or compatible) response
+    :param _decoder: The function used to decode the JSON data (the standard library is used when not defined)
+    :type _decoder: function, None
+    :returns: The JSON data from the response or a dictionary describing the error
+    """
+    if _response.status_code == 404:
+        return {
+            'status': 'error',
+            'status_code': 404,
+            'error_message': 'Data not found',
+        }
+    try:
+        return json_backend.decode_response(_response, _decoder)
+    except Exception as _exc_msg:
+        return {
+            'status': 'exception',
+            'status_code': None,
+            'error_message': _exc_msg,
+        }
+
+
+def iterate_pages(fresh_object, uri, data_key, per_page=MAX_PER_PAGE, start_page=1, prefetch=False, verify_ssl=True):
+    """This function performs paginated GET requests and yields the records from each page until none remain.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The ``Link`` response header is followed when it identifies the next page, otherwise the ``page``
+              query parameter is incremented until a short or empty page is returned. When prefetching, the
+              ``page`` query parameter is always incremented so that pages can be requested ahead of time.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param uri: The URI to query (which may already include a query string)
+    :type uri: str
+    :param data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type data_key: str
+    :param per_page: The number of records to request per page (``100`` by default) or ``None`` to omit the parameter
+    :type per_page: int, str, None
+    :param start_page: The page number on which to begin (``1`` by default)
+    :type start_page: int, str, None
+    :param prefetch: Determines if pages should be requested concurrently using the ``prefetch_workers`` value
+                     defined in the core object (``False`` by default)
+    :type prefetch: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :returns: A generator that yields a list of records for each page
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    per_page = int(per_page) if per_page else None
+    page = int(start_page) if start_page else 1
+    workers = getattr(fresh_object, 'prefetch_workers', DEFAULT_PREFETCH_WORKERS) or 1
+    prefetch = prefetch and workers > 1
+    span = tracing.open_span(tracing.PAGINATION_SPAN, _get_span_attributes(uri, None))
+    tracing.set_attributes(span, {'freshpy.prefetch': prefetch, 'freshpy.per_page': per_page})
+    page_count, record_count = 0, 0
+    try:
+        if prefetch:
+            for records in _iterate_pages_concurrently(fresh_object, uri, data_key, per_page, page, workers,
+                                                       verify_ssl, span):
+                page_count, record_count = page_count + 1, record_count + len(records)
+                yield records
+            return
+        next_uri = _add_pagination(uri, per_page, page)
+        while next_uri:
+            with tracing.start_span(tracing.PAGE_SPAN, _get_span_attributes(next_uri, None, _page=page),
+                                    parent=span) as page_span:
+                response, event = _send_get_request(fresh_object, next_uri, _verify_ssl=verify_ssl)
+                records = _decode_page(fresh_object, response, event, data_key)
+                tracing.set_attributes(page_span, {'freshpy.records': len(records)})
+            if not records:
+                break
+            page_count, record_count = page_count + 1, record_count + len(records)
+            yield records
+            page += 1
+            next_uri = _get_next_page_uri(fresh_object, response, uri, len(records), per_page, page)
+    finally:
+        tracing.end_span(span, {'freshpy.pages': page_count, 'freshpy.records': record_count})
+
+
+def _iterate_pages_concurrently(_fresh_object, _uri, _data_key, _per_page, _start_page, _workers, _verify_ssl,
+                                _parent_span=None):
+    """This function keeps a bounded number of page requests in flight and yields the pages in order.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _uri: The URI to query without pagination query parameters
+    :type _uri: str
+    :param _data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type _data_key: str
+    :param _per_page: The number of records to request per page
+    :type _per_page: int, None
+    :param _start_page: The page number on which to begin
+    :type _start_page: int
+    :param _workers: The maximum number of page requests to keep in flight
+    :type _workers: int
+    :param _verify_ssl: Determines if SSL verification should occur
+    :type _verify_ssl: bool
+    :param _parent_span: The pagination span used as the parent of the span for each page (if tracing)
+    :returns: A generator that yields a list of records for each page
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    def _fetch_page(_page_number):
+        _page_uri = _add_pagination(_uri, _per_page, _page_number)
+        with tracing.start_span(tracing.PAGE_SPAN, _get_span_attributes(_page_uri, None, _page=_page_number),
+                                parent=_parent_span) as _page_span:
+            _response, _event = _send_get_request(_fresh_object, _page_uri, _verify_ssl=_verify_ssl)
+            _records = _decode_page(_fresh_object, _response, _event, _data_key)
+            tracing.set_attributes(_page_span, {'freshpy.records': len(_records)})
+            return _records
+
+    def _is_last_page(_records):
+        return not _records or (_per_page is not None and len(_records) < _per_page)
+
+    def _last_page_seen():
+        return any(_future.done() and not _future.exception() and _is_last_page(_future.result())
+                   for _future in _pending)
+
+    _executor = ThreadPoolExecutor(max_workers=_workers)
+    _pending, _next_page = deque(), _start_page
+    try:
+        for _ in range(_workers):
+            _pending.append(_executor.submit(_fetch_page, _next_page))
+            _next_page += 1
+        while _pending:
+            _records = _pending.popleft().result()
+            if _records:
+                yield _records
+            if _is_last_page(_records):
+                break
+            if not _last_page_seen():
+                _pending.append(_executor.submit(_fetch_page, _next_page))
+                _next_page += 1
+    finally:
+        for _future in _pending:
+            _future.cancel()
+        _executor.shutdown(wait=False)
+
+
+def iterate_records(fresh_object, uri, data_key, per_page=MAX_PER_PAGE, start_page=1, verify_ssl=True,
+                    chunk_size=json_stream.DEFAULT_CHUNK_SIZE):
+    """This function performs paginated GET requests and yields each record as it is decoded from the response body.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Each page is streamed and decoded incrementally rather than being loaded in full, which lowers the
+              peak memory usage and the time until the first record is available when pages are large. A custom
+              :py:attr:`freshpy.core.FreshPy.json_decoder` function decodes each record, whereas the standard library
+              decodes the records in place when the decoder is provided by one of the supported JSON backends.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param uri: The URI to query (which may already include a query string)
+    :type uri: str
+    :param data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type data_key: str
+    :param per_page: The number of records to request per page (``100`` by default) or ``None`` to omit the parameter
+    :type per_page: int, str, None
+    :param start_page: The page number on which to begin (``1`` by default)
+    :type start_page: int, str, None
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param chunk_size: The number of bytes to read from the response body at a time (``65536`` by default)
+    :type chunk_size: int
+    :returns: A generator that yields the JSON object for each record
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    per_page = int(per_page) if per_page else None
+    page = int(start_page) if start_page else 1
+    next_uri = _add_pagination(uri, per_page, page)
+    span = tracing.open_span(tracing.PAGINATION_SPAN, _get_span_attributes(uri, None))
+    tracing.set_attributes(span, {'freshpy.stream': True, 'freshpy.per_page': per_page})
+    page_count, total_records = 0, 0
+    try:
+        while next_uri:
+            page_span = tracing.open_span(tracing.PAGE_SPAN, _get_span_attributes(next_uri, None, _page=page),
+                                          parent=span)
+            with tracing.activate(page_span):
+                response, event = _send_get_request(fresh_object, next_uri, _verify_ssl=verify_ssl, _stream=True)
+            record_count, decoded_bytes, download_started = 0, [0], time.perf_counter()
+            try:
+                if response.status_code == 404:
+                    break
+                if response.status_code >= 400:
+                    raise errors.exceptions.GETRequestError(status_code=response.status_code, message=response.text)
+                for record in json_stream.iter_array_items(_count_bytes(response.iter_content(chunk_size),
+                                                                        decoded_bytes), data_key,
+                                                           _get_json_decoder(fresh_object)):
+                    record_count += 1
+                    yield record
+            finally:
+                _record_transfer(fresh_object, response, decoded_bytes[0] if response.status_code < 400 else None)
+                if event is not None:
+                    event.download = time.perf_counter() - download_started
+                    event.total += event.download
+                    event.decoded_bytes = decoded_bytes[0]
+                    event.wire_bytes = metrics.get_wire_bytes(response, decoded_bytes[0])
+                    _emit_response(fresh_object, event)
+                tracing.end_span(page_span, {'freshpy.records': record_count,
+                                             'freshpy.response.decoded_size': decoded_bytes[0]})
+                response.close()
+            if not record_count:
+                break
+            page_count, total_records = page_count + 1, total_records + record_count
+            page += 1
+            next_uri = _get_next_page_uri(fresh_object, response, uri, record_count, per_page, page)
+    finally:
+        tracing.end_span(span, {'freshpy.pages': page_count, 'freshpy.records': total_records})
+
+
+def _add_pagination(_uri, _per_page=None, _page=None):
+    """This function appends the ``per_page`` and ``page`` query parameters to a URI.
+
+    .. versionadded:: 2.1.0
+
+    :param _uri: The URI to which the query parameters should be appended
+    :type _uri: str
+    :param _per_page: The number of records to request per page
+    :type _per_page: int, None
+    :param _page: The page number to request
+    :type _page: int, None
+    :returns: The URI with the pagination query parameters
+    """
+    _path, _delimiter, _query = _uri.partition('?')
+    _query = f'?{_query}' if _delimiter else ''
+    if _per_page:
+        _query = core_utils.construct_query_string(_query, f'per_page={_per_page}')
+    if _page:
+        _query = core_utils.construct_query_string(_query, f'page={_page}')
+    return _path + _query
+
+
+def _get_page_records(_response, _data_key, _decoder=None):
+    """This function returns the list of records in a page of results.
+
+    .. versionadded:: 2.1.0
+
+    :param _response: The raw :py:mod:`requests` response for the page
+    :param _data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type _data_key: str
+    :param _decoder: The function used to decode the JSON data (the standard library is used when not defined)
+    :type _decoder: function, None
+    :returns: The list of records (which is empty when the page was not found)
+    :raises: :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    if _response.status_code == 404:
+        return []
+    if _response.status_code >= 400:
+        raise errors.exceptions.GETRequestError(status_code=_response.status_code, message=_response.text)
+    return json_backend.decode_response(_response, _decoder).get(_data_key, [])
+
+
+def _get_next_page_uri(_fresh_object, _response, _uri, _record_count, _per_page, _next_page):
+    """This function identifies the URI for the next page of results, if any.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.core.FreshPy` object.
+    :param _response: The raw :py:mod:`requests` response for the current page
+    :param _uri: The original URI without pagination query parameters
+    :type _uri: str
+    :param _record_count: The number of records returned in the current page
+    :type _record_count: int
+    :param _per_page: The number of records requested per page
+    :type _per_page: int, None
+    :param _next_page: The number of the next page
+    :type _next_page: int
+    :returns: The URI for the next page or ``None`` if there are no more pages
+    """
+    _links = getattr(_response, 'links', None) or {}
+    if 'next' in _links:
+        _next_url = _links['next'].get('url', '')
+        if _next_url.startswith(_fresh_object.base_url):
+            return _next_url[len(_fresh_object.base_url):]
+    elif _links or (_per_page and _record_count < _per_page):
+        return None
+    return _add_pagination(_uri, _per_page, _next_page)
+
+
+def _wait_before_retry(_retry_policy, _rate_limiter, _response, _attempt, _hooks=None, _event=None):
+    """This function pauses before a response with a retryable status code is retried.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The ``Retry-After`` period of a throttled (i.e. ``429``) response is applied to every request sharing
+              the rate limiter (when defined), and the wait itself occurs when the next request is paced. The
+              ``on_throttle`` hooks are called for a throttled response before the ``on_retry`` hooks.
+
+    :param _retry_policy: The :py:class:`freshpy.utils.retry.RetryPolicy` object
+    :type _retry_policy: class[freshpy.utils.retry.RetryPolicy]
+    :param _rate_limiter: The :py:class:`freshpy.utils.rate_limit.RateLimiter` object (if any)
+    :type _rate_limiter: class[freshpy.utils.rate_limit.RateLimiter], None
+    :param _response: The :py:mod:`requests` response that will be retried
+    :param _attempt: The number of attempts that have been made so far
+    :type _attempt: int
+    :param _hooks: The hook manager of the core object when callbacks are registered
+    :type _hooks: class[freshpy.utils.hooks.HookManager], None
+    :param _event: The event for the attempt that will be retried
+    :type _event: class[freshpy.utils.hooks.RequestEvent], None
+    :returns: None
+    """
+    _delay = _retry_policy.get_delay(_attempt, _response)
+    if _hooks:
+        _event.delay = _delay
+        if _response.status_code == 429:
+            _hooks.emit('on_throttle', _event)
+        _hooks.emit('on_retry', _event)
+    if _rate_limiter and _response.status_code == 429:
+        _rate_limiter.throttle(_delay)
+    else:
+        logger.debug(f'Retrying the {_response.status_code} response in {_delay:.3f} seconds (Attempt {_attempt})')
+        time.sleep(_delay)
+
+
+def _report_failed_attempt(_exc_msg, _request_type, _retries, _retry_policy=None):
     """This function reports a failed API call that will be retried.
 
+    .. versionchanged:: 2.1.0
+       Retryable exceptions are now identified using a :py:class:`freshpy.utils.retry.RetryPolicy` object.
+
     .. versionchanged:: 2.0.0
        Replaced a generic py:exc:`Exception` with a py:exc:`RuntimeError` exception.
 
@@ -109,25 +810,35 @@ def _report_failed_attempt(_exc_msg, _request_type, _retries):
     :type _request_type: str
     :param _retries: The attempt number for the API request
     :type _retries: int
+    :param _retry_policy: The retry policy used to determine if the exception can be retried
+    :type _retry_policy: class[freshpy.utils.retry.RetryPolicy], None
     :returns: None
+    :raises: :py:exc:`RuntimeError`
     """
+    _retry_policy = retry.RetryPolicy() if _retry_policy is None else _retry_policy
     _exc_name = type(_exc_msg).__name__
-    if 'connect' not in _exc_name.lower():
+    if not _retry_policy.is_retryable_exception(_exc_msg):
         raise RuntimeError(f"{_exc_name}: {_exc_msg}")
-    _current_attempt = f"(Attempt {_retries} of 5)"
+    _current_attempt = f"(Attempt {_retries} of {_retry_policy.max_attempts})"
     _error_msg = f"The {_request_type.upper()} request has failed with the following exception: " + \
                  f"{_exc_name}: {_exc_msg} {_current_attempt}"
     errors.handlers.eprint(f"{_error_msg}\n{_exc_name}: {_exc_msg}\n")
 
 
-def _raise_exception_for_repeated_timeouts():
+def _raise_exception_for_repeated_timeouts(_attempts=None):
     """This function raises an exception when all API attempts (including) retries resulted in a timeout.
 
+    .. versionchanged:: 2.1.0
+       Added the ``_attempts`` parameter to report the number of attempts that were made.
+
     .. versionadded:: 1.0.0
 
+    :param _attempts: The number of attempts that were made
+    :type _attempts: int, None
     :returns: None
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
     """
-    _failure_msg = "The script was unable to complete successfully after five consecutive API timeouts. " + \
+    _attempts = 'five' if _attempts is None else _attempts
+    _failure_msg = f"The script was unable to complete successfully after {_attempts} consecutive API timeouts. " + \
                    "Please run the script again or contact Freshservice Support for further assistance."
     raise errors.exceptions.APIConnectionError(_failure_msg)
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.async_api
+:Synopsis:          This module handles non-blocking interactions with the Freshservice REST API
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import asyncio
+from collections import deque
+
+from . import api, errors
+from .utils import log_utils, metrics, retry, tracing
+from .utils import hooks as hooks_module
+
+# Import the optional httpx package
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define constants
+CONNECT_TRACE_EVENTS = ('connection.connect_tcp', 'connection.start_tls')
+
+
+class _RequestTrace(object):
+    """This class is an :py:mod:`httpx` trace callback that records when connections are opened and headers arrive.
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = ('connect', 'headers_received', '_connect_started')
+
+    def __init__(self):
+        """This method instantiates the trace with empty measurements.
+
+        .. versionadded:: 2.1.0
+        """
+        self.connect = 0.0
+        self.headers_received = None
+        self._connect_started = None
+
+    async def __call__(self, event_name, info):
+        """This method records the time of a trace event emitted by the :py:mod:`httpcore` transport.
+
+        .. versionadded:: 2.1.0
+
+        :param event_name: The name of the trace event (e.g. ``connection.connect_tcp.started``)
+        :type event_name: str
+        :param info: The details of the trace event
+        :type info: dict
+        :returns: None
+        """
+        _now = time.perf_counter()
+        _name, _, _stage = event_name.rpartition('.')
+        if _name in CONNECT_TRACE_EVENTS:
+            if _stage == 'started':
+                self._connect_started = _now
+            elif self._connect_started is not None:
+                self.connect += _now - self._connect_started
+                self._connect_started = None
+        elif _name.endswith('receive_response_headers') and _stage == 'complete':
+            self.headers_received = _now
+
+
+def create_async_client(api_key=None, pool_maxsize=api.DEFAULT_POOL_MAXSIZE, keep_alive=True, verify_ssl=True):
+    """This function creates an :py:class:`httpx.AsyncClient` with a pool of reusable connections.
+
+    .. versionadded:: 2.1.0
+
+    :param api_key: The API key to use for authentication on every request made through the client
+    :type api_key: str, None
+    :param pool_maxsize: The maximum number of connections to keep open in the connection pool
+    :type pool_maxsize: int
+    :param keep_alive: Determines if connections should be kept alive and reused between calls (``True`` by default)
+    :type keep_alive: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :returns: The configured :py:class:`httpx.AsyncClient` object
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    if httpx is None:
+        raise errors.exceptions.MissingDependencyError(package='httpx')
+    limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize if keep_alive else 0)
+    auth = api.define_auth(api_key) if api_key else None
+    return httpx.AsyncClient(auth=auth, headers=api.define_headers(), limits=limits, verify=verify_ssl)
+
+
+async def get_request_with_retries(fresh_object, uri, headers=None, return_json=True):
+    """This function performs a non-blocking GET request and will retry several times if a failure occurs.
+
+    .. versionadded:: 2.1.0
+
+    :param fresh_object: The instantiated :py:class:`freshpy.async_core.AsyncFreshPy` object.
+    :param uri: The URI to query
+    :type uri: string
+    :param headers: The HTTP headers to utilize in the REST API call
+    :type headers: dict, None
+    :param return_json: Determines if JSON data should be returned
+    :type return_json: bool
+    :returns: The JSON data from the response or the raw :py:mod:`httpx` response.
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    """
+    with tracing.start_span(tracing.REQUEST_SPAN, api._get_span_attributes(uri, fresh_object.base_url + uri)):
+        response, event = await _send_get_request(fresh_object, uri, headers)
+        if not return_json:
+            api._emit_response(fresh_object, event)
+            return response
+        decode_started = time.perf_counter()
+        data = api._parse_json_response(response, api._get_json_decoder(fresh_object))
+        api._emit_response(fresh_object, event, decode_started)
+        return data
+
+
+async def _send_get_request(_fresh_object, _uri, _headers=None):
+    """This function performs a non-blocking GET request with retries and reports each attempt to the request hooks.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: This function mirrors the behavior of the synchronous :py:func:`freshpy.api._send_get_request`
+              function, where the timing breakdown is measured using the ``trace`` extension of :py:mod:`httpx`.
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.async_core.AsyncFreshPy` object.
+    :param _uri: The URI to query
+    :type _uri: str
+    :param _headers: The HTTP headers to utilize in the REST API call
+    :type _headers: dict, None
+    :returns: A tuple with the raw :py:mod:`httpx` response and the
+              :py:class:`freshpy.utils.hooks.RequestEvent` object for the final attempt (or ``None`` when no hooks
+              are registered)
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+    """
+    _headers = api.define_headers() if not _headers else _headers
+    _query_url = _fresh_object.base_url + _uri
+    _client = _fresh_object.client
+    _rate_limiter = getattr(_fresh_object, 'rate_limiter', None)
+    _retry_policy = getattr(_fresh_object, 'retry_policy', None) or retry.RetryPolicy()
+    _hooks = api._get_hooks(_fresh_object)
+    _endpoint = hooks_module.get_endpoint_template(_uri) if _hooks else None
+    _attempt, _response, _event, _trace = 0, None, None, None
+    while True:
+        _attempt += 1
+        if _hooks:
+            _event = hooks_module.RequestEvent('GET', _query_url, _endpoint, _attempt)
+            _hooks.emit('on_request_start', _event)
+        _wait = _rate_limiter.reserve() if _rate_limiter else 0.0
+        if _hooks and _wait > 0:
+            _event.delay = _wait
+            _hooks.emit('on_throttle', _event)
+        await _sleep(_wait)
+        _failure = None
+        _span_attributes = api._get_span_attributes(_uri, _query_url, _attempt, _wait)
+        with tracing.start_span(tracing.ATTEMPT_SPAN, _span_attributes) as _span:
+            _started = time.perf_counter()
+            try:
+                if _hooks:
+                    _trace = _RequestTrace()
+                    _response = await _client.get(_query_url, headers=_headers, extensions={'trace': _trace})
+                else:
+                    _response = await _client.get(_query_url, headers=_headers)
+            except Exception as _exc_msg:
+                tracing.record_exception(_span, _exc_msg)
+                _failure = _exc_msg
+            else:
+                tracing.set_response_attributes(_span, _response)
+        if _failure is not None:
+            api._report_failed_attempt(_failure, 'get', _attempt, _retry_policy)
+            if _attempt >= _retry_policy.max_attempts:
+                api._raise_exception_for_repeated_timeouts(_attempt)
+            _delay = _retry_policy.get_delay(_attempt)
+            if _hooks:
+                _event.exception, _event.delay = _failure, _delay
+                _hooks.emit('on_retry', _event)
+            await _sleep(_delay)
+            continue
+        if _rate_limiter:
+            _rate_limiter.update_from_headers(_response.headers)
+        api._record_transfer(_fresh_object, _response)
+        if _hooks:
+            _measure_response(_event, _response, _started, _trace)
+        if _retry_policy.is_retryable_status(_response.status_code) and _attempt < _retry_policy.max_attempts:
+            _delay = _retry_policy.get_delay(_attempt, _response)
+            if _hooks:
+                _hooks.emit('on_response', _event)
+                _event.delay = _delay
+                if _response.status_code == 429:
+                    _hooks.emit('on_throttle', _event)
+                _hooks.emit('on_retry', _event)
+            if _rate_limiter and _response.status_code == 429:
+                _rate_limiter.throttle(_delay)
+            else:
+                await _sleep(_delay)
+            continue
+        break
+    return _response, _event
+
+
+def _measure_response(_event, _response, _started, _trace):
+    """This function adds the status code, timing breakdown and size of a response to a request event.
+
+    .. versionadded:: 2.1.0
+
+    :param _event: The event for the request attempt
+    :type _event: class[freshpy.utils.hooks.RequestEvent]
+    :param _response: The raw :py:mod:`httpx` response whose body has been read
+    :param _started: The value of :py:func:`time.perf_counter` before the request was sent
+    :type _started: float
+    :param _trace: The trace callback that was supplied with the request
+    :type _trace: class[freshpy.async_api._RequestTrace]
+    :returns: None
+    """
+    _finished = time.perf_counter()
+    _headers_received = _trace.headers_received if _trace.headers_received is not None else _finished
+    _event.status_code = _response.status_code
+    _event.connect = _trace.connect
+    _event.ttfb = max(_headers_received - _started - _trace.connect, 0.0)
+    _event.download = _finished - _headers_received
+    _event.total = _finished - _started
+    _event.decoded_bytes = len(_response.content)
+    _event.wire_bytes = metrics.get_wire_bytes(_response, _event.decoded_bytes)
+
+
+async def iterate_pages(fresh_object, uri, data_key, per_page=api.MAX_PER_PAGE, start_page=1, prefetch=False):
+    """This function performs non-blocking paginated GET requests and yields the records from each page.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: This function mirrors the behavior of the synchronous :py:func:`freshpy.api.iterate_pages` function.
+
+    :param fresh_object: The instantiated :py:class:`freshpy.async_core.AsyncFreshPy` object.
+    :param uri: The URI to query (which may already include a query string)
+    :type uri: str
+    :param data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type data_key: str
+    :param per_page: The number of records to request per page (``100`` by default) or ``None`` to omit the parameter
+    :type per_page: int, str, None
+    :param start_page: The page number on which to begin (``1`` by default)
+    :type start_page: int, str, None
+    :param prefetch: Determines if pages should be requested concurrently using the ``prefetch_workers`` value
+                     defined in the core object (``False`` by default)
+    :type prefetch: bool
+    :returns: An asynchronous generator that yields a list of records for each page
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    per_page = int(per_page) if per_page else None
+    page = int(start_page) if start_page else 1
+    workers = getattr(fresh_object, 'prefetch_workers', api.DEFAULT_PREFETCH_WORKERS) or 1
+    prefetch = prefetch and workers > 1
+    span = tracing.open_span(tracing.PAGINATION_SPAN, api._get_span_attributes(uri, None))
+    tracing.set_attributes(span, {'freshpy.prefetch': prefetch, 'freshpy.per_page': per_page})
+    page_count, record_count = 0, 0
+    try:
+        if prefetch:
+            async for records in _iterate_pages_concurrently(fresh_object, uri, data_key, per_page, page, workers,
+                                                             span):
+                page_count, record_count = page_count + 1, record_count + len(records)
+                yield records
+            return
+        next_uri = api._add_pagination(uri, per_page, page)
+        while next_uri:
+            with tracing.start_span(tracing.PAGE_SPAN, api._get_span_attributes(next_uri, None, _page=page),
+                                    parent=span) as page_span:
+                response, event = await _send_get_request(fresh_object, next_uri)
+                records = api._decode_page(fresh_object, response, event, data_key)
+                tracing.set_attributes(page_span, {'freshpy.records': len(records)})
+            if not records:
+                break
+            page_count, record_count = page_count + 1, record_count + len(records)
+            yield records
+            page += 1
+            next_uri = api._get_next_page_uri(fresh_object, response, uri, len(records), per_page, page)
+    finally:
+        tracing.end_span(span, {'freshpy.pages': page_count, 'freshpy.records': record_count})
+
+
+async def _iterate_pages_concurrently(_fresh_object, _uri, _data_key, _per_page, _start_page, _workers,
+                                      _parent_span=None):
+    """This function keeps a bounded number of page requests in flight and yields the pages in order.
+
+    .. versionadded:: 2.1.0
+
+    :param _fresh_object: The instantiated :py:class:`freshpy.async_core.AsyncFreshPy` object.
+    :param _uri: The URI to query without pagination query parameters
+    :type _uri: str
+    :param _data_key: The key in the JSON response that contains the list of records (e.g. ``tickets``)
+    :type _data_key: str
+    :param _per_page: The number of records to request per page
+    :type _per_page: int, None
+    :param _start_page: The page number on which to begin
+    :type _start_page: int
+    :param _workers: The maximum number of page requests to keep in flight
+    :type _workers: int
+    :param _parent_span: The pagination span used as the parent of the span for each page (if tracing)
+    :returns: An asynchronous generator that yields a list of records for each page
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    async def _fetch_page(_page_number):
+        _page_uri = api._add_pagination(_uri, _per_page, _page_number)
+        with tracing.start_span(tracing.PAGE_SPAN, api._get_span_attributes(_page_uri, None, _page=_page_number),
+                                parent=_parent_span) as _page_span:
+            _response, _event = await _send_get_request(_fresh_object, _page_uri)
+            _records = api._decode_page(_fresh_object, _response, _event, _data_key)
+            tracing.set_attributes(_page_span, {'freshpy.records': len(_records)})
+            return _records
+
+    def _is_last_page(_records):
+        return not _records or (_per_page is not None and len(_records) < _per_page)
+
+    def _last_page_seen():
+        return any(_task.done() and not _task.cancelled() and not _task.exception() and _is_last_page(_task.result())
+                   for _task in _pending)
+
+    _pending, _next_page = deque(), _start_page
+    try:
+        for _ in range(_workers):
+            _pending.append(asyncio.ensure_future(_fetch_page(_next_page)))
+            _next_page += 1
+        while _pending:
+            _records = await _pending.popleft()
+            if _records:
+                yield _records
+            if _is_last_page(_records):
+                break
+            if not _last_page_seen():
+                _pending.append(asyncio.ensure_future(_fetch_page(_next_page)))
+                _next_page += 1
+    finally:
+        for _task in _pending:
+            _task.cancel()
+
+
+async def _sleep(_seconds):
+    """This function pauses the current coroutine when a positive number of seconds is supplied.
+
+    .. versionadded:: 2.1.0
+
+    :param _seconds: The number of seconds to wait
+    :type _seconds: int, float
+    :returns: None
+    """
+    if _seconds and _seconds > 0:
+        await asyncio.sleep(_seconds)
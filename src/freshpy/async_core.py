@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.async_core
+:Synopsis:          Defines the asynchronous freshpy object used to interface with the Freshservice API
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from . import api, async_api, errors
+from . import tickets as tickets_module
+from . import agents as agents_module
+from .utils import json_backend, log_utils, metrics, rate_limit, retry, version
+from .utils import hooks as hooks_module
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+
+class AsyncFreshPy(object):
+    """This is the class for the asynchronous core object which mirrors the :py:class:`freshpy.core.FreshPy` object.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The :py:mod:`httpx` package must be installed in order to utilize this object.
+    """
+    def __init__(self, domain=None, api_key=None, pool_maxsize=api.DEFAULT_POOL_MAXSIZE, keep_alive=True,
+                 prefetch_workers=api.DEFAULT_PREFETCH_WORKERS, rate_limit_per_minute=None, pace_requests=True,
+                 retry_policy=None, verify_ssl=True, json_decoder=None, hooks=None):
+        """This method instantiates the asynchronous core Fresh object.
+
+        .. versionadded:: 2.1.0
+
+        :param domain: The Freshservice domain (e.g. ``example.freshservice.com``)
+        :type domain: str
+        :param api_key: The API key to use for authentication
+        :type api_key: str
+        :param pool_maxsize: The maximum number of connections to keep open in the connection pool
+        :type pool_maxsize: int
+        :param keep_alive: Determines if connections should be kept alive and reused between calls (``True`` by default)
+        :type keep_alive: bool
+        :param prefetch_workers: The number of page requests to keep in flight when prefetching paginated results
+        :type prefetch_workers: int
+        :param rate_limit_per_minute: The number of API calls permitted per minute for the Freshservice plan
+                                      (learned from the rate limit response headers when not defined)
+        :type rate_limit_per_minute: int, None
+        :param pace_requests: Determines if API calls should be paced to remain within the rate limit
+                              (``True`` by default)
+        :type pace_requests: bool
+        :param retry_policy: The policy that defines how failed API calls are retried (a default policy with
+                             exponential backoff is used when not defined)
+        :type retry_policy: class[freshpy.utils.retry.RetryPolicy], None
+        :param verify_ssl: Determines if SSL verification should occur for all API calls (``True`` by default)
+        :type verify_ssl: bool
+        :param json_decoder: The JSON backend (``orjson``, ``ujson`` or ``json``) or a custom function used to decode
+                             API responses (the fastest backend that is installed is used when not defined)
+        :type json_decoder: str, function, None
+        :param hooks: The callbacks for the ``on_request_start``, ``on_response``, ``on_retry`` and ``on_throttle``
+                      request events keyed by event name, where each value is a function or a list of functions
+        :type hooks: dict, None
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+                 :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        # Define the client attribute early so that the instance can always be closed
+        self.client = None
+
+        # Define the current version
+        self.version = version.get_full_version()
+
+        # Raise an exception if the domain and API key were not supplied
+        if not domain or not api_key:
+            raise errors.exceptions.MissingRequiredDataError('init')
+
+        # Define the domain
+        domain = f'https://{domain}' if domain and not domain.startswith('http') else domain
+        domain = domain[:-1] if domain.endswith('/') else domain
+        self.domain = domain
+
+        # Define the base URL
+        self.base_url = f'{domain}/api/v2/'
+
+        # Define the API key
+        self.api_key = api_key
+
+        # Define the function used to decode the JSON data in API responses
+        self.json_decoder = json_backend.get_decoder(json_decoder)
+
+        # Define the non-blocking HTTP client used for all API calls
+        self.client = async_api.create_async_client(api_key, pool_maxsize=pool_maxsize, keep_alive=keep_alive,
+                                                    verify_ssl=verify_ssl)
+
+        # Define the concurrency level used when prefetching paginated results
+        self.prefetch_workers = prefetch_workers
+
+        # Define the token bucket scheduler that paces API calls according to the rate limit
+        self.rate_limiter = rate_limit.RateLimiter(rate_limit_per_minute) if pace_requests else None
+
+        # Define the policy that determines how failed API calls are retried
+        self.retry_policy = retry_policy if retry_policy else retry.RetryPolicy()
+
+        # Define the counters that measure the bytes transferred for API responses
+        self.transfer_stats = metrics.TransferStats()
+
+        # Define the callbacks that are notified of each request attempt along with its timing breakdown
+        self.hooks = hooks_module.HookManager(hooks)
+
+        # Import inner object classes so their methods can be called from the primary object
+        self.agents = AsyncFreshPy.Agents(self)
+        self.tickets = AsyncFreshPy.Tickets(self)
+
+    async def get(self, uri, headers=None, return_json=True):
+        """This method performs a non-blocking GET request against the Freshservice API with retries on failure.
+
+        .. versionadded:: 2.1.0
+
+        :param uri: The URI to query
+        :type uri: string
+        :param headers: The HTTP headers to utilize in the REST API call
+        :type headers: dict, None
+        :param return_json: Determines if JSON data should be returned
+        :type return_json: bool
+        :returns: The JSON data from the response or the raw :py:mod:`httpx` response.
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+        """
+        return await async_api.get_request_with_retries(self, uri, headers, return_json)
+
+    def add_hook(self, event, callback):
+        """This method registers a callback that is called with a :py:class:`freshpy.utils.hooks.RequestEvent` object.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event (``on_request_start``, ``on_response``, ``on_retry`` or ``on_throttle``)
+        :type event: str
+        :param callback: The function to call when the event occurs
+        :type callback: function
+        :returns: None
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        self.hooks.register(event, callback)
+
+    def remove_hook(self, event, callback):
+        """This method removes a callback that was registered for a request event.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event
+        :type event: str
+        :param callback: The function that was registered
+        :type callback: function
+        :returns: A Boolean value indicating if the callback was found and removed
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        return self.hooks.unregister(event, callback)
+
+    class Agents(object):
+        """This class includes asynchronous methods associated with Freshservice agents."""
+        def __init__(self, freshpy_object):
+            """This method initializes the :py:class:`freshpy.async_core.AsyncFreshPy.Agents` inner class object.
+
+            .. versionadded:: 2.1.0
+
+            :param freshpy_object: The core :py:class:`freshpy.AsyncFreshPy` object
+            :type freshpy_object: class[freshpy.AsyncFreshPy]
+            """
+            self.freshpy_object = freshpy_object
+
+        async def get_user_info(self, lookup_value):
+            """This method retrieves user data for a specific agent.
+
+            .. versionadded:: 2.1.0
+
+            :param lookup_value: An Agent ID or email address with which to look up the user
+            :type lookup_value: str, int
+            :returns: JSON data with the agent user data
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+            """
+            uri = agents_module._get_user_info_uri(lookup_value)
+            agent_data = await async_api.get_request_with_retries(self.freshpy_object, uri)
+            return agents_module._parse_user_info(agent_data)
+
+        async def get_all_agents(self, only_active=None, only_inactive=None):
+            """This method returns data for all agents with an optional filters for active or inactive users.
+
+            .. versionadded:: 2.1.0
+
+            :param only_active: Filters for only active agents when ``True``
+            :type only_active: bool, None
+            :param only_inactive: Filters for only inactive agents when ``True``
+            :type only_inactive: bool, None
+            :returns: JSON data with user data for all agents
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.InvalidFilterError`
+            """
+            uri = 'agents' + agents_module._get_active_filter_string(only_active, only_inactive)
+            return await async_api.get_request_with_retries(self.freshpy_object, uri)
+
+        async def iter_agents(self, only_active=None, only_inactive=None, per_page=api.MAX_PER_PAGE, prefetch=False):
+            """This method returns an asynchronous generator that yields agents one at a time while paginating.
+
+            .. versionadded:: 2.1.0
+
+            :param only_active: Filters for only active agents when ``True``
+            :type only_active: bool, None
+            :param only_inactive: Filters for only inactive agents when ``True``
+            :type only_inactive: bool, None
+            :param per_page: The number of results to request per page (``100`` by default)
+            :type per_page: str, int
+            :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+            :type prefetch: bool
+            :returns: An asynchronous generator that yields the JSON object for each agent
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+                     :py:exc:`freshpy.errors.exceptions.InvalidFilterError`
+            """
+            uri = 'agents' + agents_module._get_active_filter_string(only_active, only_inactive)
+            async for records in async_api.iterate_pages(self.freshpy_object, uri, 'agents', per_page=per_page,
+                                                         prefetch=prefetch):
+                for record in records:
+                    yield record
+
+        async def get_agent_id(self, email):
+            """This method retrieves the Agent ID value for a specific agent.
+
+            .. versionadded:: 2.1.0
+
+            :param email: The email address of the agent
+            :type email: str
+            :returns: The Agent ID of the agent as an integer
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.NotFoundResponseError`,
+                     :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+            """
+            uri = agents_module._get_email_lookup_uri(email)
+            agent_data = await async_api.get_request_with_retries(self.freshpy_object, uri)
+            return agents_module._parse_agent_id(agent_data)
+
+        async def get_assignment_history(self, lookup_value):
+            """This method retrieves the user assignment history for a specific agent.
+
+            .. versionadded:: 2.1.0
+
+            :param lookup_value: An Agent ID or email address with which to look up the user
+            :type lookup_value: str, int
+            :returns: JSON data for the assignment history for the agent
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.NotFoundResponseError`,
+                     :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+            """
+            if agents_module._is_agent_id(lookup_value):
+                agent_id = lookup_value
+            elif isinstance(lookup_value, str) and '@' in lookup_value:
+                agent_id = await self.get_agent_id(lookup_value)
+            else:
+                raise errors.exceptions.InvalidFieldError('An invalid Agent ID or email address was provided.')
+            uri = agents_module._get_assignment_history_uri(agent_id)
+            return await async_api.get_request_with_retries(self.freshpy_object, uri)
+
+    class Tickets(object):
+        """This class includes asynchronous methods associated with Freshservice tickets."""
+        def __init__(self, freshpy_object):
+            """This method initializes the :py:class:`freshpy.async_core.AsyncFreshPy.Tickets` inner class object.
+
+            .. versionadded:: 2.1.0
+
+            :param freshpy_object: The core :py:class:`freshpy.AsyncFreshPy` object
+            :type freshpy_object: class[freshpy.AsyncFreshPy]
+            """
+            self.freshpy_object = freshpy_object
+
+        async def get_ticket(self, ticket_number, include=None):
+            """This method returns the data for a specific ticket.
+
+            .. versionadded:: 2.1.0
+
+            :param ticket_number: The ticket number for which to return data
+            :type ticket_number: str, int
+            :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+            :type include: str, tuple, list, set, None
+            :returns: JSON data for the given ticket
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+            """
+            uri = tickets_module._get_ticket_uri(ticket_number, include)
+            return await async_api.get_request_with_retries(self.freshpy_object, uri)
+
+        async def get_tickets(self, include=None, predefined_filter=None, filters=None, filter_logic='AND',
+                              requester_id=None, requester_email=None, ticket_type=None, updated_since=None,
+                              ascending=None, descending=None, per_page=None, page=None):
+            """This method returns a sequence of tickets with optional filters.
+
+            .. versionadded:: 2.1.0
+
+            :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+            :type include: str, tuple, list, set, None
+            :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+            :type predefined_filter: str, None
+            :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+            :type filters: str, dict, class[freshpy.filters.Expression], None
+            :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+            :param requester_id: The numeric ID of a requester
+            :type requester_id: str, int, None
+            :param requester_email: The email address of a requester
+            :type requester_email: str, None
+            :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+            :type ticket_type: str, None
+            :param updated_since: A threshold date or timestamp (in UTC format) for when the ticket was last updated
+            :type updated_since: str, None
+            :param ascending: Determines if the tickets should be sorted in *ascending* order
+            :type ascending: bool, None
+            :param descending: Determines if the tickets should be sorted in *descending* order (default)
+            :type descending: bool, None
+            :param per_page: Displays a certain number of results per query
+            :type per_page: str, int, None
+            :param page: Returns a specific page number (used for paginated results)
+            :type page: str, int, None
+            :returns: A list of JSON objects for tickets
+            :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`
+            """
+            uri = tickets_module._get_tickets_uri(include, predefined_filter, filters, filter_logic, requester_id,
+                                                  requester_email, ticket_type, updated_since, ascending, descending,
+                                                  per_page, page)
+            return await async_api.get_request_with_retries(self.freshpy_object, uri)
+
+        async def iter_tickets(self, include=None, predefined_filter=None, filters=None, filter_logic='AND',
+                               requester_id=None, requester_email=None, ticket_type=None, updated_since=None,
+                               ascending=None, descending=None, per_page=api.MAX_PER_PAGE, page=None,
+                               prefetch=False):
+            """This method returns an asynchronous generator that yields tickets one at a time while paginating.
+
+            .. versionadded:: 2.1.0
+
+            :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+            :type include: str, tuple, list, set, None
+            :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+            :type predefined_filter: str, None
+            :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+            :type filters: str, dict, class[freshpy.filters.Expression], None
+            :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+            :param requester_id: The numeric ID of a requester
+            :type requester_id: str, int, None
+            :param requester_email: The email address of a requester
+            :type requester_email: str, None
+            :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+            :type ticket_type: str, None
+            :param updated_since: A threshold date or timestamp (in UTC format) for when the ticket was last updated
+            :type updated_since: str, None
+            :param ascending: Determines if the tickets should be sorted in *ascending* order
+            :type ascending: bool, None
+            :param descending: Determines if the tickets should be sorted in *descending* order (default)
+            :type descending: bool, None
+            :param per_page: The number of results to request per page (``100`` by default)
+            :type per_page: str, int
+            :param page: The page number on which to begin (``1`` by default)
+            :type page: str, int, None
+            :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+            :type prefetch: bool
+            :returns: An asynchronous generator that yields the JSON object for each ticket
+            :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
+            """
+            uri = tickets_module._get_tickets_uri(include, predefined_filter, filters, filter_logic, requester_id,
+                                                  requester_email, ticket_type, updated_since, ascending, descending)
+            per_page = None if filters else per_page
+            async for records in async_api.iterate_pages(self.freshpy_object, uri, 'tickets', per_page=per_page,
+                                                         start_page=page, prefetch=prefetch):
+                for record in records:
+                    yield record
+
+    async def __aenter__(self):
+        """This method allows the asynchronous core object to be used as an asynchronous context manager.
+
+        .. versionadded:: 2.1.0
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """This method closes the asynchronous core object when exiting an ``async with`` block.
+
+        .. versionadded:: 2.1.0
+        """
+        await self.close()
+
+    async def close(self):
+        """This method closes the non-blocking HTTP client and its open connections.
+
+        .. versionadded:: 2.1.0
+        """
+        client = getattr(self, 'client', None)
+        if client is not None:
+            await client.aclose()
+            self.client = None
@@ -4,13 +4,16 @@
 :Synopsis:          Defines the core freshpy object used to interface with the Freshservice API
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     29 Jan 2025
+:Modified Date:     18 Oct 2026
 """
 
+import threading
+
 from . import api, errors
 from . import tickets as tickets_module
 from . import agents as agents_module
-from .utils import log_utils, version
+from .utils import cache, columnar, json_backend, log_utils, metrics, rate_limit, retry, version
+from .utils import hooks as hooks_module
 
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
@@ -19,11 +22,60 @@ logger = log_utils.initialize_logging(__name__)
 class FreshPy(object):
     """This is the class for the core object leveraged in this library."""
     # Define the function that initializes the object instance (i.e. instantiates the object)
-    def __init__(self, domain=None, api_key=None):
+    def __init__(self, domain=None, api_key=None, pool_connections=api.DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=api.DEFAULT_POOL_MAXSIZE, keep_alive=True,
+                 prefetch_workers=api.DEFAULT_PREFETCH_WORKERS, rate_limit_per_minute=None, pace_requests=True,
+                 retry_policy=None, enable_cache=False, cache_size=cache.DEFAULT_MAX_SIZE, cache_ttls=None,
+                 json_decoder=None, hooks=None):
         """This method instantiates the core Fresh object.
 
+        .. versionchanged:: 2.1.0
+           The object now owns a pooled :py:class:`requests.Session` that is used for all API calls, which is
+           created when the first API call is made.
+
         .. versionadded:: 1.0.0
+
+        :param domain: The Freshservice domain (e.g. ``example.freshservice.com``)
+        :type domain: str
+        :param api_key: The API key to use for authentication
+        :type api_key: str
+        :param pool_connections: The number of connection pools to cache in the HTTP adapter
+        :type pool_connections: int
+        :param pool_maxsize: The maximum number of connections to keep open in each connection pool
+        :type pool_maxsize: int
+        :param keep_alive: Determines if connections should be kept alive and reused between calls (``True`` by default)
+        :type keep_alive: bool
+        :param prefetch_workers: The number of page requests to keep in flight when prefetching paginated results
+        :type prefetch_workers: int
+        :param rate_limit_per_minute: The number of API calls permitted per minute for the Freshservice plan
+                                      (learned from the rate limit response headers when not defined)
+        :type rate_limit_per_minute: int, None
+        :param pace_requests: Determines if API calls should be paced to remain within the rate limit
+                              (``True`` by default)
+        :type pace_requests: bool
+        :param retry_policy: The policy that defines how failed API calls are retried (a default policy with
+                             exponential backoff is used when not defined)
+        :type retry_policy: class[freshpy.utils.retry.RetryPolicy], None
+        :param enable_cache: Determines if the JSON data from GET requests should be cached (``False`` by default)
+        :type enable_cache: bool
+        :param cache_size: The maximum number of responses to store in the cache
+        :type cache_size: int
+        :param cache_ttls: The number of seconds cached responses remain valid keyed by endpoint (e.g. ``tickets``)
+        :type cache_ttls: dict, None
+        :param json_decoder: The JSON backend (``orjson``, ``ujson`` or ``json``) or a custom function used to decode
+                             API responses (the fastest backend that is installed is used when not defined)
+        :type json_decoder: str, function, None
+        :param hooks: The callbacks for the ``on_request_start``, ``on_response``, ``on_retry`` and ``on_throttle``
+                      request events keyed by event name, where each value is a function or a list of functions
+        :type hooks: dict, None
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`,
+                 :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+                 :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
         """
+        # Define the session attribute early so that the instance can always be closed
+        self._session = None
+        self._session_lock = threading.Lock()
+
         # Define the current version
         self.version = version.get_full_version()
 
@@ -42,6 +94,34 @@ class FreshPy(object):
         # Define the API key
         self.api_key = api_key
 
+        # Define the function used to decode the JSON data in API responses
+        self.json_decoder = json_backend.get_decoder(json_decoder)
+
+        # Define the options for the pooled HTTP session, which is created by the first API call
+        self._session_options = {'pool_connections': pool_connections, 'pool_maxsize': pool_maxsize,
+                                 'keep_alive': keep_alive}
+
+        # Define the concurrency level used when prefetching paginated results
+        self.prefetch_workers = prefetch_workers
+
+        # Define the token bucket scheduler that paces API calls according to the rate limit
+        self.rate_limiter = rate_limit.RateLimiter(rate_limit_per_minute) if pace_requests else None
+
+        # Define the policy that determines how failed API calls are retried
+        self.retry_policy = retry_policy if retry_policy else retry.RetryPolicy()
+
+        # Define the counters that measure the bytes transferred for API responses
+        self.transfer_stats = metrics.TransferStats()
+
+        # Define the callbacks that are notified of each request attempt along with its timing breakdown
+        self.hooks = hooks_module.HookManager(hooks)
+
+        # Define the optional in-memory response cache
+        self.cache = cache.ResponseCache(cache_size, endpoint_ttls=cache_ttls) if enable_cache else None
+
+        # Define the optional agent directory used to resolve agents without API calls
+        self.agent_directory = None
+
         # Import inner object classes so their methods can be called from the primary object
         self.agents = self._import_agents_class()
         self.tickets = self._import_tickets_class()
@@ -60,6 +140,34 @@ class FreshPy(object):
         """
         return FreshPy.Tickets(self)
 
+    @property
+    def session(self):
+        """This property returns the pooled HTTP session used for all API calls and creates it on first use.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: Deferring the creation of the session also defers the import of the :py:mod:`requests` package,
+                  which reduces the startup time of short-lived processes that never perform an API call.
+
+        :returns: The :py:class:`requests.Session` object
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = api.create_session(self.api_key, **self._session_options)
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        """This method replaces the pooled HTTP session used for all API calls.
+
+        .. versionadded:: 2.1.0
+
+        :param session: The :py:class:`requests.Session` object (or ``None`` to create a new session on next use)
+        :returns: None
+        """
+        self._session = session
+
     def get(self, uri, headers=None, return_json=True, verify_ssl=True):
         """This method performs a GET request against the Freshservice API with multiple retries on failure.
 
@@ -81,6 +189,57 @@ class FreshPy(object):
         """
         return api.get_request_with_retries(self, uri, headers, return_json, verify_ssl=verify_ssl)
 
+    def add_hook(self, event, callback):
+        """This method registers a callback that is called with a :py:class:`freshpy.utils.hooks.RequestEvent` object.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event (``on_request_start``, ``on_response``, ``on_retry`` or ``on_throttle``)
+        :type event: str
+        :param callback: The function to call when the event occurs
+        :type callback: function
+        :returns: None
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        self.hooks.register(event, callback)
+
+    def remove_hook(self, event, callback):
+        """This method removes a callback that was registered for a request event.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event
+        :type event: str
+        :param callback: The function that was registered
+        :type callback: function
+        :returns: A Boolean value indicating if the callback was found and removed
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        return self.hooks.unregister(event, callback)
+
+    def get_cache_stats(self):
+        """This method returns the hit, miss and eviction counters for the response cache.
+
+        .. versionadded:: 2.1.0
+
+        :returns: A dictionary with the cache statistics or ``None`` if the cache is not enabled
+        """
+        return self.cache.get_stats() if self.cache is not None else None
+
+    def invalidate_cache(self, uri_prefix=None):
+        """This method removes cached responses whose URI begins with a given prefix, or all cached responses.
+
+        .. versionadded:: 2.1.0
+
+        :param uri_prefix: The URI prefix relative to the API base URL (e.g. ``tickets/123`` or ``agents``)
+        :type uri_prefix: str, None
+        :returns: The number of cached responses that were removed as an integer
+        """
+        if self.cache is None:
+            return 0
+        prefix = None if uri_prefix is None else self.base_url + uri_prefix.lstrip('/')
+        return self.cache.invalidate(prefix)
+
     class Agents(object):
         """This class includes methods associated with Freshservice agents."""
         def __init__(self, freshpy_object):
@@ -93,24 +252,34 @@ class FreshPy(object):
             """
             self.freshpy_object = freshpy_object
 
-        def get_user_info(self, lookup_value, verify_ssl=True):
+        def get_user_info(self, lookup_value, verify_ssl=True, as_records=False):
             """This function retrieves user data for a specific agent.
 
+            .. versionchanged:: 2.1.0
+               Added the ``as_records`` parameter.
+
             .. versionadded:: 2.0.0
 
             :param lookup_value: An Agent ID or email address with which to look up the user
             :tyype lookup_value: str, int
             :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
             :type verify_ssl: bool
-            :returns: JSON data with the agent user data
+            :param as_records: Determines if compact :py:class:`freshpy.records.Agent` records should be returned rather
+                               than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: JSON data (or a record) with the agent user data
             :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
                      :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
             """
-            return agents_module.get_user_info(self.freshpy_object, lookup_value=lookup_value, verify_ssl=verify_ssl)
+            return agents_module.get_user_info(self.freshpy_object, lookup_value=lookup_value, verify_ssl=verify_ssl,
+                                               as_records=as_records)
 
-        def get_all_agents(self, only_active=None, only_inactive=None, verify_ssl=True):
+        def get_all_agents(self, only_active=None, only_inactive=None, verify_ssl=True, as_records=False):
             """This function returns data for all agents with an optional filters for active or inactive users.
 
+            .. versionchanged:: 2.1.0
+               Added the ``as_records`` parameter.
+
             .. versionadded:: 2.0.0
 
             :param only_active: Filters for only active agents when ``True``
@@ -119,11 +288,67 @@ class FreshPy(object):
             :type only_inactive: bool, None
             :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
             :type verify_ssl: bool
-            :returns: JSON data with user data for all agents
+            :param as_records: Determines if compact :py:class:`freshpy.records.Agent` records should be returned rather
+                               than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: JSON data (or a list of records) with user data for all agents
             :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
             """
             return agents_module.get_all_agents(self.freshpy_object, only_active=only_active,
-                                                only_inactive=only_inactive, verify_ssl=verify_ssl)
+                                                only_inactive=only_inactive, verify_ssl=verify_ssl,
+                                                as_records=as_records)
+
+        def iter_agents(self, only_active=None, only_inactive=None, per_page=api.MAX_PER_PAGE, prefetch=False,
+                        verify_ssl=True, stream=False, as_records=False):
+            """This method returns a generator that yields agents one at a time while automatically paginating.
+
+            .. versionadded:: 2.1.0
+
+            :param only_active: Filters for only active agents when ``True``
+            :type only_active: bool, None
+            :param only_inactive: Filters for only inactive agents when ``True``
+            :type only_inactive: bool, None
+            :param per_page: The number of results to request per page (``100`` by default)
+            :type per_page: str, int
+            :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+            :type prefetch: bool
+            :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+            :type verify_ssl: bool
+            :param stream: Determines if each page should be decoded incrementally as it is downloaded, which lowers the
+                           peak memory usage for large pages but disables ``prefetch`` (``False`` by default)
+            :type stream: bool
+            :param as_records: Determines if compact :py:class:`freshpy.records.Agent` records should be returned rather
+                               than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: A generator that yields the JSON object (or record) for each agent
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`,
+                     :py:exc:`freshpy.errors.exceptions.InvalidFilterError`
+            """
+            return agents_module.iter_agents(self.freshpy_object, only_active=only_active, only_inactive=only_inactive,
+                                             per_page=per_page, prefetch=prefetch, verify_ssl=verify_ssl,
+                                             stream=stream, as_records=as_records)
+
+        def build_directory(self, refresh_interval=agents_module.DEFAULT_DIRECTORY_REFRESH_INTERVAL, only_active=None,
+                            verify_ssl=True):
+            """This method builds an agent directory that is used to resolve agent lookups without API calls.
+
+            .. versionadded:: 2.1.0
+
+            :param refresh_interval: The number of seconds after which the directory is refreshed (or ``None`` to
+                                     only refresh on demand)
+            :type refresh_interval: int, float, None
+            :param only_active: Filters for only active agents when ``True``
+            :type only_active: bool, None
+            :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+            :type verify_ssl: bool
+            :returns: The :py:class:`freshpy.agents.AgentDirectory` object
+            :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
+            """
+            self.freshpy_object.agent_directory = agents_module.AgentDirectory(
+                self.freshpy_object, refresh_interval=refresh_interval, only_active=only_active, verify_ssl=verify_ssl)
+            return self.freshpy_object.agent_directory
 
         def get_agent_id(self, email, verify_ssl=True):
             """This function retrieves the Agent ID value for a specific agent.
@@ -170,9 +395,12 @@ class FreshPy(object):
             """
             self.freshpy_object = freshpy_object
 
-        def get_ticket(self, ticket_number, include=None, verify_ssl=True):
+        def get_ticket(self, ticket_number, include=None, verify_ssl=True, as_records=False):
             """This method returns the data for a specific ticket.
 
+            .. versionchanged:: 2.1.0
+               Added the ``as_records`` parameter.
+
             .. versionchanged:: 2.0.0
                Updated the function call to use keyword arguments.
 
@@ -187,17 +415,49 @@ class FreshPy(object):
             :type include: str, tuple, list, set, None
             :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
             :type verify_ssl: bool
-            :returns: JSON data for the given ticket
+            :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned
+                               rather than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: JSON data (or a record) for the given ticket
             :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
             """
             return tickets_module.get_ticket(self.freshpy_object, ticket_number=ticket_number, include=include,
-                                             verify_ssl=verify_ssl)
+                                             verify_ssl=verify_ssl, as_records=as_records)
+
+        def get_tickets_by_ids(self, ticket_numbers, include=None, max_workers=None, verify_ssl=True,
+                               as_records=False):
+            """This method retrieves the data for multiple tickets concurrently using a bounded pool of workers.
+
+            .. versionadded:: 2.1.0
+
+            :param ticket_numbers: The ticket numbers for which to return data
+            :type ticket_numbers: list, tuple, set
+            :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+            :type include: str, tuple, list, set, None
+            :param max_workers: The maximum number of concurrent requests (defaults to the ``prefetch_workers``
+                                value defined in the core object)
+            :type max_workers: int, None
+            :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+            :type verify_ssl: bool
+            :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned
+                               rather than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: A dictionary with the ticket data keyed by ticket number (``tickets``), a list of the ticket
+                      numbers that were not found (``not_found``) and the error messages keyed by ticket number
+                      (``errors``)
+            """
+            return tickets_module.get_tickets_by_ids(self.freshpy_object, ticket_numbers=ticket_numbers,
+                                                     include=include, max_workers=max_workers, verify_ssl=verify_ssl,
+                                                     as_records=as_records)
 
         def get_tickets(self, include=None, predefined_filter=None, filters=None, filter_logic='AND', requester_id=None,
                         requester_email=None, ticket_type=None, updated_since=None, ascending=None, descending=None,
-                        per_page=None, page=None, verify_ssl=True):
+                        per_page=None, page=None, verify_ssl=True, as_records=False):
             """This method returns a sequence of tickets with optional filters.
 
+            .. versionchanged:: 2.1.0
+               Added the ``as_records`` parameter.
+
             .. versionchanged:: 1.1.0
                Added the ability to disable SSL verification on API calls.
 
@@ -208,7 +468,7 @@ class FreshPy(object):
             :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
             :type predefined_filter: str, None
             :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
-            :type filters: str, dict, None
+            :type filters: str, dict, class[freshpy.filters.Expression], None
             :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
             :param requester_id: The numeric ID of a requester
             :param requester_id: The numeric ID of a requester
@@ -229,7 +489,10 @@ class FreshPy(object):
             :type page: str, int, None
             :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
             :type verify_ssl: bool
-            :returns: A list of JSON objects for tickets
+            :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned
+                               rather than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: A list of JSON objects (or records) for tickets
             :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
                      :py:exc:`freshpy.errors.exceptions.APIConnectionError`
             """
@@ -237,7 +500,175 @@ class FreshPy(object):
                                               filters=filters, filter_logic=filter_logic, requester_id=requester_id,
                                               per_page=per_page, page=page, requester_email=requester_email,
                                               ticket_type=ticket_type, updated_since=updated_since, ascending=ascending,
-                                              descending=descending, verify_ssl=verify_ssl)
+                                              descending=descending, verify_ssl=verify_ssl, as_records=as_records)
+
+        def get_filtered_tickets(self, filters=None, filter_logic='AND', start_date=None, end_date=None,
+                                 split_values=None, max_workers=None, verify_ssl=True, as_records=False):
+            """This method retrieves every ticket that matches a filter query by splitting queries past the result cap.
+
+            .. versionadded:: 2.1.0
+
+            :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+            :type filters: str, dict, class[freshpy.filters.Expression], None
+            :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+            :type filter_logic: str
+            :param start_date: The earliest creation date (``YYYY-MM-DD``) used when splitting queries
+                               (``2010-01-01`` by default)
+            :type start_date: str, datetime.date, None
+            :param end_date: The latest creation date (``YYYY-MM-DD``) used when splitting queries (the current UTC
+                             date by default)
+            :type end_date: str, datetime.date, None
+            :param split_values: The values keyed by field used to split a single-day query that still exceeds the cap
+            :type split_values: dict, None
+            :param max_workers: The maximum number of concurrent requests (defaults to the ``prefetch_workers`` value)
+            :type max_workers: int, None
+            :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+            :type verify_ssl: bool
+            :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned
+                               rather than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: A list of JSON objects (or records) for the tickets sorted by ticket number
+            :raises: :py:exc:`freshpy.errors.exceptions.InvalidFilterLogicError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
+            """
+            return tickets_module.get_filtered_tickets(self.freshpy_object, filters=filters, filter_logic=filter_logic,
+                                                       start_date=start_date, end_date=end_date,
+                                                       split_values=split_values, max_workers=max_workers,
+                                                       verify_ssl=verify_ssl, as_records=as_records)
+
+        def iter_tickets(self, include=None, predefined_filter=None, filters=None, filter_logic='AND',
+                         requester_id=None, requester_email=None, ticket_type=None, updated_since=None,
+                         ascending=None, descending=None, per_page=api.MAX_PER_PAGE, page=None, prefetch=False,
+                         verify_ssl=True, stream=False, as_records=False):
+            """This method returns a generator that yields tickets one at a time while automatically paginating.
+
+            .. versionadded:: 2.1.0
+
+            :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+            :type include: str, tuple, list, set, None
+            :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+            :type predefined_filter: str, None
+            :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+            :type filters: str, dict, class[freshpy.filters.Expression], None
+            :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+            :param requester_id: The numeric ID of a requester
+            :type requester_id: str, int, None
+            :param requester_email: The email address of a requester
+            :type requester_email: str, None
+            :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+            :type ticket_type: str, None
+            :param updated_since: A threshold date or timestamp (in UTC format) for when the ticket was last updated
+            :type updated_since: str, None
+            :param ascending: Determines if the tickets should be sorted in *ascending* order
+            :type ascending: bool, None
+            :param descending: Determines if the tickets should be sorted in *descending* order (default)
+            :type descending: bool, None
+            :param per_page: The number of results to request per page (``100`` by default)
+            :type per_page: str, int
+            :param page: The page number on which to begin (``1`` by default)
+            :type page: str, int, None
+            :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+            :type prefetch: bool
+            :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+            :type verify_ssl: bool
+            :param stream: Determines if each page should be decoded incrementally as it is downloaded, which lowers the
+                           peak memory usage for large pages but disables ``prefetch`` (``False`` by default),
+                           where a custom JSON decoder function decodes each ticket (see
+                           :py:func:`freshpy.api.iterate_records`)
+            :type stream: bool
+            :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned
+                               rather than JSON objects (``False`` by default)
+            :type as_records: bool
+            :returns: A generator that yields the JSON object (or record) for each ticket
+            :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
+            """
+            return tickets_module.iter_tickets(self.freshpy_object, include=include,
+                                               predefined_filter=predefined_filter, filters=filters,
+                                               filter_logic=filter_logic, requester_id=requester_id,
+                                               requester_email=requester_email, ticket_type=ticket_type,
+                                               updated_since=updated_since, ascending=ascending,
+                                               descending=descending, per_page=per_page, page=page,
+                                               prefetch=prefetch, verify_ssl=verify_ssl, stream=stream,
+                                               as_records=as_records)
+
+        def export_columnar(self, file_path=None, file_format=None, columns=None,
+                            chunk_size=columnar.DEFAULT_CHUNK_SIZE, include=None, predefined_filter=None,
+                            filters=None, filter_logic='AND', requester_id=None, requester_email=None,
+                            ticket_type=None, updated_since=None, ascending=None, descending=None, prefetch=False,
+                            stream=False, verify_ssl=True):
+            """This method exports tickets in a columnar format by streaming pages into column buffers in chunks.
+
+            .. versionadded:: 2.1.0
+
+            :param file_path: The path to the file that will be written (required for ``parquet`` and ``feather``)
+            :type file_path: str, None
+            :param file_format: The export format (``parquet``, ``feather``, ``arrow`` or ``numpy``), which defaults
+                                to ``parquet`` (or ``arrow`` without a file path) when :py:mod:`pyarrow` is installed
+                                and ``numpy`` otherwise
+            :type file_format: str, None
+            :param columns: The column types keyed by field name or a list of field names (the default ticket
+                            columns are used when not defined)
+            :type columns: dict, list, tuple, None
+            :param chunk_size: The number of tickets buffered before each chunk is converted and written
+            :type chunk_size: int
+            :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+            :type include: str, tuple, list, set, None
+            :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+            :type predefined_filter: str, None
+            :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+            :type filters: str, dict, class[freshpy.filters.Expression], None
+            :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+            :param requester_id: The numeric ID of a requester
+            :type requester_id: str, int, None
+            :param requester_email: The email address of a requester
+            :type requester_email: str, None
+            :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+            :type ticket_type: str, None
+            :param updated_since: A threshold date or timestamp (in UTC format) for when the ticket was last updated
+            :type updated_since: str, None
+            :param ascending: Determines if the tickets should be sorted in *ascending* order
+            :type ascending: bool, None
+            :param descending: Determines if the tickets should be sorted in *descending* order (default)
+            :type descending: bool, None
+            :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+            :type prefetch: bool
+            :param stream: Determines if each page should be decoded incrementally as it is downloaded
+            :type stream: bool
+            :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+            :type verify_ssl: bool
+            :returns: The number of tickets written when a file path is supplied, otherwise a
+                      :py:class:`pyarrow.Table` or a dictionary of :py:class:`numpy.ndarray` objects
+            :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+                     :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`,
+                     :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`,
+                     :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                     :py:exc:`freshpy.errors.exceptions.GETRequestError`
+            """
+            return tickets_module.export_columnar(self.freshpy_object, file_path=file_path, file_format=file_format,
+                                                  columns=columns, chunk_size=chunk_size, include=include,
+                                                  predefined_filter=predefined_filter, filters=filters,
+                                                  filter_logic=filter_logic, requester_id=requester_id,
+                                                  requester_email=requester_email, ticket_type=ticket_type,
+                                                  updated_since=updated_since, ascending=ascending,
+                                                  descending=descending, prefetch=prefetch, stream=stream,
+                                                  verify_ssl=verify_ssl)
+
+    def __enter__(self):
+        """This method allows the core object to be used as a context manager.
+
+        .. versionadded:: 2.1.0
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """This method closes the core object when exiting a ``with`` block.
+
+        .. versionadded:: 2.1.0
+        """
+        self.close()
 
     def __del__(self):
         """This method fully destroys the instance.
@@ -249,5 +680,12 @@ class FreshPy(object):
     def close(self):
         """This core method destroys the instance.
 
+        .. versionchanged:: 2.1.0
+           The pooled HTTP session and its open connections are now closed when the session has been created.
+
         .. versionadded:: 1.0.0
         """
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
+            self._session = None
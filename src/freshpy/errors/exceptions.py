@@ -4,7 +4,7 @@
 :Synopsis:          Collection of exception classes relating to the freshpy library
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     29 Jan 2025
+:Modified Date:     18 Oct 2026
 """
 
 #################
@@ -83,6 +83,23 @@ class DataMismatchError(FreshPyError):
         super().__init__(*args)
 
 
+class InvalidDropPolicyError(FreshPyError):
+    """This exception is used when an unsupported drop policy is defined for a bounded logging queue.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "An invalid drop policy was provided."
+        custom_msg = "The drop policy 'X' is invalid."
+        if not (args or kwargs):
+            args = (default_msg,)
+        elif 'value' in kwargs:
+            custom_msg = custom_msg.replace('X', str(kwargs['value']))
+            args = (custom_msg,)
+        super().__init__(*args)
+
+
 class InvalidFieldError(FreshPyError):
     """This exception is used when an invalid field is provided.
 
@@ -99,6 +116,23 @@ class InvalidFieldError(FreshPyError):
         super().__init__(*args)
 
 
+class InvalidHookEventError(FreshPyError):
+    """This exception is used when a callback is registered for an unsupported request lifecycle event.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "An invalid hook event was provided."
+        custom_msg = "The hook event 'X' is invalid."
+        if not (args or kwargs):
+            args = (default_msg,)
+        elif 'value' in kwargs:
+            custom_msg = custom_msg.replace('X', kwargs['value'])
+            args = (custom_msg,)
+        super().__init__(*args)
+
+
 class InvalidFilterError(FreshPyError):
     """This exception is used when an invalid filter for an API call is provided.
 
@@ -128,6 +162,22 @@ class InvalidURLError(FreshPyError):
         super().__init__(*args)
 
 
+class MissingDependencyError(FreshPyError):
+    """This exception is used when an optional package required by a feature is not installed.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, *args, **kwargs):
+        """This method defines the default or custom message for the exception."""
+        default_msg = "A package required for this feature is not installed."
+        custom_msg = "The 'X' package is required for this feature and can be installed using 'pip install X'."
+        if not (args or kwargs):
+            args = (default_msg,)
+        elif 'package' in kwargs:
+            args = (custom_msg.replace('X', kwargs['package']),)
+        super().__init__(*args)
+
+
 class MissingRequiredDataError(FreshPyError):
     """This exception is used when a function or method is missing one or more required arguments.
 
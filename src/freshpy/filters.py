@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.filters
+:Synopsis:          Expression language for ticket filter queries that compiles once into an encoded URI segment
+:Usage:             ``from freshpy.filters import F``
+:Example:           ``query = F.status.in_([2, 3]) & (F.priority >= 3)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+from . import errors
+from .utils import core_utils
+
+# Define constants
+SUPPORTED_FIELDS = ['agent_id', 'group_id', 'priority', 'status', 'impact', 'urgency', 'tag', 'due_by', 'fr_due_by',
+                    'created_at']
+DATE_FORMAT = '%Y-%m-%d'
+LOGIC_OPERATORS = ['AND', 'OR']
+
+
+class Expression(ABC):
+    """This abstract class is the base for filter expressions, which can be combined using the ``&`` and ``|``
+    operators.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Expressions are immutable, so the query string and encoded URI segment are only constructed the first
+              time they are needed and then reused whenever the same expression is supplied again.
+    """
+    __slots__ = ('_query', '_uri_segment')
+
+    def __init__(self):
+        """This method instantiates the expression with empty compiled values.
+
+        .. versionadded:: 2.1.0
+        """
+        self._query = None
+        self._uri_segment = None
+
+    def __and__(self, other):
+        """This method combines two expressions using the ``AND`` operator.
+
+        .. versionadded:: 2.1.0
+        """
+        return Group('AND', [self, _validate_expression(other)])
+
+    def __or__(self, other):
+        """This method combines two expressions using the ``OR`` operator.
+
+        .. versionadded:: 2.1.0
+        """
+        return Group('OR', [self, _validate_expression(other)])
+
+    def __str__(self):
+        """This method returns the query string for the expression.
+
+        .. versionadded:: 2.1.0
+        """
+        return self.query
+
+    def __repr__(self):
+        """This method returns a representation of the expression that includes its query string.
+
+        .. versionadded:: 2.1.0
+        """
+        return f'{type(self).__name__}({self.query!r})'
+
+    @property
+    def query(self):
+        """This property returns the raw (unencoded) query string, which is constructed on first access.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The query string
+        """
+        if self._query is None:
+            self._query = self._compile()
+        return self._query
+
+    @property
+    def uri_segment(self):
+        """This property returns the URI segment with the encoded query, which is constructed on first access.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The URI segment (e.g. ``/filter?query="priority%3A%3E3"``)
+        """
+        if self._uri_segment is None:
+            self._uri_segment = f'/filter?query="{core_utils.url_encode(self.query)}"'
+        return self._uri_segment
+
+    @abstractmethod
+    def _compile(self, _parent_operator=None):
+        """This method constructs the query string for the expression and must be implemented by each subclass.
+
+        .. versionadded:: 2.1.0
+
+        :param _parent_operator: The logic operator of the enclosing group (if any)
+        :type _parent_operator: str, None
+        :returns: The query string
+        """
+
+
+class Condition(Expression):
+    """This class represents a single comparison between a field and a value.
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = ('field', 'operator', 'value')
+
+    def __init__(self, field, operator, value):
+        """This method instantiates the condition.
+
+        .. versionadded:: 2.1.0
+
+        :param field: The name of the field
+        :type field: str
+        :param operator: The comparison operator (``:`` for equality, ``:>`` for greater than or equal to and ``:<``
+                         for less than or equal to)
+        :type operator: str
+        :param value: The value to which the field is compared
+        :type value: str, int, bool, datetime.date, datetime.datetime, None
+        """
+        super().__init__()
+        self.field = field
+        self.operator = operator
+        self.value = value
+
+    def _compile(self, _parent_operator=None):
+        """This method constructs the query string for the condition.
+
+        .. versionadded:: 2.1.0
+
+        :param _parent_operator: The logic operator of the enclosing group (if any)
+        :type _parent_operator: str, None
+        :returns: The query string
+        """
+        return f'{self.field}{self.operator}{format_value(self.value)}'
+
+
+class Group(Expression):
+    """This class represents a group of expressions joined by a single logic operator.
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = ('operator', 'expressions')
+
+    def __init__(self, operator, expressions):
+        """This method instantiates the group and flattens any nested groups that use the same operator.
+
+        .. versionadded:: 2.1.0
+
+        :param operator: The logic operator (``AND`` or ``OR``)
+        :type operator: str
+        :param expressions: The expressions in the group
+        :type expressions: list, tuple
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidFilterLogicError`
+        """
+        super().__init__()
+        operator = operator.upper()
+        if operator not in LOGIC_OPERATORS:
+            raise errors.exceptions.InvalidFilterLogicError(value=operator)
+        self.operator = operator
+        flattened = []
+        for expression in expressions:
+            if isinstance(expression, Group) and expression.operator == operator:
+                flattened.extend(expression.expressions)
+            else:
+                flattened.append(_validate_expression(expression))
+        self.expressions = tuple(flattened)
+
+    def _compile(self, _parent_operator=None):
+        """This method constructs the query string for the group and adds parentheses when it is nested.
+
+        .. versionadded:: 2.1.0
+
+        :param _parent_operator: The logic operator of the enclosing group (if any)
+        :type _parent_operator: str, None
+        :returns: The query string
+        """
+        _query = f' {self.operator} '.join(_expression._compile(self.operator) for _expression in self.expressions)
+        if _parent_operator and _parent_operator != self.operator and len(self.expressions) > 1:
+            _query = f'({_query})'
+        return _query
+
+
+class Field(object):
+    """This class represents a filter field that produces conditions through comparison operators and methods.
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        """This method instantiates the field after verifying that it is supported by the filter endpoint.
+
+        .. versionadded:: 2.1.0
+
+        :param name: The name of the field (e.g. ``priority``)
+        :type name: str
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+        """
+        if name not in SUPPORTED_FIELDS:
+            raise errors.exceptions.InvalidFieldError(val=name)
+        self.name = name
+
+    def __eq__(self, value):
+        """This method returns a condition where the field equals a value.
+
+        .. versionadded:: 2.1.0
+        """
+        return Condition(self.name, ':', value)
+
+    def __ge__(self, value):
+        """This method returns a condition where the field is greater than or equal to a value.
+
+        .. versionadded:: 2.1.0
+        """
+        return Condition(self.name, ':>', value)
+
+    def __le__(self, value):
+        """This method returns a condition where the field is less than or equal to a value.
+
+        .. versionadded:: 2.1.0
+        """
+        return Condition(self.name, ':<', value)
+
+    __hash__ = None
+
+    def __repr__(self):
+        """This method returns a representation of the field.
+
+        .. versionadded:: 2.1.0
+        """
+        return f'Field({self.name!r})'
+
+    def in_(self, values):
+        """This method returns a group where the field equals any of the supplied values.
+
+        .. versionadded:: 2.1.0
+
+        :param values: The values to which the field is compared
+        :type values: list, tuple, set
+        :returns: The :py:class:`freshpy.filters.Group` object (or a single condition when there is one value)
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`
+        """
+        conditions = [Condition(self.name, ':', value) for value in values]
+        if not conditions:
+            raise errors.exceptions.MissingRequiredDataError(param='values')
+        return conditions[0] if len(conditions) == 1 else Group('OR', conditions)
+
+    def between(self, start, end):
+        """This method returns a group where the field is within an inclusive range of values.
+
+        .. versionadded:: 2.1.0
+
+        :param start: The lowest value in the range
+        :type start: str, int, datetime.date, datetime.datetime
+        :param end: The highest value in the range
+        :type end: str, int, datetime.date, datetime.datetime
+        :returns: The :py:class:`freshpy.filters.Group` object
+        """
+        return Group('AND', [Condition(self.name, ':>', start), Condition(self.name, ':<', end)])
+
+
+class FieldFactory(object):
+    """This class creates :py:class:`freshpy.filters.Field` objects through attribute access (e.g. ``F.status``).
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        """This method returns the field with a given name.
+
+        .. versionadded:: 2.1.0
+
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return Field(name)
+
+    def __getitem__(self, name):
+        """This method returns the field with a given name (e.g. ``F['status']``).
+
+        .. versionadded:: 2.1.0
+
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidFieldError`
+        """
+        return Field(name)
+
+
+# Define the field factory used to construct expressions
+F = FieldFactory()
+
+
+def format_value(value):
+    """This function formats a value for use in a filter query string.
+
+    .. versionadded:: 2.1.0
+
+    :param value: The value to format
+    :type value: str, int, float, bool, datetime.date, datetime.datetime, None
+    :returns: The formatted value (where strings and dates are enclosed in single quotes)
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        value = value.strftime(DATE_FORMAT)
+    return f"'{value}'"
+
+
+def _validate_expression(_expression):
+    """This function verifies that an object is a filter expression.
+
+    .. versionadded:: 2.1.0
+
+    :param _expression: The object to verify
+    :returns: The expression
+    :raises: :py:exc:`TypeError`
+    """
+    if not isinstance(_expression, Expression):
+        raise TypeError(f"Filter expressions cannot be combined with '{type(_expression).__name__}' objects")
+    return _expression
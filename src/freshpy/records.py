@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.records
+:Synopsis:          Compact ``__slots__`` records for tickets and agents that use less memory than dictionaries
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import re
+import json
+import math
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from .utils import core_utils
+
+# Define constants
+TICKET_FIELDS = (
+    'id', 'subject', 'type', 'status', 'priority', 'source', 'urgency', 'impact', 'category', 'sub_category',
+    'item_category', 'group_id', 'department_id', 'requester_id', 'requested_for_id', 'responder_id', 'workspace_id',
+    'email_config_id', 'due_by', 'fr_due_by', 'created_at', 'updated_at', 'is_escalated', 'fr_escalated', 'deleted',
+    'spam', 'cc_emails', 'fwd_emails', 'reply_cc_emails', 'to_emails', 'tags', 'tasks_dependency_type',
+)
+AGENT_FIELDS = (
+    'id', 'first_name', 'last_name', 'email', 'active', 'occasional', 'job_title', 'work_phone_number',
+    'mobile_phone_number', 'department_ids', 'reporting_manager_id', 'location_id', 'time_zone', 'time_format',
+    'language', 'scoreboard_level_id', 'member_of', 'observer_of', 'group_ids', 'has_logged_in', 'last_login_at',
+    'last_active_at', 'created_at', 'updated_at',
+)
+TIMESTAMP_LENGTH = 20
+TIMESTAMP_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?'
+                               r'(Z|[+-]\d{2}:?\d{2})?')
+MICROSECONDS_PER_SECOND = 1000000
+EXTRA_KEYS_TABLE = '_extra_keys'
+EXTRA_COMPRESSION_THRESHOLD = 256
+EXTRA_COMPRESSION_LEVEL = 1
+
+
+class Record(object):
+    """This class is the base for the compact records that replace the JSON objects returned by the API.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Known fields are parsed once into slots, where timestamps become ``float`` epoch seconds (UTC) and lists
+              become tuples. Any other fields are kept as a compact JSON array of their values (with the tuple of
+              their names shared between records), which is compressed when it exceeds 256 bytes, and only decoded
+              when accessed (e.g. ``ticket.custom_fields`` or ``ticket.get('description')``).
+
+    .. note:: Every ISO-8601 timestamp (including those with fractional seconds or a UTC offset) is stored as a
+              ``float`` so that timestamp fields can always be compared and subtracted across records, and only
+              values that are not timestamps (e.g. ``None``) are kept as-is. The :py:meth:`to_dict` method returns
+              the timestamps in the ``%Y-%m-%dT%H:%M:%SZ`` format used by the API, with milliseconds or
+              microseconds when the original value included fractional seconds.
+
+    .. tip:: A timestamp field can be converted into a :py:class:`datetime.datetime` object using
+             ``datetime.fromtimestamp(ticket.created_at, timezone.utc)``.
+    """
+    __slots__ = ('_extra_keys', '_extra')
+    FIELDS = ()
+    TIMESTAMP_FIELDS = frozenset()
+    SHARED_FIELDS = frozenset()
+    DATA_KEY = None
+    ITEM_KEY = None
+
+    def __init__(self, data, shared_values=None):
+        """This method instantiates the record from the JSON object returned by the API.
+
+        .. versionadded:: 2.1.0
+
+        :param data: The JSON object for the ticket or agent
+        :type data: dict
+        :param shared_values: A dictionary of intern tables keyed by field used to share identical values (e.g. group
+                              IDs) between records
+        :type shared_values: dict, None
+        """
+        extra = dict(data)
+        for field in self.FIELDS:
+            if field not in extra:
+                continue
+            value = extra.pop(field)
+            if isinstance(value, list):
+                value = tuple(value)
+            elif field in self.TIMESTAMP_FIELDS:
+                value = _parse_timestamp(value)
+            elif shared_values is not None and field in self.SHARED_FIELDS and isinstance(value, (str, int)):
+                value = _intern(shared_values, field, value)
+            setattr(self, field, value)
+        if not extra:
+            self._extra_keys = self._extra = None
+            return
+        extra_keys = tuple(extra)
+        self._extra_keys = extra_keys if shared_values is None else _intern(shared_values, EXTRA_KEYS_TABLE, extra_keys)
+        extra_values = json.dumps(list(extra.values()), separators=(',', ':')).encode('utf-8')
+        if len(extra_values) > EXTRA_COMPRESSION_THRESHOLD:
+            extra_values = zlib.compress(extra_values, EXTRA_COMPRESSION_LEVEL)
+        self._extra = extra_values
+
+    def __getattr__(self, name):
+        """This method returns the value of a field that is not stored in a slot.
+
+        .. versionadded:: 2.1.0
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in self.FIELDS:
+            return None
+        extra = self.extra
+        if name in extra:
+            return extra[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __eq__(self, other):
+        """This method compares two records using their field values.
+
+        .. versionadded:: 2.1.0
+        """
+        if not isinstance(other, Record):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        """This method returns a concise representation of the record.
+
+        .. versionadded:: 2.1.0
+        """
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+    def __getstate__(self):
+        """This method returns the stored values so that records can be pickled and copied.
+
+        .. versionadded:: 2.1.0
+        """
+        state = dict(self._iter_stored_fields())
+        state['_extra_keys'], state['_extra'] = self._extra_keys, self._extra
+        return state
+
+    def __setstate__(self, state):
+        """This method restores the stored values when a record is unpickled or copied.
+
+        .. versionadded:: 2.1.0
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def extra(self):
+        """This property returns the fields that are not stored in slots (which are decoded on every access).
+
+        .. versionadded:: 2.1.0
+
+        :returns: A dictionary of the extra fields
+        """
+        if not self._extra:
+            return {}
+        extra_values = self._extra if self._extra.startswith(b'[') else zlib.decompress(self._extra)
+        return dict(zip(self._extra_keys, json.loads(extra_values)))
+
+    def get(self, name, default=None):
+        """This method returns the value of any field with a default value when the field does not exist.
+
+        .. versionadded:: 2.1.0
+
+        :param name: The name of the field
+        :type name: str
+        :param default: The value to return when the field does not exist
+        :returns: The value of the field
+        """
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            return default
+
+    def to_dict(self):
+        """This method converts the record back into the JSON object returned by the API.
+
+        .. versionadded:: 2.1.0
+
+        :returns: A dictionary with all fields of the record
+        """
+        data = {}
+        for field, value in self._iter_stored_fields():
+            if isinstance(value, tuple):
+                value = list(value)
+            elif field in self.TIMESTAMP_FIELDS and isinstance(value, float):
+                value = _format_timestamp(value)
+            data[field] = value
+        data.update(self.extra)
+        return data
+
+    def _iter_stored_fields(self):
+        """This method yields the known fields that were present in the original data along with their values.
+
+        .. versionadded:: 2.1.0
+
+        :returns: A generator that yields a tuple with the name and value of each stored field
+        """
+        for _field in self.FIELDS:
+            try:
+                yield _field, object.__getattribute__(self, _field)
+            except AttributeError:
+                continue
+
+
+class Ticket(Record):
+    """This class is a compact record for a Freshservice ticket.
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = TICKET_FIELDS
+    FIELDS = TICKET_FIELDS
+    TIMESTAMP_FIELDS = frozenset(['due_by', 'fr_due_by', 'created_at', 'updated_at'])
+    SHARED_FIELDS = frozenset(['type', 'source', 'urgency', 'impact', 'category', 'sub_category', 'item_category',
+                               'group_id', 'department_id', 'requester_id', 'requested_for_id', 'responder_id',
+                               'workspace_id', 'email_config_id'])
+    DATA_KEY = 'tickets'
+    ITEM_KEY = 'ticket'
+
+
+class Agent(Record):
+    """This class is a compact record for a Freshservice agent.
+
+    .. versionadded:: 2.1.0
+    """
+    __slots__ = AGENT_FIELDS
+    FIELDS = AGENT_FIELDS
+    TIMESTAMP_FIELDS = frozenset(['last_login_at', 'last_active_at', 'created_at', 'updated_at'])
+    SHARED_FIELDS = frozenset(['job_title', 'reporting_manager_id', 'location_id', 'time_zone', 'time_format',
+                               'language', 'scoreboard_level_id'])
+    DATA_KEY = 'agents'
+    ITEM_KEY = 'agent'
+
+
+def to_records(data, record_class, shared_values=None):
+    """This function converts the JSON data returned by the API into compact records.
+
+    .. versionadded:: 2.1.0
+
+    :param data: A list of JSON objects, a response containing a list (e.g. ``{'tickets': [...]}``) or a single
+                 object (e.g. ``{'ticket': {...}}``)
+    :type data: dict, list
+    :param record_class: The record class to use (i.e. :py:class:`freshpy.records.Ticket` or
+                         :py:class:`freshpy.records.Agent`)
+    :type record_class: class[freshpy.records.Record]
+    :param shared_values: A dictionary of intern tables keyed by field used to share identical values between records
+    :type shared_values: dict, None
+    :returns: A list of records, a single record, or the original data when it does not contain any records
+              (e.g. an error response)
+    """
+    shared_values = {} if shared_values is None else shared_values
+    if isinstance(data, list):
+        return [record_class(item, shared_values) for item in data]
+    if isinstance(data, dict):
+        if record_class.DATA_KEY in data:
+            return [record_class(item, shared_values) for item in data[record_class.DATA_KEY]]
+        if record_class.ITEM_KEY in data:
+            return record_class(data[record_class.ITEM_KEY], shared_values)
+        if 'id' in data:
+            return record_class(data, shared_values)
+    return data
+
+
+def iter_records(items, record_class):
+    """This function converts the JSON objects yielded by a generator into compact records.
+
+    .. versionadded:: 2.1.0
+
+    :param items: An iterable of JSON objects
+    :type items: generator, list, tuple
+    :param record_class: The record class to use
+    :type record_class: class[freshpy.records.Record]
+    :returns: A generator that yields a record for each JSON object
+    """
+    shared_values = {}
+    for item in items:
+        yield record_class(item, shared_values)
+
+
+def _intern(_shared_values, _field, _value):
+    """This function returns the shared instance of a value from the intern table of a field.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Each field has its own table so that equal values of different types (e.g. ``1`` and ``True``) are
+              never substituted for one another.
+
+    :param _shared_values: The intern tables keyed by field
+    :type _shared_values: dict
+    :param _field: The name of the field
+    :type _field: str
+    :param _value: The value to share
+    :type _value: str, int, tuple
+    :returns: The shared instance of the value
+    """
+    _field_values = _shared_values.get(_field)
+    if _field_values is None:
+        _field_values = _shared_values[_field] = {}
+    return _field_values.setdefault(_value, _value)
+
+
+def _parse_timestamp(_value):
+    """This function converts an ISO-8601 timestamp string into epoch seconds.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A ``float`` uses less memory than a :py:class:`datetime.datetime` object (or an integer of the same
+              magnitude) and retains microseconds. Timestamps without a UTC offset are assumed to be UTC.
+
+    :param _value: The value of the timestamp field
+    :returns: The number of seconds since the Unix epoch (UTC) as a float or the original value if it is not an
+              ISO-8601 timestamp
+    """
+    if not isinstance(_value, str):
+        return _value
+    try:
+        # Parse the format returned by the API (e.g. 2024-01-31T17:45:00Z) without a regular expression
+        if len(_value) == TIMESTAMP_LENGTH and _value[4::3][:5] == '--T::' and _value.endswith('Z'):
+            return datetime(int(_value[0:4]), int(_value[5:7]), int(_value[8:10]), int(_value[11:13]),
+                            int(_value[14:16]), int(_value[17:19]), tzinfo=timezone.utc).timestamp()
+        _match = TIMESTAMP_PATTERN.fullmatch(_value)
+        if _match is None:
+            return _value
+        _year, _month, _day, _hour, _minute, _second, _fraction, _offset = _match.groups()
+        _timestamp = datetime(int(_year), int(_month), int(_day), int(_hour), int(_minute), int(_second),
+                              tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return _value
+    if _offset and _offset != 'Z':
+        _offset = _offset.replace(':', '')
+        _offset_seconds = int(_offset[1:3]) * 3600 + int(_offset[3:5]) * 60
+        _timestamp -= _offset_seconds if _offset[0] == '+' else -_offset_seconds
+    if _fraction:
+        _timestamp += int(_fraction[:6].ljust(6, '0')) / MICROSECONDS_PER_SECOND
+    return _timestamp
+
+
+def _format_timestamp(_timestamp):
+    """This function converts epoch seconds into the UTC timestamp format used by the API.
+
+    .. versionadded:: 2.1.0
+
+    :param _timestamp: The number of seconds since the Unix epoch
+    :type _timestamp: float
+    :returns: The timestamp string (e.g. ``2024-01-31T17:45:00Z``) with milliseconds or microseconds when the value
+              includes fractional seconds
+    """
+    _seconds = math.floor(_timestamp)
+    _microseconds = round((_timestamp - _seconds) * MICROSECONDS_PER_SECOND)
+    _value = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=_seconds, microseconds=_microseconds)
+    if not _value.microsecond:
+        return core_utils.format_timestamp(_value)
+    _fraction = f'{_value.microsecond:06d}'
+    _fraction = _fraction[:3] if _fraction.endswith('000') else _fraction
+    return f"{_value.strftime('%Y-%m-%dT%H:%M:%S')}.{_fraction}Z"
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.store
+:Synopsis:          Local SQLite mirror of tickets and agents with indexed queries
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from . import agents, tickets
+from .sync import DEFAULT_INITIAL_UPDATED_SINCE, DEFAULT_OVERLAP_SECONDS
+from .utils import core_utils, log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define constants
+DEFAULT_BATCH_SIZE = 500
+TICKET_INDEX_COLUMNS = ['status', 'priority', 'group_id', 'responder_id', 'updated_at']
+TICKET_COLUMNS = ['id', 'status', 'priority', 'group_id', 'responder_id', 'requester_id', 'created_at', 'updated_at']
+AGENT_COLUMNS = ['id', 'email', 'active']
+TICKETS_CHECKPOINT_KEY = 'tickets_updated_since'
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS tickets (
+        id INTEGER PRIMARY KEY,
+        status INTEGER,
+        priority INTEGER,
+        group_id INTEGER,
+        responder_id INTEGER,
+        requester_id INTEGER,
+        created_at TEXT,
+        updated_at TEXT,
+        data TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS agents (
+        id INTEGER PRIMARY KEY,
+        email TEXT COLLATE NOCASE,
+        active INTEGER,
+        data TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS sync_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_agents_email ON agents (email)",
+] + [f"CREATE INDEX IF NOT EXISTS idx_tickets_{_column} ON tickets ({_column})" for _column in TICKET_INDEX_COLUMNS]
+
+
+class LocalStore(object):
+    """This class mirrors tickets and agents in a local SQLite database so that most reads can skip the API.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The full JSON object for each ticket and agent is stored alongside the indexed columns, so the query
+              methods return the same dictionary structures as the API functions.
+    """
+    def __init__(self, database=':memory:', batch_size=DEFAULT_BATCH_SIZE):
+        """This method instantiates the :py:class:`freshpy.store.LocalStore` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param database: The path to the SQLite database file (an in-memory database is used by default)
+        :type database: str
+        :param batch_size: The number of records written within each transaction
+        :type batch_size: int
+        """
+        self.database = database
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(database)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+    def __enter__(self):
+        """This method allows the store to be used as a context manager.
+
+        .. versionadded:: 2.1.0
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """This method closes the store when exiting a ``with`` block.
+
+        .. versionadded:: 2.1.0
+        """
+        self.close()
+
+    def close(self):
+        """This method closes the connection to the SQLite database.
+
+        .. versionadded:: 2.1.0
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def write_tickets(self, ticket_data):
+        """This method inserts or replaces tickets in batches, with each batch written in a single transaction.
+
+        .. versionadded:: 2.1.0
+
+        :param ticket_data: An iterable of ticket JSON objects (e.g. from :py:func:`freshpy.tickets.iter_tickets`)
+        :type ticket_data: list, tuple, generator
+        :returns: The number of tickets written as an integer
+        """
+        return self._write_batches('tickets', TICKET_COLUMNS, ticket_data)
+
+    def write_agents(self, agent_data):
+        """This method inserts or replaces agents in batches, with each batch written in a single transaction.
+
+        .. versionadded:: 2.1.0
+
+        :param agent_data: An iterable of agent JSON objects (e.g. from :py:func:`freshpy.agents.iter_agents`)
+        :type agent_data: list, tuple, generator
+        :returns: The number of agents written as an integer
+        """
+        return self._write_batches('agents', AGENT_COLUMNS, agent_data)
+
+    def sync_tickets(self, freshpy_object, include=None, overlap_seconds=DEFAULT_OVERLAP_SECONDS, prefetch=False,
+                     verify_ssl=True):
+        """This method retrieves the tickets updated since the previous sync and writes them to the store.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: The checkpoint is stored in the database and only advanced once every ticket has been written, and
+                  it is set to the start of the run (less the overlap) so that updates made during the run are
+                  retrieved again on the next sync.
+
+        :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+        :type freshpy_object: class[freshpy.FreshPy]
+        :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+        :type include: str, tuple, list, set, None
+        :param overlap_seconds: The number of seconds before the start of the run at which the next sync begins
+        :type overlap_seconds: int
+        :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+        :type prefetch: bool
+        :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+        :type verify_ssl: bool
+        :returns: The number of tickets written as an integer
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.GETRequestError`
+        """
+        updated_since = self._get_state(TICKETS_CHECKPOINT_KEY) or DEFAULT_INITIAL_UPDATED_SINCE
+        cutoff = core_utils.format_timestamp(datetime.now(timezone.utc) - timedelta(seconds=overlap_seconds))
+        written = self.write_tickets(tickets.iter_tickets(freshpy_object, include=include, updated_since=updated_since,
+                                                          prefetch=prefetch, verify_ssl=verify_ssl))
+        self._set_state(TICKETS_CHECKPOINT_KEY, cutoff)
+        logger.info(f'The local store was synchronized with {written} updated tickets')
+        return written
+
+    def sync_agents(self, freshpy_object, prefetch=True, verify_ssl=True):
+        """This method retrieves all agents and writes them to the store.
+
+        .. versionadded:: 2.1.0
+
+        :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+        :type freshpy_object: class[freshpy.FreshPy]
+        :param prefetch: Determines if multiple pages should be requested concurrently (``True`` by default)
+        :type prefetch: bool
+        :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+        :type verify_ssl: bool
+        :returns: The number of agents written as an integer
+        :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+                 :py:exc:`freshpy.errors.exceptions.GETRequestError`
+        """
+        return self.write_agents(agents.iter_agents(freshpy_object, prefetch=prefetch, verify_ssl=verify_ssl))
+
+    def get_ticket(self, ticket_number):
+        """This method returns the stored data for a specific ticket.
+
+        .. versionadded:: 2.1.0
+
+        :param ticket_number: The ticket number for which to return data
+        :type ticket_number: str, int
+        :returns: The JSON object for the ticket or ``None`` if it is not in the store
+        """
+        rows = self._fetch_data('SELECT data FROM tickets WHERE id = ?', (int(ticket_number),))
+        return rows[0] if rows else None
+
+    def query_tickets(self, status=None, priority=None, group_id=None, responder_id=None, updated_since=None,
+                      limit=None):
+        """This method returns the stored tickets that match the supplied criteria using the indexed columns.
+
+        .. versionadded:: 2.1.0
+
+        :param status: A status value or an iterable of status values
+        :type status: int, list, tuple, set, None
+        :param priority: A priority value or an iterable of priority values
+        :type priority: int, list, tuple, set, None
+        :param group_id: A group ID or an iterable of group IDs
+        :type group_id: int, list, tuple, set, None
+        :param responder_id: An agent ID or an iterable of agent IDs for the ticket responder
+        :type responder_id: int, list, tuple, set, None
+        :param updated_since: A timestamp (in UTC format) after which the tickets must have been updated
+        :type updated_since: str, None
+        :param limit: The maximum number of tickets to return
+        :type limit: int, None
+        :returns: A list of JSON objects for the tickets ordered by most recently updated
+        """
+        clauses, params = [], []
+        for column, value in (('status', status), ('priority', priority), ('group_id', group_id),
+                              ('responder_id', responder_id)):
+            _add_condition(clauses, params, column, value)
+        if updated_since:
+            clauses.append('updated_at >= ?')
+            params.append(updated_since)
+        query = 'SELECT data FROM tickets'
+        query += f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        query += ' ORDER BY updated_at DESC'
+        if limit:
+            query += ' LIMIT ?'
+            params.append(int(limit))
+        return self._fetch_data(query, params)
+
+    def get_agent(self, lookup_value):
+        """This method returns the stored data for a specific agent.
+
+        .. versionadded:: 2.1.0
+
+        :param lookup_value: An Agent ID or email address with which to look up the agent
+        :type lookup_value: str, int
+        :returns: The JSON object for the agent or ``None`` if it is not in the store
+        """
+        if agents._is_agent_id(lookup_value):
+            rows = self._fetch_data('SELECT data FROM agents WHERE id = ?', (int(lookup_value),))
+        else:
+            rows = self._fetch_data('SELECT data FROM agents WHERE email = ?', (lookup_value,))
+        return rows[0] if rows else None
+
+    def query_agents(self, only_active=None):
+        """This method returns the stored agents with an optional filter for active users.
+
+        .. versionadded:: 2.1.0
+
+        :param only_active: Filters for only active (``True``) or inactive (``False``) agents when defined
+        :type only_active: bool, None
+        :returns: A list of JSON objects for the agents
+        """
+        if only_active is None:
+            return self._fetch_data('SELECT data FROM agents ORDER BY id')
+        return self._fetch_data('SELECT data FROM agents WHERE active = ? ORDER BY id', (int(only_active),))
+
+    def query(self, sql, params=()):
+        """This method executes an arbitrary read query (e.g. a join or aggregate) against the store.
+
+        .. versionadded:: 2.1.0
+
+        :param sql: The SQL query to execute
+        :type sql: str
+        :param params: The parameters to bind to the query
+        :type params: tuple, list, dict
+        :returns: A list of dictionaries keyed by column name
+        """
+        cursor = self.connection.execute(sql, params)
+        columns = [column[0] for column in cursor.description or ()]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def _write_batches(self, _table, _columns, _records):
+        """This method writes records to a table in batches with each batch written in a single transaction.
+
+        .. versionadded:: 2.1.0
+
+        :param _table: The name of the table
+        :type _table: str
+        :param _columns: The indexed columns to populate from each record
+        :type _columns: list
+        :param _records: An iterable of JSON objects
+        :type _records: list, tuple, generator
+        :returns: The number of records written as an integer
+        """
+        _placeholders = ', '.join(['?'] * (len(_columns) + 1))
+        _statement = f"INSERT OR REPLACE INTO {_table} ({', '.join(_columns)}, data) VALUES ({_placeholders})"
+        _batch, _written = [], 0
+        for _record in _records:
+            _batch.append(tuple(_get_column_value(_record, _column) for _column in _columns) + (json.dumps(_record),))
+            if len(_batch) >= self.batch_size:
+                _written += self._commit_batch(_statement, _batch)
+                _batch = []
+        if _batch:
+            _written += self._commit_batch(_statement, _batch)
+        return _written
+
+    def _commit_batch(self, _statement, _batch):
+        """This method writes a batch of rows within a single transaction.
+
+        .. versionadded:: 2.1.0
+
+        :param _statement: The parameterized ``INSERT`` statement
+        :type _statement: str
+        :param _batch: The rows to write
+        :type _batch: list
+        :returns: The number of rows written as an integer
+        """
+        with self.connection:
+            self.connection.executemany(_statement, _batch)
+        return len(_batch)
+
+    def _fetch_data(self, _query, _params=()):
+        """This method executes a query that selects the ``data`` column and decodes the JSON objects.
+
+        .. versionadded:: 2.1.0
+
+        :param _query: The SQL query to execute
+        :type _query: str
+        :param _params: The parameters to bind to the query
+        :type _params: tuple, list
+        :returns: A list of JSON objects
+        """
+        return [json.loads(_row[0]) for _row in self.connection.execute(_query, _params)]
+
+    def _get_state(self, _key):
+        """This method returns a value from the ``sync_state`` table.
+
+        .. versionadded:: 2.1.0
+
+        :param _key: The key of the value to return
+        :type _key: str
+        :returns: The stored value or ``None`` if it does not exist
+        """
+        _row = self.connection.execute('SELECT value FROM sync_state WHERE key = ?', (_key,)).fetchone()
+        return _row[0] if _row else None
+
+    def _set_state(self, _key, _value):
+        """This method stores a value in the ``sync_state`` table.
+
+        .. versionadded:: 2.1.0
+
+        :param _key: The key of the value to store
+        :type _key: str
+        :param _value: The value to store
+        :type _value: str
+        :returns: None
+        """
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)', (_key, _value))
+
+
+def _get_column_value(_record, _column):
+    """This function returns the value for an indexed column from a JSON object.
+
+    .. versionadded:: 2.1.0
+
+    :param _record: The JSON object for the ticket or agent
+    :type _record: dict
+    :param _column: The name of the column
+    :type _column: str
+    :returns: The value to store in the column
+    """
+    _value = _record.get(_column)
+    return int(_value) if isinstance(_value, bool) else _value
+
+
+def _add_condition(_clauses, _params, _column, _value):
+    """This function adds an equality or ``IN`` condition for a column when a value is supplied.
+
+    .. versionadded:: 2.1.0
+
+    :param _clauses: The list of ``WHERE`` clauses being compiled
+    :type _clauses: list
+    :param _params: The list of query parameters being compiled
+    :type _params: list
+    :param _column: The name of the column
+    :type _column: str
+    :param _value: A single value or an iterable of values
+    :returns: None
+    """
+    if _value is None:
+        return
+    if isinstance(_value, (list, tuple, set)):
+        _values = list(_value)
+        _clauses.append(f"{_column} IN ({', '.join(['?'] * len(_values))})")
+        _params.extend(_values)
+    else:
+        _clauses.append(f'{_column} = ?')
+        _params.append(_value)
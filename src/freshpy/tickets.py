@@ -4,25 +4,43 @@
 :Synopsis:          Functions for interacting with Freshservice tickets
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     29 Jan 2025
+:Modified Date:     18 Oct 2026
 """
 
-from . import api, errors
-from .utils import core_utils, log_utils
+import math
+from datetime import date, datetime, timedelta, timezone
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+from . import api, errors, records
+from . import filters as filters_module
+from .utils import columnar, core_utils, log_utils, tracing
 
 # Initialize logging
 logger = log_utils.initialize_logging(__name__)
 
 # Define constants
 VALID_PREDEFINED_FILTERS = ['new_and_my_open', 'watching', 'spam', 'deleted']
-SUPPORTED_FILTER_FIELDS = ['agent_id', 'group_id', 'priority', 'status', 'impact', 'urgency', 'tag', 'due_by',
-                           'fr_due_by', 'created_at']
+SUPPORTED_FILTER_FIELDS = filters_module.SUPPORTED_FIELDS
 FILTER_LOGIC_OPERATORS = ['AND', 'OR']
+FILTER_PER_PAGE = 30
+FILTER_MAX_PAGES = 10
+FILTER_RESULT_LIMIT = FILTER_PER_PAGE * FILTER_MAX_PAGES
+FILTER_DATE_FORMAT = filters_module.DATE_FORMAT
+DEFAULT_FILTER_START_DATE = '2010-01-01'
+DEFAULT_FILTER_SPLIT_VALUES = {
+    'priority': [1, 2, 3, 4],
+    'status': [2, 3, 4, 5],
+}
+EXPORT_FORMATS = ['parquet', 'feather', 'arrow', 'numpy']
+IN_MEMORY_EXPORT_WARNING_ROWS = 1000000
 
 
-def get_ticket(freshpy_object, ticket_number, include=None, verify_ssl=True):
+def get_ticket(freshpy_object, ticket_number, include=None, verify_ssl=True, as_records=False):
     """This function returns the data for a specific ticket.
 
+    .. versionchanged:: 2.1.0
+       Added the ``as_records`` parameter.
+
     .. versionchanged:: 1.1.0
        Added the ability to disable SSL verification on API calls.
 
@@ -36,19 +54,132 @@ def get_ticket(freshpy_object, ticket_number, include=None, verify_ssl=True):
     :type include: str, tuple, list, set, None
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
-    :returns: JSON data for the given ticket
+    :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: JSON data (or a record) for the given ticket
     :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`
     """
-    uri = f'tickets/{ticket_number}'
-    uri += _parse_constraints(_include=include)
-    return api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    uri = _get_ticket_uri(ticket_number, include)
+    ticket_data = api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    return records.to_records(ticket_data, records.Ticket) if as_records else ticket_data
+
+
+def get_tickets_by_ids(freshpy_object, ticket_numbers, include=None, max_workers=None, verify_ssl=True,
+                       as_records=False):
+    """This function retrieves the data for multiple tickets concurrently using a bounded pool of workers.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The workers share the connection pool and rate limiter of the core object, so the ``pool_maxsize``
+              value of the core object should be at least as large as the number of workers.
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param ticket_numbers: The ticket numbers for which to return data
+    :type ticket_numbers: list, tuple, set
+    :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type include: str, tuple, list, set, None
+    :param max_workers: The maximum number of concurrent requests (defaults to the ``prefetch_workers`` value
+                        defined in the core object)
+    :type max_workers: int, None
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: A dictionary with the ticket data keyed by ticket number (``tickets``), a list of the ticket numbers
+              that were not found (``not_found``) and the error messages keyed by ticket number (``errors``), where
+              each ticket number is keyed as it was first supplied
+    """
+    results = {'tickets': {}, 'not_found': [], 'errors': {}}
+    unique_numbers = {}
+    for ticket_number in ticket_numbers:
+        # Treat a ticket number supplied as both a string and an integer as a duplicate
+        unique_numbers.setdefault(str(ticket_number).strip(), ticket_number)
+    ticket_numbers = list(unique_numbers.values())
+    if not ticket_numbers:
+        return results
+    max_workers = max_workers or getattr(freshpy_object, 'prefetch_workers', None) or api.DEFAULT_PREFETCH_WORKERS
+    max_workers = min(max_workers, len(ticket_numbers))
+    with tracing.start_span(tracing.BULK_SPAN, _get_bulk_span_attributes('tickets/{id}', max_workers)) as span, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(tracing.bind_context(api.get_request_with_retries), freshpy_object,
+                            _get_ticket_uri(ticket_number, include), return_json=False,
+                            verify_ssl=verify_ssl): ticket_number
+            for ticket_number in ticket_numbers
+        }
+        for future in as_completed(futures):
+            _record_bulk_result(results, futures[future], future, api._get_json_decoder(freshpy_object))
+        tracing.set_attributes(span, {'freshpy.bulk.requests': len(ticket_numbers),
+                                      'freshpy.bulk.not_found': len(results['not_found']),
+                                      'freshpy.bulk.errors': len(results['errors'])})
+    if as_records:
+        shared_values = {}
+        results['tickets'] = {
+            ticket_number: records.Ticket(ticket_data, shared_values)
+            for ticket_number, ticket_data in results['tickets'].items()
+        }
+    return results
+
+
+def _get_bulk_span_attributes(_endpoint, _max_workers):
+    """This function returns the attributes for the tracing span around a concurrent bulk retrieval.
+
+    .. versionadded:: 2.1.0
+
+    :param _endpoint: The endpoint template of the requests (e.g. ``tickets/{id}``)
+    :type _endpoint: str
+    :param _max_workers: The maximum number of concurrent requests
+    :type _max_workers: int
+    :returns: A dictionary of span attributes or ``None`` when tracing is not available
+    """
+    if not tracing.is_enabled():
+        return None
+    return {'freshpy.endpoint': _endpoint, 'freshpy.bulk.workers': _max_workers}
+
+
+def _record_bulk_result(_results, _ticket_number, _future, _decoder=None):
+    """This function records the outcome of a single ticket request within a bulk retrieval.
+
+    .. versionadded:: 2.1.0
+
+    :param _results: The dictionary of results being compiled
+    :type _results: dict
+    :param _ticket_number: The ticket number associated with the request
+    :type _ticket_number: str, int
+    :param _future: The completed future for the request
+    :type _future: class[concurrent.futures.Future]
+    :param _decoder: The function used to decode the JSON data (the standard library is used when not defined)
+    :type _decoder: function, None
+    :returns: None
+    """
+    try:
+        _response = _future.result()
+    except Exception as _exc_msg:
+        _results['errors'][_ticket_number] = f'{type(_exc_msg).__name__}: {_exc_msg}'
+        return
+    if _response.status_code == 404:
+        _results['not_found'].append(_ticket_number)
+    elif _response.status_code >= 400:
+        _results['errors'][_ticket_number] = f'{_response.status_code}: {_response.text}'
+    else:
+        _ticket_data = api._parse_json_response(_response, _decoder)
+        if 'ticket' in _ticket_data:
+            _results['tickets'][_ticket_number] = _ticket_data['ticket']
+        else:
+            _results['errors'][_ticket_number] = str(_ticket_data.get('error_message', _ticket_data))
 
 
 def get_tickets(freshpy_object, include=None, predefined_filter=None, filters=None, filter_logic='AND',
                 requester_id=None, requester_email=None, ticket_type=None, updated_since=None, ascending=None,
-                descending=None, per_page=None, page=None, verify_ssl=True):
+                descending=None, per_page=None, page=None, verify_ssl=True, as_records=False):
     """This function returns a sequence of tickets with optional filters.
 
+    .. versionchanged:: 2.1.0
+       Added the ``as_records`` parameter.
+
     .. versionchanged:: 1.1.0
        Added the ability to disable SSL verification on API calls.
 
@@ -61,7 +192,7 @@ def get_tickets(freshpy_object, include=None, predefined_filter=None, filters=No
     :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
     :type predefined_filter: str, None
     :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
-    :type filters: str, dict, None
+    :type filters: str, dict, class[freshpy.filters.Expression], None
     :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
     :param requester_id: The numeric ID of a requester
     :type requester_id: str, int, None
@@ -81,38 +212,535 @@ def get_tickets(freshpy_object, include=None, predefined_filter=None, filters=No
     :type page: str, int, None
     :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
     :type verify_ssl: bool
-    :returns: A list of JSON objects for tickets
+    :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: A list of JSON objects (or records) for tickets
     :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
              :py:exc:`freshpy.errors.exceptions.APIConnectionError`
     """
-    uri = 'tickets'
-    if filters:
-        uri += _parse_filters(filters, filter_logic)
+    uri = _get_tickets_uri(include, predefined_filter, filters, filter_logic, requester_id, requester_email,
+                           ticket_type, updated_since, ascending, descending, per_page, page)
+    ticket_data = api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+    return records.to_records(ticket_data, records.Ticket) if as_records else ticket_data
+
+
+def get_filtered_tickets(freshpy_object, filters=None, filter_logic='AND', start_date=None, end_date=None,
+                         split_values=None, max_workers=None, verify_ssl=True, as_records=False):
+    """This function retrieves every ticket that matches a filter query by splitting queries that exceed the result cap.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The filter endpoint returns at most 10 pages of 30 tickets for a query. When the ``total`` value of a
+              query exceeds this cap, the query is split into disjoint sub-queries by halving its ``created_at``
+              date range and, once the range is a single day, by the values in ``split_values``. The sub-queries
+              and their pages are requested concurrently and the tickets are merged by ID without duplicates.
+
+    .. caution:: The default ``split_values`` only include the standard ticket statuses, so the values for any
+                 custom statuses should be supplied when a single day can exceed the cap for a single priority. A
+                 warning is logged when the ``total`` values of the sub-queries do not add up to the ``total`` value
+                 of the query that was split, as tickets may be missing from the results.
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type filters: str, dict, class[freshpy.filters.Expression], None
+    :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :type filter_logic: str
+    :param start_date: The earliest creation date (``YYYY-MM-DD``) used when splitting queries (``2010-01-01`` by
+                       default)
+    :type start_date: str, datetime.date, None
+    :param end_date: The latest creation date (``YYYY-MM-DD``) used when splitting queries (the current UTC date by
+                     default)
+    :type end_date: str, datetime.date, None
+    :param split_values: The values keyed by field used to split a single-day query that still exceeds the cap (the
+                         values in :py:data:`freshpy.tickets.DEFAULT_FILTER_SPLIT_VALUES` are used when not defined)
+    :type split_values: dict, None
+    :param max_workers: The maximum number of concurrent requests (defaults to the ``prefetch_workers`` value
+                        defined in the core object)
+    :type max_workers: int, None
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: A list of JSON objects (or records) for the tickets sorted by ticket number
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidFilterLogicError`,
+             :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    base_query = _get_filter_query(filters, filter_logic)
+    start_date = _get_filter_date(start_date or DEFAULT_FILTER_START_DATE)
+    end_date = _get_filter_date(end_date) if end_date else datetime.now(timezone.utc).date()
+    split_values = DEFAULT_FILTER_SPLIT_VALUES if split_values is None else split_values
+    max_workers = max_workers or getattr(freshpy_object, 'prefetch_workers', None) or api.DEFAULT_PREFETCH_WORKERS
+    ticket_data, request_count = {}, 0
+    with tracing.start_span(tracing.BULK_SPAN, _get_bulk_span_attributes('tickets/filter', max_workers)) as span, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def _submit(_query_range, _page=1, _split=None):
+            _future = executor.submit(tracing.bind_context(_get_filter_page), freshpy_object,
+                                      _get_split_query(base_query, _query_range), _page, verify_ssl)
+            pending[_future] = (_query_range, _page, _split)
+
+        pending = {}
+        _submit((start_date, end_date, {}))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                query_range, page, split = pending.pop(future)
+                response = future.result()
+                request_count += 1
+                if page == 1:
+                    total = response.get('total', len(response['tickets']))
+                    if split is not None:
+                        _add_split_total(split, total)
+                    sub_ranges = _split_query_range(query_range, split_values) if total > FILTER_RESULT_LIMIT else []
+                    if sub_ranges:
+                        split = {'query_range': query_range, 'total': total, 'remaining': len(sub_ranges), 'sum': 0}
+                        for sub_range in sub_ranges:
+                            _submit(sub_range, _split=split)
+                        continue
+                    if total > FILTER_RESULT_LIMIT:
+                        logger.warning(f'The filter query for {query_range} matches {total} tickets and cannot be '
+                                       f'split further so only {FILTER_RESULT_LIMIT} tickets will be retrieved')
+                    for next_page in range(2, min(math.ceil(total / FILTER_PER_PAGE), FILTER_MAX_PAGES) + 1):
+                        _submit(query_range, next_page)
+                for ticket in response['tickets']:
+                    ticket_data[ticket['id']] = ticket
+        tracing.set_attributes(span, {'freshpy.bulk.requests': request_count, 'freshpy.records': len(ticket_data)})
+    ticket_data = [ticket_data[ticket_number] for ticket_number in sorted(ticket_data)]
+    return records.to_records(ticket_data, records.Ticket) if as_records else ticket_data
+
+
+def iter_tickets(freshpy_object, include=None, predefined_filter=None, filters=None, filter_logic='AND',
+                 requester_id=None, requester_email=None, ticket_type=None, updated_since=None, ascending=None,
+                 descending=None, per_page=api.MAX_PER_PAGE, page=None, prefetch=False, verify_ssl=True,
+                 stream=False, as_records=False):
+    """This function returns a generator that yields tickets one at a time while automatically paginating.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The ``per_page`` value is not supported when ``filters`` are supplied, as the filter endpoint
+              returns a fixed number of results per page.
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type include: str, tuple, list, set, None
+    :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+    :type predefined_filter: str, None
+    :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type filters: str, dict, class[freshpy.filters.Expression], None
+    :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :param requester_id: The numeric ID of a requester
+    :type requester_id: str, int, None
+    :param requester_email: The email address of a requester
+    :type requester_email: str, None
+    :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+    :type ticket_type: str, None
+    :param updated_since: A date or timestamp (in UTC format) to be a threshold for when the ticket was last updated
+    :type updated_since: str, None
+    :param ascending: Determines if the tickets should be sorted in *ascending* order
+    :type ascending: bool, None
+    :param descending: Determines if the tickets should be sorted in *descending* order (default)
+    :type descending: bool, None
+    :param per_page: The number of results to request per page (``100`` by default)
+    :type per_page: str, int
+    :param page: The page number on which to begin (``1`` by default)
+    :type page: str, int, None
+    :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+    :type prefetch: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :param stream: Determines if each page should be decoded incrementally as it is downloaded, which lowers the
+                   peak memory usage for large pages but disables ``prefetch`` (``False`` by default), where a custom
+                   JSON decoder function decodes each ticket (see :py:func:`freshpy.api.iterate_records`)
+    :type stream: bool
+    :param as_records: Determines if compact :py:class:`freshpy.records.Ticket` records should be returned rather
+                       than JSON objects (``False`` by default)
+    :type as_records: bool
+    :returns: A generator that yields the JSON object (or record) for each ticket
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+             :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    uri = _get_tickets_uri(include, predefined_filter, filters, filter_logic, requester_id, requester_email,
+                           ticket_type, updated_since, ascending, descending)
+    per_page = None if filters else per_page
+    if stream:
+        ticket_data = api.iterate_records(freshpy_object, uri, 'tickets', per_page=per_page, start_page=page,
+                                          verify_ssl=verify_ssl)
+    else:
+        ticket_data = (ticket for page_records in api.iterate_pages(freshpy_object, uri, 'tickets', per_page=per_page,
+                                                                    start_page=page, prefetch=prefetch,
+                                                                    verify_ssl=verify_ssl)
+                       for ticket in page_records)
+    yield from records.iter_records(ticket_data, records.Ticket) if as_records else ticket_data
+
+
+def export_columnar(freshpy_object, file_path=None, file_format=None, columns=None,
+                    chunk_size=columnar.DEFAULT_CHUNK_SIZE, include=None, predefined_filter=None, filters=None,
+                    filter_logic='AND', requester_id=None, requester_email=None, ticket_type=None, updated_since=None,
+                    ascending=None, descending=None, prefetch=False, stream=False, verify_ssl=True):
+    """This function exports tickets in a columnar format by streaming pages into column buffers in chunks.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Only one chunk of tickets is held in column buffers at a time, and each chunk is written to the file
+              (as a Parquet row group, Feather record batch or spooled ``.npz`` column) before the next chunk is
+              retrieved. The ``arrow`` and ``numpy`` formats return the whole export in memory when no file path is
+              supplied, so a warning is logged once more than
+              :py:data:`freshpy.tickets.IN_MEMORY_EXPORT_WARNING_ROWS` tickets have been collected.
+
+    :param freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type freshpy_object: class[freshpy.FreshPy]
+    :param file_path: The path to the file that will be written (required for the ``parquet`` and ``feather`` formats)
+    :type file_path: str, None
+    :param file_format: The export format (``parquet``, ``feather``, ``arrow`` or ``numpy``), which defaults to
+                        ``parquet`` (or ``arrow`` without a file path) when :py:mod:`pyarrow` is installed and
+                        ``numpy`` otherwise
+    :type file_format: str, None
+    :param columns: The column types keyed by field name or a list of field names (the default ticket columns
+                    defined in :py:data:`freshpy.utils.columnar.TICKET_COLUMNS` are used when not defined)
+    :type columns: dict, list, tuple, None
+    :param chunk_size: The number of tickets buffered before each chunk is converted and written
+    :type chunk_size: int
+    :param include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type include: str, tuple, list, set, None
+    :param predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+    :type predefined_filter: str, None
+    :param filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type filters: str, dict, class[freshpy.filters.Expression], None
+    :param filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :param requester_id: The numeric ID of a requester
+    :type requester_id: str, int, None
+    :param requester_email: The email address of a requester
+    :type requester_email: str, None
+    :param ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+    :type ticket_type: str, None
+    :param updated_since: A date or timestamp (in UTC format) to be a threshold for when the ticket was last updated
+    :type updated_since: str, None
+    :param ascending: Determines if the tickets should be sorted in *ascending* order
+    :type ascending: bool, None
+    :param descending: Determines if the tickets should be sorted in *descending* order (default)
+    :type descending: bool, None
+    :param prefetch: Determines if multiple pages should be requested concurrently (``False`` by default)
+    :type prefetch: bool
+    :param stream: Determines if each page should be decoded incrementally as it is downloaded (``False`` by default)
+    :type stream: bool
+    :param verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type verify_ssl: bool
+    :returns: The number of tickets written when a file path is supplied, otherwise a :py:class:`pyarrow.Table`
+              (``arrow`` format) or a dictionary of :py:class:`numpy.ndarray` objects keyed by column (``numpy``
+              format)
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`,
+             :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`,
+             :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`,
+             :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    file_format = _get_export_format(file_format, file_path)
+    buffer = columnar.ColumnBuffer(columns)
+    schema = buffer.get_arrow_schema() if file_format != 'numpy' else None
+    ticket_data = iter_tickets(freshpy_object, include=include, predefined_filter=predefined_filter, filters=filters,
+                               filter_logic=filter_logic, requester_id=requester_id, requester_email=requester_email,
+                               ticket_type=ticket_type, updated_since=updated_since, ascending=ascending,
+                               descending=descending, prefetch=prefetch, verify_ssl=verify_ssl, stream=stream)
+    if file_format == 'numpy':
+        numpy_chunks = _iter_column_chunks(ticket_data, buffer, chunk_size, buffer.flush_numpy)
+        if not file_path:
+            return columnar.concatenate_numpy_chunks(list(_warn_on_large_export(numpy_chunks)), buffer.column_types)
+        rows_written = columnar.write_numpy_file(numpy_chunks, file_path, buffer.column_types)
+        logger.info(f'Exported {rows_written} tickets to {file_path}')
+        return rows_written
+    record_batches = _iter_column_chunks(ticket_data, buffer, chunk_size, buffer.flush_arrow)
+    if file_format == 'arrow' and not file_path:
+        return columnar.to_arrow_table(_warn_on_large_export(record_batches), schema)
+    file_format = 'feather' if file_format == 'arrow' else file_format
+    rows_written = columnar.write_arrow_file(record_batches, file_path, schema, file_format)
+    logger.info(f'Exported {rows_written} tickets to {file_path}')
+    return rows_written
+
+
+def _get_export_format(_file_format=None, _file_path=None):
+    """This function validates the columnar export format or selects the default format.
+
+    .. versionadded:: 2.1.0
+
+    :param _file_format: The requested export format (if any)
+    :type _file_format: str, None
+    :param _file_path: The path to the file that will be written (if any)
+    :type _file_path: str, None
+    :returns: The export format
+    :raises: :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`,
+             :py:exc:`freshpy.errors.exceptions.MissingRequiredDataError`
+    """
+    if _file_format is None:
+        if not columnar.is_arrow_available():
+            return 'numpy'
+        return 'parquet' if _file_path else 'arrow'
+    _file_format = _file_format.lower()
+    if _file_format not in EXPORT_FORMATS:
+        raise errors.exceptions.CurrentlyUnsupportedError(f'{_file_format} export format')
+    if _file_format in ('parquet', 'feather') and not _file_path:
+        raise errors.exceptions.MissingRequiredDataError(param='file_path')
+    return _file_format
+
+
+def _warn_on_large_export(_chunks, _row_threshold=None):
+    """This function passes through the chunks of an in-memory export and logs a warning once it grows too large.
+
+    .. versionadded:: 2.1.0
+
+    :param _chunks: An iterable of converted chunks
+    :type _chunks: generator, list, tuple
+    :param _row_threshold: The number of rows above which the warning is logged (defaults to
+                           :py:data:`freshpy.tickets.IN_MEMORY_EXPORT_WARNING_ROWS`)
+    :type _row_threshold: int, None
+    :returns: A generator that yields each chunk unchanged
+    """
+    _row_threshold = IN_MEMORY_EXPORT_WARNING_ROWS if _row_threshold is None else _row_threshold
+    _row_count = 0
+    for _chunk in _chunks:
+        _previous_count = _row_count
+        _row_count += _chunk.num_rows if hasattr(_chunk, 'num_rows') else len(next(iter(_chunk.values()), ()))
+        if _previous_count <= _row_threshold < _row_count:
+            logger.warning(f'The in-memory export has exceeded {_row_threshold} tickets and is held in memory in '
+                           f'full; supply a file path to write the tickets one chunk at a time')
+        yield _chunk
+
+
+def _iter_column_chunks(_ticket_data, _buffer, _chunk_size, _flush):
+    """This function appends tickets to a column buffer and yields a converted chunk each time the buffer is full.
+
+    .. versionadded:: 2.1.0
+
+    :param _ticket_data: An iterable of ticket JSON objects
+    :type _ticket_data: generator, list, tuple
+    :param _buffer: The column buffer
+    :type _buffer: class[freshpy.utils.columnar.ColumnBuffer]
+    :param _chunk_size: The number of tickets in each chunk
+    :type _chunk_size: int
+    :param _flush: The buffer method that converts and empties the buffer
+    :type _flush: function
+    :returns: A generator that yields each converted chunk
+    """
+    for _ticket in _ticket_data:
+        _buffer.append(_ticket)
+        if len(_buffer) >= _chunk_size:
+            yield _flush()
+    if len(_buffer):
+        yield _flush()
+
+
+def _get_ticket_uri(_ticket_number, _include=None):
+    """This function constructs the URI used to retrieve the data for a specific ticket.
+
+    .. versionadded:: 2.1.0
+
+    :param _ticket_number: The ticket number for which to return data
+    :type _ticket_number: str, int
+    :param _include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type _include: str, tuple, list, set, None
+    :returns: The constructed URI
+    """
+    return f'tickets/{_ticket_number}' + _parse_constraints(_include=_include)
+
+
+def _get_tickets_uri(_include=None, _predefined_filter=None, _filters=None, _filter_logic='AND', _requester_id=None,
+                     _requester_email=None, _ticket_type=None, _updated_since=None, _ascending=None, _descending=None,
+                     _per_page=None, _page=None):
+    """This function constructs the URI used to retrieve a sequence of tickets with optional filters.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The constraints (other than the filters themselves) are ignored when ``_filters`` are supplied.
+
+    :param _include: A string or iterable of `embedding <https://api.freshservice.com/#view_a_ticket>`_ options
+    :type _include: str, tuple, list, set, None
+    :param _predefined_filter: One of the predefined filters ('new_and_my_open', 'watching', 'spam', 'deleted')
+    :type _predefined_filter: str, None
+    :param _filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type _filters: str, dict, class[freshpy.filters.Expression], None
+    :param _filter_logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :type _filter_logic: str
+    :param _requester_id: The numeric ID of a requester
+    :type _requester_id: str, int, None
+    :param _requester_email: The email address of a requester
+    :type _requester_email: str, None
+    :param _ticket_type: The type of ticket (e.g. ``Incident``, ``Service Request``, etc.)
+    :type _ticket_type: str, None
+    :param _updated_since: A date or timestamp (in UTC format) to be a threshold for when the ticket was last updated
+    :type _updated_since: str, None
+    :param _ascending: Determines if the tickets should be sorted in *ascending* order
+    :type _ascending: bool, None
+    :param _descending: Determines if the tickets should be sorted in *descending* order (default)
+    :type _descending: bool, None
+    :param _per_page: Displays a certain number of results per query
+    :type _per_page: str, int, None
+    :param _page: Returns a specific page number (used for paginated results)
+    :type _page: str, int, None
+    :returns: The constructed URI
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidPredefinedFilterError`,
+             :py:exc:`freshpy.errors.exceptions.InvalidFilterLogicError`
+    """
+    _uri = 'tickets'
+    if _filters:
+        _uri += _parse_filters(_filters, _filter_logic)
     else:
-        uri += _parse_constraints(_include=include, _predefined_filter=predefined_filter, _requester_id=requester_id,
-                                  _requester_email=requester_email, _ticket_type=ticket_type,
-                                  _updated_since=updated_since, _ascending=ascending, _descending=descending,
-                                  _per_page=per_page, _page=page)
-    return api.get_request_with_retries(freshpy_object, uri, verify_ssl=verify_ssl)
+        _uri += _parse_constraints(_include=_include, _predefined_filter=_predefined_filter,
+                                   _requester_id=_requester_id, _requester_email=_requester_email,
+                                   _ticket_type=_ticket_type, _updated_since=_updated_since, _ascending=_ascending,
+                                   _descending=_descending, _per_page=_per_page, _page=_page)
+    return _uri
 
 
 def _parse_filters(_filters=None, _logic='AND'):
+    """This function parses query filter(s) into the URI segment for the filter endpoint.
+
+    .. versionchanged:: 2.1.0
+       The query string is now constructed by the :py:func:`freshpy.tickets._get_filter_query` function and the
+       cached URI segment of a :py:class:`freshpy.filters.Expression` object is returned as-is.
+
+    .. versionadded:: 1.0.0
+
+    :param _filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type _filters: str, dict, class[freshpy.filters.Expression], None
+    :param _logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :type _logic: str
+    :returns: The URI segment with the encoded query
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidFilterLogicError`
+    """
+    if isinstance(_filters, filters_module.Expression):
+        return _filters.uri_segment
+    return f'/filter?query="{core_utils.url_encode(_get_filter_query(_filters, _logic))}"'
+
+
+def _get_filter_query(_filters=None, _logic='AND'):
+    """This function constructs the raw (unencoded) query string for the filter endpoint.
+
+    .. versionadded:: 2.1.0
+
+    :param _filters: Query filter(s) in the form of a structured query string or a dictionary of values
+    :type _filters: str, dict, class[freshpy.filters.Expression], None
+    :param _logic: Defines the logic to use as necessary in a filter query string (default is ``AND``)
+    :type _logic: str
+    :returns: The query string
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidFilterLogicError`
+    """
+    if isinstance(_filters, filters_module.Expression):
+        return _filters.query
     _filters = {} if not _filters else _filters
     if _logic.upper() not in FILTER_LOGIC_OPERATORS:
         raise errors.exceptions.InvalidFilterLogicError(value=_logic)
     if isinstance(_filters, str):
-        _filters = core_utils.url_encode(_filters)
-        _uri_segment = f'/filter?query="{_filters}"'
-    else:
-        _uri_segment = '/filter?query='
-        _filter = ''
-        for _idx, (_field, _value) in enumerate(_filters.items()):
-            _filter += f'{_field}:{_value}'
-            if _idx < (len(_filters) - 1):
-                _filter += f' {_logic.upper()} '
-        _filter = core_utils.url_encode(_filter)
-        _uri_segment += f'"{_filter}"'
-    return _uri_segment
+        return _filters
+    return f' {_logic.upper()} '.join(f'{_field}:{_value}' for _field, _value in _filters.items())
+
+
+def _get_filter_date(_value):
+    """This function converts a date string into a :py:class:`datetime.date` object.
+
+    .. versionadded:: 2.1.0
+
+    :param _value: The date (e.g. ``2024-01-31``) or a timestamp that begins with the date
+    :type _value: str, datetime.date, datetime.datetime
+    :returns: The :py:class:`datetime.date` object
+    """
+    if isinstance(_value, datetime):
+        return _value.date()
+    if isinstance(_value, date):
+        return _value
+    return datetime.strptime(_value[:10], FILTER_DATE_FORMAT).date()
+
+
+def _get_split_query(_base_query, _query_range):
+    """This function constructs the query string for a sub-query with a creation date range and optional values.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The ``created_at`` comparisons performed by the filter endpoint are inclusive of the supplied dates.
+
+    :param _base_query: The original query string
+    :type _base_query: str
+    :param _query_range: A tuple with the start date, end date and a dictionary of additional field values
+    :type _query_range: tuple
+    :returns: The query string for the sub-query
+    """
+    _start_date, _end_date, _field_values = _query_range
+    _conditions = [f'({_base_query})'] if _base_query else []
+    _conditions.append(f"created_at:>'{_start_date.strftime(FILTER_DATE_FORMAT)}'")
+    _conditions.append(f"created_at:<'{_end_date.strftime(FILTER_DATE_FORMAT)}'")
+    _conditions.extend(f'{_field}:{_value}' for _field, _value in _field_values.items())
+    return ' AND '.join(_conditions)
+
+
+def _split_query_range(_query_range, _split_values):
+    """This function splits a sub-query into disjoint sub-queries that together cover the same tickets.
+
+    .. versionadded:: 2.1.0
+
+    :param _query_range: A tuple with the start date, end date and a dictionary of additional field values
+    :type _query_range: tuple
+    :param _split_values: The values keyed by field used to split a single-day query
+    :type _split_values: dict
+    :returns: A list of the sub-query tuples or an empty list if the sub-query cannot be split further
+    """
+    _start_date, _end_date, _field_values = _query_range
+    if _start_date < _end_date:
+        _midpoint = _start_date + timedelta(days=(_end_date - _start_date).days // 2)
+        return [(_start_date, _midpoint, _field_values), (_midpoint + timedelta(days=1), _end_date, _field_values)]
+    for _field, _values in _split_values.items():
+        if _field not in _field_values:
+            return [(_start_date, _end_date, {**_field_values, _field: _value}) for _value in _values]
+    return []
+
+
+def _add_split_total(_split, _total):
+    """This function adds the total of a sub-query to the query it was split from and compares the totals.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A warning is logged once every sub-query has returned its total and the sum differs from the total of
+              the query that was split, which occurs when a single-day query contains tickets with values that are not
+              included in the ``split_values`` (e.g. a custom status) or when tickets are created during the export.
+
+    :param _split: The dictionary with the ``query_range``, ``total``, ``remaining`` and ``sum`` values of the query
+                   that was split
+    :type _split: dict
+    :param _total: The ``total`` value returned for the sub-query
+    :type _total: int
+    :returns: None
+    """
+    _split['remaining'] -= 1
+    _split['sum'] += _total
+    if _split['remaining'] == 0 and _split['sum'] != _split['total']:
+        logger.warning(f'The sub-queries for {_split["query_range"]} match {_split["sum"]} tickets but the query '
+                       f'matches {_split["total"]} tickets so some tickets may not be retrieved')
+
+
+def _get_filter_page(_freshpy_object, _query, _page, _verify_ssl=True):
+    """This function retrieves a single page of results for a filter query.
+
+    .. versionadded:: 2.1.0
+
+    :param _freshpy_object: The core :py:class:`freshpy.FreshPy` object
+    :type _freshpy_object: class[freshpy.FreshPy]
+    :param _query: The raw (unencoded) query string
+    :type _query: str
+    :param _page: The page number to retrieve
+    :type _page: int
+    :param _verify_ssl: Determines if SSL verification should occur (``True`` by default)
+    :type _verify_ssl: bool
+    :returns: The JSON response containing the ``tickets`` and ``total`` values
+    :raises: :py:exc:`freshpy.errors.exceptions.APIConnectionError`,
+             :py:exc:`freshpy.errors.exceptions.GETRequestError`
+    """
+    _uri = api._add_pagination(f'tickets/filter?query="{core_utils.url_encode(_query)}"', _page=_page)
+    _response = api.get_request_with_retries(_freshpy_object, _uri, verify_ssl=_verify_ssl)
+    if not isinstance(_response, dict) or 'tickets' not in _response:
+        raise errors.exceptions.GETRequestError(message=f'The filter query {_query} failed: {_response}')
+    return _response
 
 
 def _parse_constraints(_include=None, _predefined_filter=None, _requester_id=None, _requester_email=None,
@@ -4,7 +4,8 @@
 :Synopsis:       This is the ``__init__`` module for the freshpy.utils modules
 :Created By:     Jeff Shurtliff
 :Last Modified:  Jeff Shurtliff
-:Modified Date:  29 Jan 2025
+:Modified Date:  18 Oct 2026
 """
 
-__all__ = ['core_utils', 'log_utils', 'version']
+__all__ = ['cache', 'columnar', 'core_utils', 'hooks', 'json_backend', 'json_stream', 'log_queue', 'log_utils',
+           'metrics', 'rate_limit', 'retry', 'tracing', 'transport', 'version']
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.cache
+:Synopsis:          In-memory LRU cache with per-endpoint expiration and conditional request validators for the JSON
+                    data returned by GET requests
+:Usage:             ``from freshpy.utils.cache import ResponseCache``
+:Example:           ``cache = ResponseCache(max_size=2048, endpoint_ttls={'tickets': 15})``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Define constants
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 60
+DEFAULT_ENDPOINT_TTLS = {
+    'agents': 3600,
+    'users': 3600,
+    'tickets': 30,
+}
+CONTENT_HASH_SIZE = 16
+
+
+class ResponseCache(object):
+    """This class stores the JSON data returned by GET requests and evicts the least recently used entries.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Entries also store the validators of the response (i.e. the ``ETag`` and ``Last-Modified`` headers and
+              a hash of the body) and expired entries with validators are retained until they are evicted so they can
+              be revalidated with a conditional request.
+
+    .. caution:: Cached data is returned as the same object on every hit, so it should not be modified by the caller.
+                 This also means that an unchanged payload is returned as the same object after it is revalidated,
+                 which allows callers to skip reprocessing it (e.g. ``if data is previous_data``).
+    """
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, default_ttl=DEFAULT_TTL, endpoint_ttls=None):
+        """This method instantiates the :py:class:`freshpy.utils.cache.ResponseCache` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param max_size: The maximum number of entries to store before the least recently used entry is evicted
+        :type max_size: int
+        :param default_ttl: The number of seconds an entry remains valid when its endpoint has no specific value
+        :type default_ttl: int, float
+        :param endpoint_ttls: The number of seconds entries remain valid keyed by endpoint (e.g. ``tickets``),
+                              which are merged with the default values
+        :type endpoint_ttls: dict, None
+        """
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.max_size = max(1, int(max_size))
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS)
+        self.endpoint_ttls.update(endpoint_ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self.bytes_saved = 0
+
+    def __len__(self):
+        """This method returns the number of entries currently stored in the cache.
+
+        .. versionadded:: 2.1.0
+        """
+        return len(self._entries)
+
+    def get_ttl(self, uri):
+        """This method returns the number of seconds that an entry for a given URI remains valid.
+
+        .. versionadded:: 2.1.0
+
+        :param uri: The URI relative to the API base URL (e.g. ``tickets/123``)
+        :type uri: str
+        :returns: The number of seconds as an integer or float
+        """
+        endpoint = uri.lstrip('/').split('?')[0].split('/')[0]
+        return self.endpoint_ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key):
+        """This method returns the data stored for a given key if it exists and has not expired.
+
+        .. versionadded:: 2.1.0
+
+        :param key: The cache key (i.e. the full query URL)
+        :type key: str
+        :returns: The cached data or ``None`` if there is no valid entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None and not entry[2]:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_entry(self, key):
+        """This method returns the data and validators stored for a given key even when the entry has expired.
+
+        .. versionadded:: 2.1.0
+
+        :param key: The cache key (i.e. the full query URL)
+        :type key: str
+        :returns: A tuple with the cached data and the dictionary of validators, or ``None`` if there is no entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else (entry[1], entry[2])
+
+    def set(self, key, value, ttl, validators=None):
+        """This method stores data for a given key and evicts the least recently used entries as needed.
+
+        .. versionadded:: 2.1.0
+
+        :param key: The cache key (i.e. the full query URL)
+        :type key: str
+        :param value: The data to store
+        :param ttl: The number of seconds the entry remains valid (the entry is not stored when the value is ``0``)
+        :type ttl: int, float
+        :param validators: The validators returned by :py:func:`freshpy.utils.cache.get_response_validators`
+        :type validators: dict, None
+        :returns: None
+        """
+        if not ttl or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value, validators or {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revalidate(self, key, ttl, validators=None):
+        """This method renews an expired entry after the API confirmed that its data has not changed.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: When ``validators`` are not supplied, the entry was renewed by a ``304 Not Modified`` response and
+                  the size of the stored body is added to the ``bytes_saved`` counter. Otherwise, the body was
+                  downloaded again but its content hash matched the stored entry.
+
+        :param key: The cache key (i.e. the full query URL)
+        :type key: str
+        :param ttl: The number of seconds the entry remains valid
+        :type ttl: int, float
+        :param validators: The validators of the new response (when the body was downloaded again)
+        :type validators: dict, None
+        :returns: The cached data or ``None`` if there is no entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if validators is None:
+                validators = entry[2]
+                self.not_modified += 1
+                self.bytes_saved += validators.get('size', 0)
+            else:
+                self.unchanged += 1
+            self._entries[key] = (time.monotonic() + max(ttl or 0, 0), entry[1], validators)
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def invalidate(self, prefix=None):
+        """This method removes the entries whose keys begin with a given prefix, or all entries if none is supplied.
+
+        .. versionadded:: 2.1.0
+
+        :param prefix: The prefix of the keys to remove
+        :type prefix: str, None
+        :returns: The number of entries that were removed as an integer
+        """
+        with self._lock:
+            if prefix is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get_stats(self):
+        """This method returns the hit, miss and eviction counters for the cache.
+
+        .. versionadded:: 2.1.0
+
+        :returns: A dictionary with the cache statistics
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'not_modified': self.not_modified,
+                'unchanged': self.unchanged,
+                'bytes_saved': self.bytes_saved,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+            }
+
+
+def get_response_validators(response):
+    """This function returns the validators used to make conditional requests for the data in a response.
+
+    .. versionadded:: 2.1.0
+
+    :param response: The raw :py:mod:`requests` (or compatible) response
+    :returns: A dictionary with the ``etag`` and ``last_modified`` headers (if returned by the API), the
+              ``content_hash`` of the body and the ``size`` of the body in bytes
+    """
+    validators = {
+        'content_hash': hashlib.blake2b(response.content, digest_size=CONTENT_HASH_SIZE).hexdigest(),
+        'size': len(response.content),
+    }
+    if response.headers.get('ETag'):
+        validators['etag'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['last_modified'] = response.headers['Last-Modified']
+    return validators
+
+
+def get_conditional_headers(validators):
+    """This function returns the headers used to make a conditional request with a set of validators.
+
+    .. versionadded:: 2.1.0
+
+    :param validators: The validators returned by :py:func:`freshpy.utils.cache.get_response_validators`
+    :type validators: dict
+    :returns: A dictionary with the ``If-None-Match`` and/or ``If-Modified-Since`` headers (which is empty when the
+              API did not return any validators)
+    """
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
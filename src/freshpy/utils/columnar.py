@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.columnar
+:Synopsis:          Column buffers that convert records into Arrow record batches or NumPy arrays in chunks
+:Usage:             ``from freshpy.utils.columnar import ColumnBuffer``
+:Example:           ``buffer = ColumnBuffer({'id': 'int', 'created_at': 'timestamp'})``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import os
+import sys
+import json
+import zipfile
+import tempfile
+import importlib
+
+from . import core_utils
+from .. import errors
+
+# Define constants
+DEFAULT_CHUNK_SIZE = 50000
+COLUMN_TYPES = ['int', 'float', 'bool', 'string', 'timestamp', 'json']
+NUMPY_DTYPES = {'int': 'int64', 'float': 'float64', 'bool': 'bool'}
+PACKAGE_MODULES = {
+    'numpy': ('numpy',),
+    'pyarrow': ('pyarrow', 'pyarrow.compute', 'pyarrow.ipc', 'pyarrow.parquet'),
+}
+TICKET_COLUMNS = {
+    'id': 'int',
+    'subject': 'string',
+    'type': 'string',
+    'status': 'int',
+    'priority': 'int',
+    'source': 'int',
+    'urgency': 'int',
+    'impact': 'int',
+    'category': 'string',
+    'sub_category': 'string',
+    'item_category': 'string',
+    'group_id': 'int',
+    'department_id': 'int',
+    'requester_id': 'int',
+    'requested_for_id': 'int',
+    'responder_id': 'int',
+    'workspace_id': 'int',
+    'due_by': 'timestamp',
+    'fr_due_by': 'timestamp',
+    'created_at': 'timestamp',
+    'updated_at': 'timestamp',
+    'is_escalated': 'bool',
+    'fr_escalated': 'bool',
+    'deleted': 'bool',
+    'spam': 'bool',
+    'tags': 'json',
+}
+
+# Define the optional packages that have been imported (where ``None`` indicates the package is not installed)
+_imported_packages = {}
+
+
+class ColumnBuffer(object):
+    """This class accumulates the values of selected fields by column and converts them into columnar chunks.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Nested fields can be selected using dotted names (e.g. ``stats.resolved_at`` or
+              ``custom_fields.location``) and values of the ``json`` type are stored as JSON strings.
+    """
+    def __init__(self, column_types=None):
+        """This method instantiates the :py:class:`freshpy.utils.columnar.ColumnBuffer` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param column_types: The column types (``int``, ``float``, ``bool``, ``string``, ``timestamp`` or ``json``)
+                             keyed by field name, or a list of field names whose types are taken from the default
+                             ticket columns (and otherwise stored as strings)
+        :type column_types: dict, list, tuple, None
+        :raises: :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`
+        """
+        if column_types is None:
+            column_types = dict(TICKET_COLUMNS)
+        elif not isinstance(column_types, dict):
+            column_types = {column: TICKET_COLUMNS.get(column, 'string') for column in column_types}
+        for column_type in column_types.values():
+            if column_type not in COLUMN_TYPES:
+                raise errors.exceptions.CurrentlyUnsupportedError(f'{column_type} column type')
+        self.column_types = column_types
+        self._paths = [(column, column.split('.')) for column in column_types]
+        self._values = {column: [] for column in column_types}
+        self._row_count = 0
+
+    def __len__(self):
+        """This method returns the number of rows currently held in the buffer.
+
+        .. versionadded:: 2.1.0
+        """
+        return self._row_count
+
+    def append(self, record):
+        """This method appends the values of a record to the buffer.
+
+        .. versionadded:: 2.1.0
+
+        :param record: The JSON object for the record
+        :type record: dict
+        :returns: None
+        """
+        for column, path in self._paths:
+            value = record.get(path[0])
+            for key in path[1:]:
+                value = value.get(key) if isinstance(value, dict) else None
+            self._values[column].append(value)
+        self._row_count += 1
+
+    def get_arrow_schema(self):
+        """This method returns the Arrow schema for the buffered columns.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The :py:class:`pyarrow.Schema` object
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+        """
+        pyarrow = _require_package('pyarrow')
+        return pyarrow.schema([(column, _get_arrow_type(column_type))
+                               for column, column_type in self.column_types.items()])
+
+    def flush_arrow(self):
+        """This method converts the buffered values into an Arrow record batch and empties the buffer.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The :py:class:`pyarrow.RecordBatch` object
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+        """
+        schema = self.get_arrow_schema()
+        pyarrow = _require_package('pyarrow')
+        arrays = []
+        for column, column_type in self.column_types.items():
+            values = self._values[column]
+            if column_type == 'timestamp':
+                timestamps = pyarrow.compute.strptime(pyarrow.array(values, type=pyarrow.string()),
+                                                      format=core_utils.TIMESTAMP_FORMAT, unit='s',
+                                                      error_is_null=True)
+                arrays.append(timestamps.cast(schema.field(column).type))
+            else:
+                arrays.append(pyarrow.array(_coerce_values(values, column_type), type=schema.field(column).type))
+        self._reset()
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def flush_numpy(self):
+        """This method converts the buffered values into NumPy arrays and empties the buffer.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: Missing values in ``int``, ``float`` and ``bool`` columns are represented as ``NaN`` (which
+                  promotes the column to ``float64``), missing timestamps are represented as ``NaT`` and string
+                  columns use the ``object`` data type.
+
+        :returns: A dictionary of :py:class:`numpy.ndarray` objects keyed by column name
+        :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+        """
+        numpy = _require_package('numpy')
+        arrays = {}
+        for column, column_type in self.column_types.items():
+            values = _coerce_values(self._values[column], column_type)
+            if column_type == 'timestamp':
+                arrays[column] = _to_datetime64(values)
+            elif column_type in ('string', 'json'):
+                arrays[column] = numpy.array(values, dtype=object)
+            elif None in values:
+                arrays[column] = numpy.array([numpy.nan if value is None else value for value in values],
+                                             dtype='float64')
+            else:
+                arrays[column] = numpy.array(values, dtype=NUMPY_DTYPES[column_type])
+        self._reset()
+        return arrays
+
+    def _reset(self):
+        """This method empties the buffer.
+
+        .. versionadded:: 2.1.0
+
+        :returns: None
+        """
+        self._values = {column: [] for column in self.column_types}
+        self._row_count = 0
+
+
+def write_arrow_file(record_batches, file_path, schema, file_format='parquet'):
+    """This function writes a sequence of Arrow record batches to a Parquet or Feather file one batch at a time.
+
+    .. versionadded:: 2.1.0
+
+    :param record_batches: An iterable of :py:class:`pyarrow.RecordBatch` objects
+    :type record_batches: generator, list, tuple
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param schema: The :py:class:`pyarrow.Schema` object shared by every batch
+    :param file_format: The file format (``parquet`` or ``feather``)
+    :type file_format: str
+    :returns: The number of rows written as an integer
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    pyarrow = _require_package('pyarrow')
+    if file_format == 'parquet':
+        writer = pyarrow.parquet.ParquetWriter(file_path, schema)
+    else:
+        writer = pyarrow.ipc.new_file(file_path, schema)
+    rows_written = 0
+    try:
+        for record_batch in record_batches:
+            if file_format == 'parquet':
+                writer.write_batch(record_batch)
+            else:
+                writer.write(record_batch)
+            rows_written += record_batch.num_rows
+    finally:
+        writer.close()
+    return rows_written
+
+
+def to_arrow_table(record_batches, schema):
+    """This function combines a sequence of Arrow record batches into a single table without copying the data.
+
+    .. versionadded:: 2.1.0
+
+    :param record_batches: An iterable of :py:class:`pyarrow.RecordBatch` objects
+    :type record_batches: generator, list, tuple
+    :param schema: The :py:class:`pyarrow.Schema` object shared by every batch
+    :returns: The :py:class:`pyarrow.Table` object
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    pyarrow = _require_package('pyarrow')
+    return pyarrow.Table.from_batches(list(record_batches), schema=schema)
+
+
+def write_numpy_file(numpy_chunks, file_path, column_types):
+    """This function writes a sequence of NumPy chunks to an uncompressed ``.npz`` file one chunk at a time.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Each chunk is spooled to a temporary file per column next to the output file, and each column is then
+              copied into its ``.npy`` member of the archive chunk by chunk, so the ``int``, ``float``, ``bool`` and
+              ``timestamp`` columns are never held in memory in full. The ``string`` and ``json`` columns use the
+              ``object`` data type, which NumPy can only pickle as a whole, so those columns are combined one column
+              at a time and the file must be loaded with ``allow_pickle=True``.
+
+    :param numpy_chunks: An iterable of dictionaries of :py:class:`numpy.ndarray` objects keyed by column name
+    :type numpy_chunks: generator, list, tuple
+    :param file_path: The path to the file that will be written
+    :type file_path: str
+    :param column_types: The column types keyed by column name
+    :type column_types: dict
+    :returns: The number of rows written as an integer
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    numpy = _require_package('numpy')
+    dtypes = {column: [] for column in column_types}
+    rows_written = 0
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(file_path))) as spool_dir:
+        spool_paths = {column: os.path.join(spool_dir, f'{index}.npy') for index, column in enumerate(column_types)}
+        spool_files = {column: open(spool_path, 'wb') for column, spool_path in spool_paths.items()}
+        try:
+            for chunk in numpy_chunks:
+                for column in column_types:
+                    numpy.save(spool_files[column], chunk[column], allow_pickle=True)
+                    dtypes[column].append(chunk[column].dtype)
+                rows_written += len(chunk[next(iter(column_types))]) if column_types else 0
+        finally:
+            for spool_file in spool_files.values():
+                spool_file.close()
+        empty_arrays = ColumnBuffer(column_types).flush_numpy()
+        with zipfile.ZipFile(file_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as numpy_file:
+            for column in column_types:
+                with numpy_file.open(f'{column}.npy', 'w', force_zip64=True) as member:
+                    _write_numpy_column(member, spool_paths[column], len(dtypes[column]), rows_written,
+                                        numpy.result_type(*dtypes[column]) if dtypes[column]
+                                        else empty_arrays[column].dtype)
+    return rows_written
+
+
+def concatenate_numpy_chunks(chunks, column_types):
+    """This function concatenates the NumPy arrays of multiple chunks into a single array for each column.
+
+    .. versionadded:: 2.1.0
+
+    :param chunks: A list of dictionaries of :py:class:`numpy.ndarray` objects keyed by column name
+    :type chunks: list
+    :param column_types: The column types keyed by column name
+    :type column_types: dict
+    :returns: A dictionary of :py:class:`numpy.ndarray` objects keyed by column name
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    numpy = _require_package('numpy')
+    if not chunks:
+        return ColumnBuffer(column_types).flush_numpy()
+    return {column: numpy.concatenate([chunk[column] for chunk in chunks]) for column in column_types}
+
+
+def is_arrow_available():
+    """This function checks if the optional :py:mod:`pyarrow` package is installed.
+
+    .. versionadded:: 2.1.0
+
+    :returns: Boolean value indicating if :py:mod:`pyarrow` is installed
+    """
+    return _import_package('pyarrow') is not None
+
+
+def _import_package(_package):
+    """This function imports an optional package the first time it is needed so that importing freshpy stays fast.
+
+    .. versionadded:: 2.1.0
+
+    :param _package: The name of the package (``numpy`` or ``pyarrow``)
+    :type _package: str
+    :returns: The imported module or ``None`` if the package is not installed
+    """
+    if _package not in _imported_packages:
+        try:
+            for _module_name in PACKAGE_MODULES[_package]:
+                importlib.import_module(_module_name)
+            _imported_packages[_package] = sys.modules[_package]
+        except ImportError:
+            _imported_packages[_package] = None
+    return _imported_packages[_package]
+
+
+def _require_package(_package):
+    """This function imports an optional package and raises an exception when it is not installed.
+
+    .. versionadded:: 2.1.0
+
+    :param _package: The name of the package (``numpy`` or ``pyarrow``)
+    :type _package: str
+    :returns: The imported module
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    _module = _import_package(_package)
+    if _module is None:
+        raise errors.exceptions.MissingDependencyError(package=_package)
+    return _module
+
+
+def _get_arrow_type(_column_type):
+    """This function returns the Arrow data type for a column type.
+
+    .. versionadded:: 2.1.0
+
+    :param _column_type: The column type (e.g. ``timestamp``)
+    :type _column_type: str
+    :returns: The :py:class:`pyarrow.DataType` object
+    """
+    pyarrow = _require_package('pyarrow')
+    return {
+        'int': pyarrow.int64(),
+        'float': pyarrow.float64(),
+        'bool': pyarrow.bool_(),
+        'string': pyarrow.string(),
+        'timestamp': pyarrow.timestamp('s', tz='UTC'),
+        'json': pyarrow.string(),
+    }[_column_type]
+
+
+def _coerce_values(_values, _column_type):
+    """This function converts the buffered values of a column into the Python types expected for the column type.
+
+    .. versionadded:: 2.1.0
+
+    :param _values: The buffered values
+    :type _values: list
+    :param _column_type: The column type (e.g. ``int``)
+    :type _column_type: str
+    :returns: The list of converted values where missing values are ``None``
+    """
+    if _column_type == 'json':
+        return [None if _value is None else json.dumps(_value) for _value in _values]
+    if _column_type == 'string':
+        return [_value if _value is None or isinstance(_value, str) else str(_value) for _value in _values]
+    if _column_type == 'int':
+        return [None if _value is None or _value == '' else int(_value) for _value in _values]
+    if _column_type == 'float':
+        return [None if _value is None or _value == '' else float(_value) for _value in _values]
+    if _column_type == 'bool':
+        return [None if _value is None else bool(_value) for _value in _values]
+    return _values
+
+
+def _to_datetime64(_values):
+    """This function converts timestamp strings in the API format into a NumPy ``datetime64[s]`` array.
+
+    .. versionadded:: 2.1.0
+
+    :param _values: The timestamp strings (e.g. ``2024-01-31T17:45:00Z``) where missing values are ``None``
+    :type _values: list
+    :returns: The :py:class:`numpy.ndarray` object where missing values are ``NaT``
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    numpy = _require_package('numpy')
+    return numpy.array([_value.rstrip('Z') if _value else 'NaT' for _value in _values], dtype='datetime64[s]')
+
+
+def _write_numpy_column(_member, _spool_path, _chunk_count, _row_count, _dtype):
+    """This function copies the spooled chunks of a column into a ``.npy`` member of an archive.
+
+    .. versionadded:: 2.1.0
+
+    :param _member: The writable file object for the archive member
+    :param _spool_path: The path to the temporary file that contains the arrays of the column for each chunk
+    :type _spool_path: str
+    :param _chunk_count: The number of chunks in the temporary file
+    :type _chunk_count: int
+    :param _row_count: The total number of rows in the column
+    :type _row_count: int
+    :param _dtype: The data type that every chunk of the column is cast to
+    :type _dtype: class[numpy.dtype]
+    :returns: None
+    :raises: :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    numpy = _require_package('numpy')
+    with open(_spool_path, 'rb') as _spool_file:
+        _chunks = (numpy.load(_spool_file, allow_pickle=True) for _ in range(_chunk_count))
+        if _dtype.hasobject:
+            _column = numpy.concatenate(list(_chunks)) if _chunk_count else numpy.array([], dtype=_dtype)
+            numpy.lib.format.write_array(_member, _column, allow_pickle=True)
+            return
+        numpy.lib.format.write_array_header_1_0(_member, {
+            'descr': numpy.lib.format.dtype_to_descr(_dtype), 'fortran_order': False, 'shape': (_row_count,)})
+        for _chunk in _chunks:
+            _member.write(_chunk.astype(_dtype, copy=False).tobytes())
@@ -4,10 +4,14 @@
 :Synopsis:          Collection of supporting utilities and functions to complement the primary modules
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     30 Dec 2021
+:Modified Date:     18 Oct 2026
 """
 
 import urllib.parse
+from datetime import datetime, timezone
+
+# Define constants
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 
 def construct_query_string(existing_query=None, appendage=None):
@@ -55,4 +59,33 @@ def url_decode(encoded_string):
     :type encoded_string: str
     :returns: The unencoded string
     """
-    return urllib.parse.unquote_plus(encoded_string)
\ No newline at end of file
+    return urllib.parse.unquote_plus(encoded_string)
+
+
+def parse_timestamp(timestamp):
+    """This function converts a UTC timestamp string from the Freshservice API into a :py:class:`datetime` object.
+
+    .. versionadded:: 2.1.0
+
+    :param timestamp: The timestamp string (e.g. ``2024-01-31T17:45:00Z``)
+    :type timestamp: str, None
+    :returns: The timezone-aware :py:class:`datetime.datetime` object or ``None`` if no timestamp was supplied
+    :raises: :py:exc:`ValueError`
+    """
+    if not timestamp:
+        return None
+    return datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def format_timestamp(timestamp):
+    """This function converts a :py:class:`datetime` object into the UTC timestamp format used by the API.
+
+    .. versionadded:: 2.1.0
+
+    :param timestamp: The :py:class:`datetime.datetime` object (which is assumed to be UTC if timezone-naive)
+    :type timestamp: class[datetime.datetime]
+    :returns: The timestamp string (e.g. ``2024-01-31T17:45:00Z``)
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.strftime(TIMESTAMP_FORMAT)
@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.hooks
+:Synopsis:          Request lifecycle hooks with timing breakdowns and ready-made metrics and logging adapters
+:Usage:             ``from freshpy.utils.hooks import PrometheusAdapter``
+:Example:           ``PrometheusAdapter().attach(freshpy_object)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import re
+import logging
+import threading
+
+from . import log_utils
+from .. import errors
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define constants
+HOOK_EVENTS = ('on_request_start', 'on_response', 'on_retry', 'on_throttle')
+TIMING_PHASES = ('connect', 'ttfb', 'download', 'decode', 'total')
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_METRIC_PREFIX = 'freshpy'
+ID_SEGMENT_PATTERN = re.compile(r'^\d+$')
+
+
+class RequestEvent(object):
+    """This class describes a single API request attempt and is passed to every hook callback.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The timing values are in seconds and remain ``None`` when a phase was not measured. The ``connect``
+              value is ``0.0`` when a pooled connection was reused, ``ttfb`` is the time spent waiting for the
+              response headers after connecting, and for streamed responses ``download`` also includes the time
+              spent decoding the records as they arrive.
+    """
+    __slots__ = ('method', 'url', 'endpoint', 'attempt', 'status_code', 'wire_bytes', 'decoded_bytes', 'connect',
+                 'ttfb', 'download', 'decode', 'total', 'delay', 'exception')
+
+    def __init__(self, method, url, endpoint, attempt=1):
+        """This method instantiates the event for a request attempt.
+
+        .. versionadded:: 2.1.0
+
+        :param method: The HTTP method (e.g. ``GET``)
+        :type method: str
+        :param url: The full query URL
+        :type url: str
+        :param endpoint: The endpoint template (e.g. ``tickets/{id}``)
+        :type endpoint: str
+        :param attempt: The attempt number for the request
+        :type attempt: int
+        """
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.status_code = None
+        self.wire_bytes = None
+        self.decoded_bytes = None
+        self.connect = None
+        self.ttfb = None
+        self.download = None
+        self.decode = None
+        self.total = None
+        self.delay = None
+        self.exception = None
+
+    def __repr__(self):
+        """This method returns a representation of the event that includes the endpoint, attempt and status code.
+
+        .. versionadded:: 2.1.0
+        """
+        return f'RequestEvent({self.method} {self.endpoint!r}, attempt={self.attempt}, status={self.status_code})'
+
+    @property
+    def timings(self):
+        """This property returns the timing breakdown of the request as a dictionary.
+
+        .. versionadded:: 2.1.0
+
+        :returns: A dictionary with the ``connect``, ``ttfb``, ``download``, ``decode`` and ``total`` values
+        """
+        return {_phase: getattr(self, _phase) for _phase in TIMING_PHASES}
+
+
+class HookManager(object):
+    """This class stores the callbacks registered for the request lifecycle events and dispatches events to them.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: An exception raised by a callback is logged rather than propagated so that a faulty metrics or logging
+              hook can never cause an API call to fail.
+    """
+    def __init__(self, hooks=None):
+        """This method instantiates the :py:class:`freshpy.utils.hooks.HookManager` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param hooks: The callbacks to register keyed by event name, where each value is a function or a list of
+                      functions
+        :type hooks: dict, None
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        self._lock = threading.Lock()
+        self._callbacks = {_event: () for _event in HOOK_EVENTS}
+        for _event, _callbacks in (hooks or {}).items():
+            for _callback in (_callbacks if isinstance(_callbacks, (list, tuple)) else [_callbacks]):
+                self.register(_event, _callback)
+
+    def __bool__(self):
+        """This method returns ``True`` when at least one callback is registered.
+
+        .. versionadded:: 2.1.0
+        """
+        return any(self._callbacks.values())
+
+    def register(self, event, callback):
+        """This method registers a callback for a request lifecycle event.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event (``on_request_start``, ``on_response``, ``on_retry`` or ``on_throttle``)
+        :type event: str
+        :param callback: The function that is called with the :py:class:`freshpy.utils.hooks.RequestEvent` object
+        :type callback: function
+        :returns: None
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        _validate_event(event)
+        with self._lock:
+            self._callbacks[event] = self._callbacks[event] + (callback,)
+
+    def unregister(self, event, callback):
+        """This method removes a callback that was registered for a request lifecycle event.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event
+        :type event: str
+        :param callback: The function that was registered
+        :type callback: function
+        :returns: A Boolean value indicating if the callback was found and removed
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+        """
+        _validate_event(event)
+        with self._lock:
+            callbacks = self._callbacks[event]
+            self._callbacks[event] = tuple(_callback for _callback in callbacks if _callback != callback)
+            return len(self._callbacks[event]) != len(callbacks)
+
+    def emit(self, event, request_event):
+        """This method calls every callback registered for an event.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The name of the event
+        :type event: str
+        :param request_event: The event data passed to the callbacks
+        :type request_event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        for callback in self._callbacks[event]:
+            try:
+                callback(request_event)
+            except Exception as exc_msg:
+                logger.warning(f'The {event} hook {getattr(callback, "__name__", callback)!r} raised an exception: '
+                               f'{type(exc_msg).__name__}: {exc_msg}')
+
+
+class PrometheusAdapter(object):
+    """This class aggregates request events into Prometheus-style counters and histograms.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The metrics are held in memory and can be exposed using the Prometheus text format returned by the
+              :py:meth:`freshpy.utils.hooks.PrometheusAdapter.render` method, which does not require the
+              ``prometheus_client`` package.
+    """
+    def __init__(self, prefix=DEFAULT_METRIC_PREFIX, buckets=DEFAULT_BUCKETS):
+        """This method instantiates the :py:class:`freshpy.utils.hooks.PrometheusAdapter` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param prefix: The prefix for the metric names (``freshpy`` by default)
+        :type prefix: str
+        :param buckets: The upper bounds of the histogram buckets in seconds
+        :type buckets: tuple, list
+        """
+        self._lock = threading.Lock()
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self.requests = {}
+        self.retries = {}
+        self.throttles = {}
+        self.throttle_seconds = {}
+        self.response_bytes = {}
+        self.durations = {}
+
+    def attach(self, freshpy_object):
+        """This method registers the callbacks of the adapter with a core object or hook manager.
+
+        .. versionadded:: 2.1.0
+
+        :param freshpy_object: The core object or the :py:class:`freshpy.utils.hooks.HookManager` object
+        :returns: The adapter so that calls can be chained
+        """
+        _attach_callbacks(self, freshpy_object, ('on_response', 'on_retry', 'on_throttle'))
+        return self
+
+    def on_response(self, event):
+        """This method counts a response and records its bytes and timing breakdown.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The event data for the response
+        :type event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        with self._lock:
+            _increment(self.requests, (event.endpoint, str(event.status_code)))
+            for _kind in ('wire', 'decoded'):
+                _bytes = getattr(event, f'{_kind}_bytes')
+                if _bytes is not None:
+                    _increment(self.response_bytes, (event.endpoint, _kind), _bytes)
+            for _phase in TIMING_PHASES:
+                _seconds = getattr(event, _phase)
+                if _seconds is not None:
+                    self._observe((event.endpoint, _phase), _seconds)
+
+    def on_retry(self, event):
+        """This method counts a retried request attempt.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The event data for the attempt that will be retried
+        :type event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        _reason = type(event.exception).__name__ if event.exception is not None else str(event.status_code)
+        with self._lock:
+            _increment(self.retries, (event.endpoint, _reason))
+
+    def on_throttle(self, event):
+        """This method counts a throttled request and the number of seconds spent waiting.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The event data for the throttled request
+        :type event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        with self._lock:
+            _increment(self.throttles, (event.endpoint,))
+            _increment(self.throttle_seconds, (event.endpoint,), event.delay or 0.0)
+
+    def _observe(self, _key, _value):
+        """This method adds an observation to a histogram while the lock is held.
+
+        .. versionadded:: 2.1.0
+
+        :param _key: The endpoint and phase labels
+        :type _key: tuple
+        :param _value: The observed number of seconds
+        :type _value: float
+        :returns: None
+        """
+        _histogram = self.durations.get(_key)
+        if _histogram is None:
+            _histogram = self.durations[_key] = [[0] * len(self.buckets), 0.0, 0]
+        for _index, _bound in enumerate(self.buckets):
+            if _value <= _bound:
+                _histogram[0][_index] += 1
+        _histogram[1] += _value
+        _histogram[2] += 1
+
+    def render(self):
+        """This method returns the metrics using the Prometheus text exposition format.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The metrics as a string
+        """
+        _prefix = self.prefix
+        with self._lock:
+            _lines = _render_counter(f'{_prefix}_requests_total', 'API responses by endpoint and status code',
+                                     ('endpoint', 'status'), self.requests)
+            _lines += _render_counter(f'{_prefix}_retries_total', 'Retried API request attempts',
+                                      ('endpoint', 'reason'), self.retries)
+            _lines += _render_counter(f'{_prefix}_throttles_total', 'Throttled API requests', ('endpoint',),
+                                      self.throttles)
+            _lines += _render_counter(f'{_prefix}_throttle_seconds_total', 'Seconds spent waiting while throttled',
+                                      ('endpoint',), self.throttle_seconds)
+            _lines += _render_counter(f'{_prefix}_response_bytes_total', 'Response body bytes over the wire and '
+                                      'after decompression', ('endpoint', 'kind'), self.response_bytes)
+            _name = f'{_prefix}_request_duration_seconds'
+            _lines += [f'# HELP {_name} API request duration by phase', f'# TYPE {_name} histogram']
+            for (_endpoint, _phase), (_counts, _sum, _count) in sorted(self.durations.items()):
+                _labels = f'endpoint="{_endpoint}",phase="{_phase}"'
+                for _bound, _bucket_count in zip(self.buckets, _counts):
+                    _lines.append(f'{_name}_bucket{{{_labels},le="{_bound}"}} {_bucket_count}')
+                _lines.append(f'{_name}_bucket{{{_labels},le="+Inf"}} {_count}')
+                _lines.append(f'{_name}_sum{{{_labels}}} {_sum}')
+                _lines.append(f'{_name}_count{{{_labels}}} {_count}')
+        return '\n'.join(_lines) + '\n'
+
+
+class LoggingAdapter(object):
+    """This class writes request events to a logger initialized with the :py:mod:`freshpy.utils.log_utils` module.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, event_logger=None, level=logging.DEBUG, throttle_level=logging.INFO):
+        """This method instantiates the :py:class:`freshpy.utils.hooks.LoggingAdapter` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param event_logger: The logger to use (the logger for this module is used when not defined)
+        :type event_logger: class[logging.Logger], None
+        :param level: The level used for responses and retries (``DEBUG`` by default)
+        :type level: int
+        :param throttle_level: The level used for throttled requests (``INFO`` by default)
+        :type throttle_level: int
+        """
+        self.logger = event_logger if event_logger is not None else logger
+        self.level = level
+        self.throttle_level = throttle_level
+
+    def attach(self, freshpy_object):
+        """This method registers the callbacks of the adapter with a core object or hook manager.
+
+        .. versionadded:: 2.1.0
+
+        :param freshpy_object: The core object or the :py:class:`freshpy.utils.hooks.HookManager` object
+        :returns: The adapter so that calls can be chained
+        """
+        _attach_callbacks(self, freshpy_object, ('on_response', 'on_retry', 'on_throttle'))
+        return self
+
+    def on_response(self, event):
+        """This method logs a response along with its timing breakdown and size.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The event data for the response
+        :type event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        if not self.logger.isEnabledFor(self.level):
+            return
+        _phases = ', '.join(f'{_phase} {_format_ms(getattr(event, _phase))}' for _phase in TIMING_PHASES[:-1])
+        self.logger.log(self.level, f'{event.method} {event.endpoint} returned {event.status_code} in '
+                                    f'{_format_ms(event.total)} ({_phases}) with {event.wire_bytes} wire bytes '
+                                    f'(Attempt {event.attempt})')
+
+    def on_retry(self, event):
+        """This method logs a request attempt that will be retried.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The event data for the attempt that will be retried
+        :type event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        _reason = f'{type(event.exception).__name__}' if event.exception is not None else \
+            f'the {event.status_code} status code'
+        self.logger.log(self.level, f'Retrying {event.method} {event.endpoint} after {_reason} in '
+                                    f'{_format_ms(event.delay)} (Attempt {event.attempt})')
+
+    def on_throttle(self, event):
+        """This method logs a request that was delayed to remain within the rate limit.
+
+        .. versionadded:: 2.1.0
+
+        :param event: The event data for the throttled request
+        :type event: class[freshpy.utils.hooks.RequestEvent]
+        :returns: None
+        """
+        _cause = 'after a 429 response' if event.status_code == 429 else 'by the rate limiter'
+        self.logger.log(self.throttle_level, f'{event.method} {event.endpoint} was throttled {_cause} for '
+                                             f'{_format_ms(event.delay)}')
+
+
+def get_endpoint_template(uri):
+    """This function returns the endpoint template for a URI by removing the query string and replacing IDs.
+
+    .. versionadded:: 2.1.0
+
+    :param uri: The URI relative to the API base URL (e.g. ``tickets/123/conversations?page=2``)
+    :type uri: str
+    :returns: The endpoint template (e.g. ``tickets/{id}/conversations``)
+    """
+    path = uri.split('?', 1)[0].strip('/')
+    return '/'.join('{id}' if ID_SEGMENT_PATTERN.match(_segment) else _segment for _segment in path.split('/'))
+
+
+def _validate_event(_event):
+    """This function verifies that an event name is supported.
+
+    .. versionadded:: 2.1.0
+
+    :param _event: The name of the event
+    :type _event: str
+    :returns: None
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidHookEventError`
+    """
+    if _event not in HOOK_EVENTS:
+        raise errors.exceptions.InvalidHookEventError(value=_event)
+
+
+def _attach_callbacks(_adapter, _target, _events):
+    """This function registers the methods of an adapter that share their names with lifecycle events.
+
+    .. versionadded:: 2.1.0
+
+    :param _adapter: The adapter whose methods are registered
+    :param _target: The core object or the :py:class:`freshpy.utils.hooks.HookManager` object
+    :param _events: The names of the events to register
+    :type _events: tuple
+    :returns: None
+    """
+    _hook_manager = _target if isinstance(_target, HookManager) else _target.hooks
+    for _event in _events:
+        _hook_manager.register(_event, getattr(_adapter, _event))
+
+
+def _increment(_counter, _key, _amount=1):
+    """This function increments a labelled counter stored in a dictionary.
+
+    .. versionadded:: 2.1.0
+
+    :param _counter: The dictionary of counter values keyed by label values
+    :type _counter: dict
+    :param _key: The label values
+    :type _key: tuple
+    :param _amount: The amount to add
+    :type _amount: int, float
+    :returns: None
+    """
+    _counter[_key] = _counter.get(_key, 0) + _amount
+
+
+def _render_counter(_name, _help, _label_names, _counter):
+    """This function renders a labelled counter using the Prometheus text exposition format.
+
+    .. versionadded:: 2.1.0
+
+    :param _name: The name of the metric
+    :type _name: str
+    :param _help: The description of the metric
+    :type _help: str
+    :param _label_names: The names of the labels
+    :type _label_names: tuple
+    :param _counter: The dictionary of counter values keyed by label values
+    :type _counter: dict
+    :returns: A list of lines
+    """
+    _lines = [f'# HELP {_name} {_help}', f'# TYPE {_name} counter']
+    for _key, _value in sorted(_counter.items()):
+        _labels = ','.join(f'{_label}="{_label_value}"' for _label, _label_value in zip(_label_names, _key))
+        _lines.append(f'{_name}{{{_labels}}} {_value}')
+    return _lines
+
+
+def _format_ms(_seconds):
+    """This function formats a number of seconds as milliseconds for log messages.
+
+    .. versionadded:: 2.1.0
+
+    :param _seconds: The number of seconds
+    :type _seconds: float, None
+    :returns: The formatted value (e.g. ``12.3 ms``) or ``n/a`` when the value was not measured
+    """
+    return 'n/a' if _seconds is None else f'{_seconds * 1000:.1f} ms'
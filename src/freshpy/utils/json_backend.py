@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.json_backend
+:Synopsis:          Selection of the fastest available JSON decoder for API responses
+:Usage:             ``from freshpy.utils import json_backend``
+:Example:           ``decoder = json_backend.get_decoder('orjson')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import json
+
+from .. import errors
+
+# Import the optional JSON packages
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Define constants
+SUPPORTED_BACKENDS = ('orjson', 'ujson', 'json')
+BACKEND_MODULES = {
+    'orjson': orjson,
+    'ujson': ujson,
+    'json': json,
+}
+
+
+def get_available_backends():
+    """This function returns the names of the supported JSON backends that are installed in order of preference.
+
+    .. versionadded:: 2.1.0
+
+    :returns: A list of backend names (which always includes ``json``)
+    """
+    return [backend for backend in SUPPORTED_BACKENDS if BACKEND_MODULES[backend] is not None]
+
+
+def get_decoder(backend=None):
+    """This function returns the function used to decode JSON data for a given backend.
+
+    .. versionadded:: 2.1.0
+
+    :param backend: The name of the backend (``orjson``, ``ujson`` or ``json``), a custom function that accepts
+                    ``bytes`` or ``str`` data, or ``None`` to use the fastest backend that is installed
+    :type backend: str, function, None
+    :returns: The function that decodes JSON data
+    :raises: :py:exc:`freshpy.errors.exceptions.CurrentlyUnsupportedError`,
+             :py:exc:`freshpy.errors.exceptions.MissingDependencyError`
+    """
+    if callable(backend):
+        return backend
+    backend = get_available_backends()[0] if backend in (None, 'auto') else backend
+    if backend not in SUPPORTED_BACKENDS:
+        raise errors.exceptions.CurrentlyUnsupportedError(f'{backend} JSON backend')
+    if BACKEND_MODULES[backend] is None:
+        raise errors.exceptions.MissingDependencyError(package=backend)
+    return BACKEND_MODULES[backend].loads
+
+
+def get_backend_name(decoder):
+    """This function returns the name of the backend associated with a decoder function.
+
+    .. versionadded:: 2.1.0
+
+    :param decoder: The function that decodes JSON data
+    :type decoder: function
+    :returns: The name of the backend or ``custom`` if the function is not provided by a supported backend
+    """
+    for backend in get_available_backends():
+        if BACKEND_MODULES[backend].loads is decoder:
+            return backend
+    return 'custom'
+
+
+def decode_response(response, decoder=None):
+    """This function decodes the JSON body of a response using a given decoder function.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The raw bytes of the response body are decoded directly, which avoids the intermediate text conversion
+              performed by :py:meth:`requests.Response.json`.
+
+    :param response: The raw :py:mod:`requests` (or compatible) response
+    :param decoder: The function that decodes JSON data (the standard library is used when not defined)
+    :type decoder: function, None
+    :returns: The decoded JSON data
+    :raises: :py:exc:`ValueError`
+    """
+    decoder = json.loads if decoder is None else decoder
+    return decoder(response.content)
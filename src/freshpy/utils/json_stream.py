@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.json_stream
+:Synopsis:          Incremental decoding of the array of records in a JSON response body
+:Usage:             ``from freshpy.utils.json_stream import iter_array_items``
+:Example:           ``tickets = iter_array_items(response.iter_content(65536), 'tickets')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import re
+import json
+import codecs
+
+from . import json_backend
+
+# Define constants
+DEFAULT_CHUNK_SIZE = 65536
+WHITESPACE_CHARACTERS = ' \t\n\r'
+ELEMENT_TERMINATORS = WHITESPACE_CHARACTERS + ',]'
+STRING_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+BRACKET_PATTERN = re.compile(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}"])', re.DOTALL)
+SCALAR_PATTERN = re.compile(r'[^\s,\]}]*')
+
+# Define the standard library decoder used to decode elements in place
+_STDLIB_DECODER = json.JSONDecoder()
+
+
+def iter_array_items(chunks, key, decoder=None):
+    """This function yields each element of the array stored under a key in a JSON object as soon as it is decoded.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Only the current element (and at most one chunk beyond it) is held in memory, which keeps the peak
+              memory usage flat regardless of the size of the response body. An element is only yielded once the
+              character that follows it has been received so that numbers split across chunks are not truncated.
+              The standard library decodes each element in place when no decoder or the decoder of a supported
+              backend (``orjson``, ``ujson`` or ``json``) is supplied, as those backends return the same objects and
+              decoding in place avoids scanning each element twice. The text of each element is passed to any other
+              (custom) decoder function once its boundaries have been located.
+
+    :param chunks: An iterable of the raw response body in ``bytes`` or ``str`` chunks
+    :type chunks: generator, list, tuple
+    :param key: The key of the array in the JSON object (e.g. ``tickets``)
+    :type key: str
+    :param decoder: The custom function that decodes the text of each element (the standard library is used when not
+                    defined or when the function is provided by a supported backend)
+    :type decoder: function, None
+    :returns: A generator that yields each decoded element of the array
+    :raises: :py:exc:`ValueError`
+    """
+    if decoder is None or json_backend.get_backend_name(decoder) != 'custom':
+        decode_element = _decode_with_stdlib
+    else:
+        decode_element = _get_element_decoder(decoder)
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+    key_pattern = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+    chunks = iter(chunks)
+    buffer, position, exhausted, in_array = '', 0, False, False
+    while True:
+        if not in_array:
+            match = key_pattern.search(buffer)
+            if match:
+                buffer, position, in_array = buffer[match.end():], 0, True
+                continue
+        else:
+            position = _skip_separators(buffer, position)
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            if position < len(buffer):
+                element, end = decode_element(buffer, position)
+                if end is not None and (exhausted or (end < len(buffer) and buffer[end] in ELEMENT_TERMINATORS)):
+                    position = end
+                    yield element
+                    continue
+        if exhausted:
+            if in_array:
+                raise ValueError(f"The '{key}' array in the JSON data is incomplete")
+            return
+        buffer, position = buffer[position:], 0
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer += utf8_decoder.decode(b'', final=True)
+        else:
+            buffer += utf8_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+
+def _skip_separators(_buffer, _position):
+    """This function returns the position of the next character that is not whitespace or a comma.
+
+    .. versionadded:: 2.1.0
+
+    :param _buffer: The decoded text being parsed
+    :type _buffer: str
+    :param _position: The position from which to begin
+    :type _position: int
+    :returns: The position of the next significant character as an integer
+    """
+    while _position < len(_buffer) and (_buffer[_position] in WHITESPACE_CHARACTERS or _buffer[_position] == ','):
+        _position += 1
+    return _position
+
+
+def _decode_with_stdlib(_buffer, _position):
+    """This function decodes the element that begins at a position using the standard library.
+
+    .. versionadded:: 2.1.0
+
+    :param _buffer: The decoded text being parsed
+    :type _buffer: str
+    :param _position: The position at which the element begins
+    :type _position: int
+    :returns: A tuple with the decoded element and the position after it, or ``(None, None)`` if it is incomplete
+    """
+    try:
+        return _STDLIB_DECODER.raw_decode(_buffer, _position)
+    except json.JSONDecodeError:
+        return None, None
+
+
+def _get_element_decoder(_decoder):
+    """This function returns a function that decodes the element beginning at a position using a decoder function.
+
+    .. versionadded:: 2.1.0
+
+    :param _decoder: The function that decodes the text of an element
+    :type _decoder: function
+    :returns: A function that accepts the buffer and position and returns the same tuple as
+              :py:func:`freshpy.utils.json_stream._decode_with_stdlib`
+    """
+    def _decode_element(_buffer, _position):
+        _end = _find_element_end(_buffer, _position)
+        return (None, None) if _end is None else (_decoder(_buffer[_position:_end]), _end)
+    return _decode_element
+
+
+def _find_element_end(_buffer, _position):
+    """This function returns the position after the element that begins at a position without decoding it.
+
+    .. versionadded:: 2.1.0
+
+    :param _buffer: The decoded text being parsed
+    :type _buffer: str
+    :param _position: The position at which the element begins
+    :type _position: int
+    :returns: The position after the element as an integer or ``None`` if the element is incomplete
+    """
+    if _buffer[_position] == '"':
+        _match = STRING_PATTERN.match(_buffer, _position)
+        return _match.end() if _match else None
+    if _buffer[_position] not in '[{':
+        return SCALAR_PATTERN.match(_buffer, _position).end()
+    _depth = 0
+    while True:
+        _match = BRACKET_PATTERN.match(_buffer, _position)
+        if _match is None or _match.group(1) == '"':
+            return None
+        _position = _match.end()
+        _depth += 1 if _match.group(1) in '[{' else -1
+        if not _depth:
+            return _position
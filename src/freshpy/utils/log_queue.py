@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.log_queue
+:Synopsis:          Non-blocking logging where records are placed on a bounded queue and written by a background thread
+:Usage:             ``from freshpy.utils import log_queue``
+:Example:           ``queue_handler = log_queue.start_queue_handler([file_handler], max_size=10000)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+
+.. note:: This module is imported by the :py:func:`freshpy.utils.log_utils.initialize_logging` function when the
+          ``queue_output`` parameter is enabled, as the :py:mod:`logging.handlers` module is slow to import.
+"""
+
+import queue
+import atexit
+import threading
+import logging.handlers
+
+from .. import errors
+
+# Define constants
+DROP_NEW = 'drop_new'
+DROP_OLDEST = 'drop_oldest'
+BLOCK = 'block'
+DROP_POLICIES = (DROP_NEW, DROP_OLDEST, BLOCK)
+DEFAULT_MAX_SIZE = 10000
+DEFAULT_DROP_POLICY = DROP_NEW
+
+# Define the listeners that are stopped (after writing the queued records) when the interpreter exits
+_listeners = []
+_listeners_lock = threading.Lock()
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """This class is a :py:class:`logging.handlers.QueueHandler` that applies a drop policy when its queue is full.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The calling thread only formats the message and places the record on the queue, so it never waits for
+              file or syslog I/O unless the ``block`` drop policy is used.
+    """
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, drop_policy=DEFAULT_DROP_POLICY):
+        """This method instantiates the :py:class:`freshpy.utils.log_queue.BoundedQueueHandler` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param max_size: The maximum number of records waiting to be written (``0`` for an unbounded queue)
+        :type max_size: int
+        :param drop_policy: Determines what happens when the queue is full, where ``drop_new`` discards the new
+                            record, ``drop_oldest`` discards the oldest queued record and ``block`` waits for space
+        :type drop_policy: str
+        :raises: :py:exc:`freshpy.errors.exceptions.InvalidDropPolicyError`
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise errors.exceptions.InvalidDropPolicyError(value=drop_policy)
+        super().__init__(queue.Queue(max_size))
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record):
+        """This method places a record on the queue and applies the drop policy when the queue is full.
+
+        .. versionadded:: 2.1.0
+
+        :param record: The prepared log record
+        :type record: class[logging.LogRecord]
+        :returns: None
+        """
+        if self.drop_policy == BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.drop_policy == DROP_OLDEST:
+                self._replace_oldest(record)
+            else:
+                self._count_dropped()
+
+    def _replace_oldest(self, _record):
+        """This method discards the oldest queued record to make space for a new record.
+
+        .. versionadded:: 2.1.0
+
+        :param _record: The prepared log record
+        :type _record: class[logging.LogRecord]
+        :returns: None
+        """
+        try:
+            self.queue.get_nowait()
+            self.queue.task_done()
+        except queue.Empty:
+            pass
+        self._count_dropped()
+        try:
+            self.queue.put_nowait(_record)
+        except queue.Full:
+            # Another thread filled the space first, so the new record is discarded as well
+            self._count_dropped()
+
+    def _count_dropped(self):
+        """This method increments the number of records that have been discarded.
+
+        .. versionadded:: 2.1.0
+
+        :returns: None
+        """
+        with self._dropped_lock:
+            self.dropped += 1
+
+
+class _BoundedQueueListener(logging.handlers.QueueListener):
+    """This class is a :py:class:`logging.handlers.QueueListener` that can be stopped while its queue is full.
+
+    .. versionadded:: 2.1.0
+    """
+    def enqueue_sentinel(self):
+        """This method waits for space on the queue before adding the sentinel that stops the background thread.
+
+        .. versionadded:: 2.1.0
+        """
+        self.queue.put(self._sentinel)
+
+
+def start_queue_handler(handlers, max_size=None, drop_policy=None):
+    """This function starts a background thread that writes the records placed on a bounded queue to handlers.
+
+    .. versionadded:: 2.1.0
+
+    :param handlers: The handlers (e.g. :py:class:`logging.FileHandler`) that write the records
+    :type handlers: list, tuple
+    :param max_size: The maximum number of records waiting to be written (``10000`` by default)
+    :type max_size: int, None
+    :param drop_policy: Determines what happens when the queue is full (``drop_new`` by default)
+    :type drop_policy: str, None
+    :returns: The :py:class:`freshpy.utils.log_queue.BoundedQueueHandler` object to add to the logger
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidDropPolicyError`
+    """
+    max_size = DEFAULT_MAX_SIZE if max_size is None else max_size
+    handler = BoundedQueueHandler(max_size, drop_policy or DEFAULT_DROP_POLICY)
+    listener = _BoundedQueueListener(handler.queue, *handlers, respect_handler_level=True)
+    handler.listener = listener
+    with _listeners_lock:
+        _listeners.append(listener)
+    listener.start()
+    return handler
+
+
+def stop_queue_listeners():
+    """This function writes the records remaining on the queues and stops the background threads.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: This function is called automatically when the interpreter exits.
+
+    :returns: None
+    """
+    with _listeners_lock:
+        stopping = list(_listeners)
+        _listeners.clear()
+    for listener in stopping:
+        listener.stop()
+
+
+# Write the queued records before the handlers are closed by the logging module when the interpreter exits
+atexit.register(stop_queue_listeners)
@@ -6,15 +6,15 @@
 :Example:           ``logger = log_utils.initialize_logging(__name__)``
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     27 Dec 2021
+:Modified Date:     18 Oct 2026
 """
 
 import os
 import sys
 import logging
-import logging.handlers
-from pathlib import Path
+import itertools
 
+PACKAGE_LOGGER_NAME = 'freshpy'
 LOGGING_DEFAULTS = {
     'logger_name': __name__,
     'log_level': 'info',
@@ -29,25 +29,65 @@ HANDLER_DEFAULTS = {
     'syslog_port': 514,
 }
 
+# Define the flag indicating if the package logger has been configured
+_package_logger_configured = False
+
 
 def initialize_logging(logger_name=None, log_level=None, formatter=None, debug=None, no_output=None, file_output=None,
                        file_log_level=None, log_file=None, overwrite_log_files=None, console_output=None,
                        console_log_level=None, syslog_output=None, syslog_log_level=None, syslog_address=None,
-                       syslog_port=None):
+                       syslog_port=None, queue_output=None, queue_size=None, queue_drop_policy=None,
+                       debug_sample_rate=None):
     """This function initializes logging within a specific module.
 
+    .. versionchanged:: 2.1.0
+       Loggers within the package that use the default configuration now share a single handler on the package
+       logger that is only added once, which avoids repeating the configuration in every module at import time.
+       The ``queue_output``, ``queue_size``, ``queue_drop_policy`` and ``debug_sample_rate`` parameters were also
+       introduced so that the file, console and syslog handlers can write records from a background thread.
+
     .. versionadded:: 1.0.0
 
-    .. todo:: Add details about the parameters
+    .. todo:: Add details about the remaining parameters
+
+    :param queue_output: Determines if records should be placed on a bounded queue and written to the file, console
+                         and syslog handlers by a background thread rather than by the calling thread
+    :type queue_output: bool, None
+    :param queue_size: The maximum number of records waiting to be written when ``queue_output`` is enabled
+                       (``10000`` by default)
+    :type queue_size: int, None
+    :param queue_drop_policy: Determines what happens when the queue is full, where ``drop_new`` (default) discards
+                              the new record, ``drop_oldest`` discards the oldest queued record and ``block`` waits
+                              for space
+    :type queue_drop_policy: str, None
+    :param debug_sample_rate: The fraction of ``DEBUG`` records to keep (e.g. ``0.01``), which allows verbose logging
+                              to remain enabled for per-request messages (all records are kept when not defined)
+    :type debug_sample_rate: float, None
+    :returns: The :py:class:`logging.Logger` instance
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidDropPolicyError`
     """
+    if _is_package_logger(logger_name) and not any((log_level, formatter, debug, no_output, file_output,
+                                                    file_log_level, log_file, overwrite_log_files, console_output,
+                                                    console_log_level, syslog_output, syslog_log_level,
+                                                    syslog_address, syslog_port, queue_output,
+                                                    debug_sample_rate is not None)):
+        _configure_package_logger()
+        return logging.getLogger(logger_name)
     logger_name, log_levels, formatter = _apply_defaults(logger_name, formatter, debug, log_level, file_log_level,
                                                          console_log_level, syslog_log_level)
     log_level, file_log_level, console_log_level, syslog_log_level = _get_log_levels_from_dict(log_levels)
     logger = logging.getLogger(logger_name)
     logger = _set_logging_level(logger, log_level)
+    existing_handlers = list(logger.handlers)
     logger = _add_handlers(logger, formatter, no_output, file_output, file_log_level, log_file, overwrite_log_files,
                            console_output, console_log_level, syslog_output, syslog_log_level, syslog_address,
                            syslog_port)
+    added_handlers = [handler for handler in logger.handlers if handler not in existing_handlers]
+    if queue_output and not no_output and any((file_output, console_output, syslog_output)):
+        logger = _add_queue_handler(logger, added_handlers, queue_size, queue_drop_policy, debug_sample_rate)
+    elif debug_sample_rate is not None:
+        for handler in added_handlers:
+            handler.addFilter(SamplingFilter(debug_sample_rate))
     return logger
 
 
@@ -77,6 +117,74 @@ class LessThanFilter(logging.Filter):
         return 1 if record.levelno < self.max_level else 0
 
 
+class SamplingFilter(logging.Filter):
+    """This class keeps a fraction of the records at or below a specified level (e.g. per-request debug messages).
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Records are sampled deterministically (e.g. every tenth record for a rate of ``0.1``) so that the
+              decision only requires incrementing a counter, and records above the level are always kept.
+    """
+    def __init__(self, sample_rate, max_level=logging.DEBUG, name=""):
+        """This method instantiates the :py:class:`freshpy.utils.log_utils.SamplingFilter` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param sample_rate: The fraction of records to keep between ``0.0`` and ``1.0``
+        :type sample_rate: float
+        :param max_level: The highest level that is sampled (``logging.DEBUG`` by default)
+        :type max_level: int
+        :param name: The name of the logger whose records are filtered (all records when not defined)
+        :type name: str
+        """
+        super(SamplingFilter, self).__init__(name)
+        self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+        self.max_level = max_level
+        self._interval = round(1 / self.sample_rate) if self.sample_rate else 0
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        """This method returns a Boolean integer value indicating whether or not a message should be logged.
+
+        .. versionadded:: 2.1.0
+
+        .. note:: A non-zero return indicates that the message will be logged.
+        """
+        if record.levelno > self.max_level:
+            return 1
+        if not self._interval:
+            return 0
+        return 1 if next(self._counter) % self._interval == 0 else 0
+
+
+def _is_package_logger(_logger_name):
+    """This function determines if a logger name belongs to the freshpy package (e.g. ``freshpy.api``).
+
+    .. versionadded:: 2.1.0
+
+    :param _logger_name: The name of the logger instance
+    :type _logger_name: str, None
+    :returns: Boolean value indicating if the logger belongs to the package
+    """
+    return bool(_logger_name) and _logger_name.split('.', 1)[0] == PACKAGE_LOGGER_NAME
+
+
+def _configure_package_logger():
+    """This function adds the default handler to the package logger the first time a module initializes logging.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The loggers of the individual modules propagate their messages to the package logger, so the
+              handler only needs to be added once.
+
+    :returns: None
+    """
+    global _package_logger_configured
+    if not _package_logger_configured:
+        _package_logger_configured = True
+        logging.getLogger(PACKAGE_LOGGER_NAME).addHandler(logging.NullHandler())
+
+
 def _apply_defaults(_logger_name, _formatter, _debug, _log_level, _file_level, _console_level, _syslog_level):
     """This function applies default values to the configuration settings if not explicitly defined.
 
@@ -173,6 +281,37 @@ def _add_handlers(_logger, _formatter, _no_output, _file_output, _file_log_level
     return _logger
 
 
+def _add_queue_handler(_logger, _handlers, _queue_size, _drop_policy, _sample_rate):
+    """This function moves handlers behind a bounded queue that is written by a background thread.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The sampling filter is added to the queue handler so that discarded records are never queued.
+
+    :param _logger: The :py:class:`logging.Logger` instance
+    :param _handlers: The handlers that were added to the logger and will be written by the background thread
+    :type _handlers: list
+    :param _queue_size: The maximum number of records waiting to be written (``10000`` by default)
+    :type _queue_size: int, None
+    :param _drop_policy: Determines what happens when the queue is full (``drop_new`` by default)
+    :type _drop_policy: str, None
+    :param _sample_rate: The fraction of ``DEBUG`` records to keep (all records are kept when not defined)
+    :type _sample_rate: float, None
+    :returns: The :py:class:`logging.Logger` instance with the added
+              :py:class:`freshpy.utils.log_queue.BoundedQueueHandler`
+    :raises: :py:exc:`freshpy.errors.exceptions.InvalidDropPolicyError`
+    """
+    # Import the queue module when it is needed as it depends on the handlers module which is slow to import
+    from . import log_queue
+    _queue_handler = log_queue.start_queue_handler(_handlers, _queue_size, _drop_policy)
+    if _sample_rate is not None:
+        _queue_handler.addFilter(SamplingFilter(_sample_rate))
+    for _handler in _handlers:
+        _logger.removeHandler(_handler)
+    _logger.addHandler(_queue_handler)
+    return _logger
+
+
 def _add_file_handler(_logger, _log_level, _log_file, _overwrite, _formatter):
     """This function adds a :py:class:`logging.FileHandler` to the :py:class:`logging.Logger` instance.
 
@@ -194,7 +333,7 @@ def _add_file_handler(_logger, _log_level, _log_file, _overwrite, _formatter):
     :returns: The :py:class:`logging.Logger` instance with the added :py:class:`logging.FileHandler`
     """
     # Define the log file to use
-    _home_dir = str(Path.home())
+    _home_dir = os.path.expanduser('~')
     if _log_file:
         if not any((('/' in _log_file), ('\\' in _log_file))):
             _log_file = os.path.join(_home_dir, _log_file)
@@ -276,6 +415,8 @@ def _add_syslog_handler(_logger, _log_level, _formatter, _address, _port):
     _log_level = HANDLER_DEFAULTS.get('syslog_log_level') if not _log_level else _log_level
     _address = HANDLER_DEFAULTS.get('syslog_address') if not _address else _address
     _port = HANDLER_DEFAULTS.get('syslog_port') if not _port else _port
+    # Import the handlers module when it is needed as it is slow to import (e.g. the socket and pickle modules)
+    import logging.handlers
     _handler = logging.handlers.SysLogHandler(address=(_address, _port))
     _handler = _set_logging_level(_handler, _log_level)
     _handler.setFormatter(_formatter)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.metrics
+:Synopsis:          Counters that measure the bytes transferred over the wire and the bytes decoded from API responses
+:Usage:             ``from freshpy.utils.metrics import TransferStats``
+:Example:           ``stats = freshpy_object.transfer_stats.get_stats()``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import threading
+
+# Define constants
+IDENTITY_ENCODING = 'identity'
+
+
+class TransferStats(object):
+    """This class records the number of bytes received over the wire and after decompression for API responses.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The counters are shared by the threads that perform API calls for a core object, so they are updated
+              while holding a lock.
+    """
+    def __init__(self):
+        """This method instantiates the :py:class:`freshpy.utils.metrics.TransferStats` class object.
+
+        .. versionadded:: 2.1.0
+        """
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.encodings = {}
+
+    def record(self, wire_bytes, decoded_bytes, encoding=None):
+        """This method records the number of bytes transferred for a single response.
+
+        .. versionadded:: 2.1.0
+
+        :param wire_bytes: The number of bytes received over the wire (i.e. before decompression)
+        :type wire_bytes: int
+        :param decoded_bytes: The number of bytes in the decompressed body
+        :type decoded_bytes: int
+        :param encoding: The value of the ``Content-Encoding`` header (``identity`` is used when not defined)
+        :type encoding: str, None
+        :returns: None
+        """
+        encoding = (encoding or IDENTITY_ENCODING).lower()
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+    def record_response(self, response, decoded_bytes=None):
+        """This method records the number of bytes transferred for a response whose body has been consumed.
+
+        .. versionadded:: 2.1.0
+
+        :param response: The :py:mod:`requests` or :py:mod:`httpx` response
+        :param decoded_bytes: The number of decompressed bytes consumed from the body (the length of the
+                              ``content`` attribute is used when not defined)
+        :type decoded_bytes: int, None
+        :returns: None
+        """
+        decoded_bytes = len(response.content) if decoded_bytes is None else decoded_bytes
+        self.record(get_wire_bytes(response, decoded_bytes), decoded_bytes, response.headers.get('Content-Encoding'))
+
+    def reset(self):
+        """This method resets all of the counters.
+
+        .. versionadded:: 2.1.0
+
+        :returns: None
+        """
+        with self._lock:
+            self.responses = 0
+            self.wire_bytes = 0
+            self.decoded_bytes = 0
+            self.encodings = {}
+
+    def get_stats(self):
+        """This method returns the transfer counters along with the compression ratio and the bytes saved.
+
+        .. versionadded:: 2.1.0
+
+        :returns: A dictionary with the transfer statistics
+        """
+        with self._lock:
+            return {
+                'responses': self.responses,
+                'wire_bytes': self.wire_bytes,
+                'decoded_bytes': self.decoded_bytes,
+                'bytes_saved': self.decoded_bytes - self.wire_bytes,
+                'compression_ratio': self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0,
+                'encodings': dict(self.encodings),
+            }
+
+
+def get_wire_bytes(response, default=0):
+    """This function returns the number of bytes of a response body that were received over the wire.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The count is taken from the ``num_bytes_downloaded`` attribute of :py:mod:`httpx` responses and from
+              the position of the underlying :py:mod:`urllib3` stream for :py:mod:`requests` responses, both of which
+              count the bytes before they are decompressed.
+
+    :param response: The :py:mod:`requests` or :py:mod:`httpx` response
+    :param default: The value returned when the count is not available (e.g. for mocked responses)
+    :type default: int
+    :returns: The number of bytes as an integer
+    """
+    wire_bytes = getattr(response, 'num_bytes_downloaded', None)
+    if isinstance(wire_bytes, int):
+        return wire_bytes
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return default
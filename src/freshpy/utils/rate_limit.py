@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.rate_limit
+:Synopsis:          Token bucket scheduler that paces API calls according to the Freshservice rate limits
+:Usage:             ``from freshpy.utils.rate_limit import RateLimiter``
+:Example:           ``limiter = RateLimiter(requests_per_minute=500)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import threading
+from email.utils import parsedate_to_datetime
+
+from . import log_utils
+
+# Initialize logging
+logger = log_utils.initialize_logging(__name__)
+
+# Define constants
+RATE_LIMIT_TOTAL_HEADER = 'X-RateLimit-Total'
+RATE_LIMIT_REMAINING_HEADER = 'X-RateLimit-Remaining'
+RETRY_AFTER_HEADER = 'Retry-After'
+DEFAULT_RETRY_AFTER = 60
+
+
+class RateLimiter(object):
+    """This class paces API calls using a token bucket that learns its budget from the rate limit response headers.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: Until a budget is supplied or learned from the ``X-RateLimit-Total`` header, requests are not paced.
+              The ``Retry-After`` value from a ``429`` response is always honored by every thread sharing the
+              instance.
+    """
+    def __init__(self, requests_per_minute=None):
+        """This method instantiates the :py:class:`freshpy.utils.rate_limit.RateLimiter` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param requests_per_minute: The number of requests permitted per minute or ``None`` to learn the value
+                                    from the response headers
+        :type requests_per_minute: int, None
+        """
+        self._lock = threading.Lock()
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self.capacity = None
+        self.tokens = None
+        self.throttled_count = 0
+        if requests_per_minute:
+            self._set_capacity(requests_per_minute)
+
+    def _set_capacity(self, _requests_per_minute):
+        """This method defines the size of the bucket and the rate at which it is refilled.
+
+        .. versionadded:: 2.1.0
+
+        :param _requests_per_minute: The number of requests permitted per minute
+        :type _requests_per_minute: int
+        :returns: None
+        """
+        self.capacity = float(_requests_per_minute)
+        self.tokens = self.capacity if self.tokens is None else min(self.tokens, self.capacity)
+
+    @property
+    def refill_rate(self):
+        """This property returns the number of tokens added to the bucket each second.
+
+        .. versionadded:: 2.1.0
+        """
+        return self.capacity / 60.0 if self.capacity else None
+
+    def _refill(self, _now):
+        """This method adds the tokens that have accrued since the last refill.
+
+        .. versionadded:: 2.1.0
+
+        :param _now: The current value of :py:func:`time.monotonic`
+        :type _now: float
+        :returns: None
+        """
+        if self.capacity:
+            self.tokens = min(self.capacity, self.tokens + (_now - self._last_refill) * self.refill_rate)
+        self._last_refill = _now
+
+    def reserve(self):
+        """This method reserves a token for a request and returns how long the caller must wait before sending it.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The number of seconds to wait as a float
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if not self.capacity:
+                return wait
+            self._refill(now)
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.refill_rate)
+            return wait
+
+    def acquire(self):
+        """This method blocks the calling thread until a request may be sent.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The number of seconds that were spent waiting as a float
+        """
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f'Pacing the API request for {wait:.3f} seconds to remain within the rate limit')
+            time.sleep(wait)
+        return wait
+
+    def update_from_headers(self, headers):
+        """This method updates the budget using the rate limit headers from an API response.
+
+        .. versionadded:: 2.1.0
+
+        :param headers: The response headers
+        :type headers: dict, requests.structures.CaseInsensitiveDict
+        :returns: None
+        """
+        total = _parse_int(headers.get(RATE_LIMIT_TOTAL_HEADER))
+        remaining = _parse_int(headers.get(RATE_LIMIT_REMAINING_HEADER))
+        with self._lock:
+            if total and total != self.capacity:
+                self._refill(time.monotonic())
+                self._set_capacity(total)
+            if remaining is not None and self.capacity:
+                self.tokens = min(self.tokens, float(remaining))
+
+    def throttle(self, retry_after=None):
+        """This method pauses all requests sharing the instance after a ``429`` response was received.
+
+        .. versionadded:: 2.1.0
+
+        :param retry_after: The value of the ``Retry-After`` header (in seconds or as an HTTP date)
+        :type retry_after: str, int, None
+        :returns: The number of seconds for which requests will be paused as a float
+        """
+        delay = parse_retry_after(retry_after)
+        delay = DEFAULT_RETRY_AFTER if delay is None else delay
+        with self._lock:
+            self.throttled_count += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        logger.warning(f'The API rate limit was exceeded and requests will be paused for {delay} seconds')
+        return delay
+
+
+def parse_retry_after(value):
+    """This function converts the value of a ``Retry-After`` header into a number of seconds.
+
+    .. versionadded:: 2.1.0
+
+    :param value: The header value as a number of seconds or an HTTP date
+    :type value: str, int, float, None
+    :returns: The number of seconds as a float or ``None`` if the value could not be parsed
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_date.timestamp() - time.time())
+
+
+def _parse_int(_value):
+    """This function converts a header value to an integer.
+
+    .. versionadded:: 2.1.0
+
+    :param _value: The header value
+    :type _value: str, int, None
+    :returns: The integer value or ``None`` if the value could not be converted
+    """
+    try:
+        return int(_value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.retry
+:Synopsis:          Retry policy that defines which failed API calls are retried and how long to wait between attempts
+:Usage:             ``from freshpy.utils.retry import RetryPolicy``
+:Example:           ``policy = RetryPolicy(max_attempts=4, backoff_base=1.0)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import random
+
+from . import rate_limit
+
+# Define constants
+DEFAULT_MAX_ATTEMPTS = 6
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+CONNECTION_EXCEPTION_KEYWORDS = ('connect', 'timeout')
+
+
+class RetryPolicy(object):
+    """This class defines the retry behavior for failed API calls using exponential backoff with full jitter.
+
+    .. versionadded:: 2.1.0
+    """
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, backoff_base=DEFAULT_BACKOFF_BASE,
+                 backoff_max=DEFAULT_BACKOFF_MAX, retry_statuses=DEFAULT_RETRY_STATUSES, retry_exceptions=None,
+                 honor_retry_after=True):
+        """This method instantiates the :py:class:`freshpy.utils.retry.RetryPolicy` class object.
+
+        .. versionadded:: 2.1.0
+
+        :param max_attempts: The maximum number of attempts (including the initial attempt) for an API call
+        :type max_attempts: int
+        :param backoff_base: The base number of seconds used to calculate the exponential backoff
+        :type backoff_base: int, float
+        :param backoff_max: The maximum number of seconds to wait between attempts
+        :type backoff_max: int, float
+        :param retry_statuses: The HTTP status codes that should be retried
+        :type retry_statuses: tuple, list, set
+        :param retry_exceptions: The exception classes that should be retried (connection and timeout errors are
+                                 retried by default)
+        :type retry_exceptions: tuple, None
+        :param honor_retry_after: Determines if the ``Retry-After`` header should define the wait when present
+        :type honor_retry_after: bool
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses or ())
+        self.retry_exceptions = tuple(retry_exceptions) if retry_exceptions else None
+        self.honor_retry_after = honor_retry_after
+
+    def is_retryable_status(self, status_code):
+        """This method determines if a response with a given status code should be retried.
+
+        .. versionadded:: 2.1.0
+
+        :param status_code: The HTTP status code of the response
+        :type status_code: int
+        :returns: Boolean value indicating if the response should be retried
+        """
+        return status_code in self.retry_statuses
+
+    def is_retryable_exception(self, exc):
+        """This method determines if an API call that raised a given exception should be retried.
+
+        .. versionadded:: 2.1.0
+
+        :param exc: The exception that was raised
+        :type exc: Exception
+        :returns: Boolean value indicating if the API call should be retried
+        """
+        if self.retry_exceptions:
+            return isinstance(exc, self.retry_exceptions)
+        exc_name = type(exc).__name__.lower()
+        return any(keyword in exc_name for keyword in CONNECTION_EXCEPTION_KEYWORDS)
+
+    def get_backoff(self, attempt):
+        """This method calculates the exponential backoff with full jitter for a given attempt.
+
+        .. versionadded:: 2.1.0
+
+        :param attempt: The number of attempts that have failed so far
+        :type attempt: int
+        :returns: The number of seconds to wait as a float
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** max(0, attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def get_delay(self, attempt, response=None):
+        """This method returns the number of seconds to wait before the next attempt.
+
+        .. versionadded:: 2.1.0
+
+        :param attempt: The number of attempts that have failed so far
+        :type attempt: int
+        :param response: The response that triggered the retry (if any)
+        :returns: The number of seconds to wait as a float
+        """
+        if self.honor_retry_after and response is not None:
+            retry_after = rate_limit.parse_retry_after(response.headers.get(rate_limit.RETRY_AFTER_HEADER))
+            if retry_after is not None:
+                return retry_after
+        return self.get_backoff(attempt)
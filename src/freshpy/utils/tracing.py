@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.tracing
+:Synopsis:          Optional OpenTelemetry spans around API calls, retry attempts, pagination and bulk retrievals
+:Usage:             ``from freshpy.utils import tracing``
+:Example:           ``with tracing.start_span('freshpy.request', {'freshpy.endpoint': 'tickets/{id}'}) as span:``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import functools
+import contextvars
+from contextlib import nullcontext
+
+from . import metrics, rate_limit, version
+
+# Define constants
+TRACER_NAME = 'freshpy'
+REQUEST_SPAN = 'freshpy.request'
+ATTEMPT_SPAN = 'freshpy.request.attempt'
+PAGINATION_SPAN = 'freshpy.paginate'
+PAGE_SPAN = 'freshpy.page'
+BULK_SPAN = 'freshpy.bulk'
+_NO_SPAN = nullcontext()
+
+# Define the optional OpenTelemetry API package and tracer, which are imported when the first span is started
+otel_trace = None
+_tracer = None
+_tracer_loaded = False
+
+
+def is_enabled():
+    """This function determines if spans are emitted, which requires the ``opentelemetry-api`` package.
+
+    .. versionadded:: 2.1.0
+
+    :returns: Boolean value indicating if tracing is available
+    """
+    return _get_tracer() is not None
+
+
+def _get_tracer():
+    """This function returns the tracer used for the spans, which is created the first time it is needed.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The tracer is obtained from the global tracer provider, so spans are only recorded once the
+              application has configured the OpenTelemetry SDK. The ``opentelemetry-api`` package is also imported
+              at this point rather than when the module is imported, which keeps ``import freshpy`` fast.
+
+    :returns: The OpenTelemetry tracer or ``None`` if the ``opentelemetry-api`` package is not installed
+    """
+    global otel_trace, _tracer, _tracer_loaded
+    if not _tracer_loaded:
+        try:
+            from opentelemetry import trace as _otel_trace
+        except ImportError:
+            _otel_trace = None
+        if _otel_trace is not None:
+            otel_trace = _otel_trace
+            _tracer = otel_trace.get_tracer(TRACER_NAME, version.get_full_version())
+        _tracer_loaded = True
+    return _tracer
+
+
+def start_span(name, attributes=None, parent=None):
+    """This function returns a context manager that starts a span and makes it the current span.
+
+    .. versionadded:: 2.1.0
+
+    :param name: The name of the span (e.g. ``freshpy.request``)
+    :type name: str
+    :param attributes: The attributes of the span (where ``None`` values are omitted)
+    :type attributes: dict, None
+    :param parent: The span to use as the parent rather than the current span (e.g. from another thread)
+    :returns: A context manager that yields the span, or ``None`` when tracing is not available
+    """
+    _tracer_object = _get_tracer()
+    if _tracer_object is None:
+        return _NO_SPAN
+    _context = otel_trace.set_span_in_context(parent) if parent is not None else None
+    return _tracer_object.start_as_current_span(name, context=_context, attributes=_clean(attributes),
+                                                record_exception=True, set_status_on_exception=True)
+
+
+def open_span(name, attributes=None, parent=None):
+    """This function starts a span without making it the current span, which is required within generators.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The span must be ended using the :py:func:`freshpy.utils.tracing.end_span` function, and child spans
+              are associated with it by supplying it as the ``parent`` of the
+              :py:func:`freshpy.utils.tracing.start_span` function or by activating it with the
+              :py:func:`freshpy.utils.tracing.activate` function around code that does not yield.
+
+    :param name: The name of the span (e.g. ``freshpy.paginate``)
+    :type name: str
+    :param attributes: The attributes of the span (where ``None`` values are omitted)
+    :type attributes: dict, None
+    :param parent: The span to use as the parent rather than the current span
+    :returns: The span or ``None`` when tracing is not available
+    """
+    _tracer_object = _get_tracer()
+    if _tracer_object is None:
+        return None
+    _context = otel_trace.set_span_in_context(parent) if parent is not None else None
+    return _tracer_object.start_span(name, context=_context, attributes=_clean(attributes))
+
+
+def activate(span):
+    """This function returns a context manager that makes a span the current span without ending it on exit.
+
+    .. versionadded:: 2.1.0
+
+    :param span: The span (or ``None`` when tracing is not available)
+    :returns: The context manager
+    """
+    if span is None:
+        return _NO_SPAN
+    return otel_trace.use_span(span, end_on_exit=False)
+
+
+def end_span(span, attributes=None):
+    """This function adds any final attributes to a span that was started by the ``open_span`` function and ends it.
+
+    .. versionadded:: 2.1.0
+
+    :param span: The span (or ``None`` when tracing is not available)
+    :param attributes: The attributes to add before the span ends
+    :type attributes: dict, None
+    :returns: None
+    """
+    if span is not None:
+        set_attributes(span, attributes)
+        span.end()
+
+
+def set_attributes(span, attributes):
+    """This function adds attributes to a span, omitting any ``None`` values.
+
+    .. versionadded:: 2.1.0
+
+    :param span: The span (or ``None`` when tracing is not available)
+    :param attributes: The attributes to add
+    :type attributes: dict, None
+    :returns: None
+    """
+    if attributes and _is_recording(span):
+        span.set_attributes(_clean(attributes))
+
+
+def set_response_attributes(span, response, stream=False):
+    """This function adds the status code, rate limit and size attributes of a response to a span.
+
+    .. versionadded:: 2.1.0
+
+    :param span: The span (or ``None`` when tracing is not available)
+    :param response: The :py:mod:`requests` or :py:mod:`httpx` response
+    :param stream: Determines if the response body is being streamed and has not been downloaded yet
+    :type stream: bool
+    :returns: None
+    """
+    if not _is_recording(span):
+        return
+    _remaining = response.headers.get(rate_limit.RATE_LIMIT_REMAINING_HEADER)
+    _attributes = {
+        'http.response.status_code': response.status_code,
+        'freshpy.rate_limit.remaining': int(_remaining) if _remaining and _remaining.isdigit() else None,
+    }
+    if stream:
+        _content_length = response.headers.get('Content-Length')
+        _attributes['http.response.body.size'] = int(_content_length) if _content_length else None
+    else:
+        _attributes['freshpy.response.decoded_size'] = len(response.content)
+        _attributes['http.response.body.size'] = metrics.get_wire_bytes(response, len(response.content))
+    if response.status_code >= 400:
+        _attributes['error.type'] = str(response.status_code)
+    span.set_attributes(_clean(_attributes))
+
+
+def record_exception(span, exc):
+    """This function records an exception that was handled (e.g. before a retry) on a span.
+
+    .. versionadded:: 2.1.0
+
+    :param span: The span (or ``None`` when tracing is not available)
+    :param exc: The exception that was raised
+    :type exc: Exception
+    :returns: None
+    """
+    if span is not None:
+        span.record_exception(exc)
+        span.set_attribute('error.type', type(exc).__name__)
+
+
+def bind_context(function):
+    """This function binds a function to the current context so that its spans in a worker thread are nested.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: A separate copy of the context is required for each submitted call because a context cannot be
+              entered by multiple threads at once, so this function should be called once per submission.
+
+    :param function: The function that will be called in another thread
+    :type function: function
+    :returns: The bound function (or the original function when tracing is not available)
+    """
+    if _get_tracer() is None:
+        return function
+    return functools.partial(contextvars.copy_context().run, function)
+
+
+def _is_recording(_span):
+    """This function determines if a span records attributes, which is not the case until the SDK is configured.
+
+    .. versionadded:: 2.1.0
+
+    :param _span: The span (or ``None`` when tracing is not available)
+    :returns: Boolean value indicating if attributes should be computed for the span
+    """
+    return _span is not None and _span.is_recording()
+
+
+def _clean(_attributes):
+    """This function removes the attributes whose values are ``None``, which OpenTelemetry does not permit.
+
+    .. versionadded:: 2.1.0
+
+    :param _attributes: The attributes
+    :type _attributes: dict, None
+    :returns: The attributes without ``None`` values (or ``None`` when there are no attributes)
+    """
+    if not _attributes:
+        return None
+    return {_key: _value for _key, _value in _attributes.items() if _value is not None}
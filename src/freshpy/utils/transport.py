@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            freshpy.utils.transport
+:Synopsis:          The :py:mod:`requests` adapter and :py:mod:`urllib3` connections that time connection setup
+:Usage:             ``from freshpy.utils import transport``
+:Example:           ``session.mount('https://', transport.TimedHTTPAdapter(pool_maxsize=10))``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+
+.. note:: This module imports :py:mod:`requests` and is therefore only imported by the
+          :py:mod:`freshpy.api` module when the first session is created, which keeps ``import freshpy`` fast.
+"""
+
+import time
+import threading
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Define the thread-local storage that measures the time spent opening connections for the current request
+connection_timer = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """This class is a :py:mod:`urllib3` connection that records the time spent opening the connection.
+
+    .. versionadded:: 2.1.0
+    """
+    def connect(self):
+        """This method opens the connection and adds the elapsed time to the timer for the current thread.
+
+        .. versionadded:: 2.1.0
+        """
+        _started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connection_timer.elapsed = getattr(connection_timer, 'elapsed', 0.0) + time.perf_counter() - _started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """This class is a :py:mod:`urllib3` HTTPS connection that records the time spent connecting and negotiating TLS.
+
+    .. versionadded:: 2.1.0
+    """
+    def connect(self):
+        """This method opens the connection and adds the elapsed time to the timer for the current thread.
+
+        .. versionadded:: 2.1.0
+        """
+        _started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connection_timer.elapsed = getattr(connection_timer, 'elapsed', 0.0) + time.perf_counter() - _started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    """This class is a :py:mod:`urllib3` connection pool that opens timed connections.
+
+    .. versionadded:: 2.1.0
+    """
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """This class is a :py:mod:`urllib3` HTTPS connection pool that opens timed connections.
+
+    .. versionadded:: 2.1.0
+    """
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """This class is a :py:class:`requests.adapters.HTTPAdapter` that measures the time spent opening connections.
+
+    .. versionadded:: 2.1.0
+
+    .. note:: The measurement is reported as the ``connect`` phase of the request hooks and is ``0.0`` when a pooled
+              connection is reused.
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        """This method initializes the pool manager so that it creates connection pools with timed connections.
+
+        .. versionadded:: 2.1.0
+        """
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedHTTPConnectionPool,
+                                                   'https': _TimedHTTPSConnectionPool}
+
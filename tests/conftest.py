@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.conftest
+:Synopsis:          Shared fixtures that serve canned Freshservice responses through a mocked session
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import io
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from freshpy import FreshPy
+from freshpy.utils import retry
+
+# Define constants
+TEST_DOMAIN = 'example.freshservice.com'
+TEST_API_KEY = 'test-api-key'
+
+
+class FakeAdapter(BaseAdapter):
+    """This class is a :py:mod:`requests` transport adapter that returns responses from a handler function."""
+    def __init__(self, handler):
+        """This method instantiates the adapter.
+
+        :param handler: A function that accepts the path, the query parameters and the request headers and returns a
+                        tuple with the status code, the response headers and the body (``bytes`` or JSON data)
+        :type handler: function
+        """
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        """This method builds the response for a prepared request without opening a connection."""
+        self.requests.append(request)
+        url = urlsplit(request.url)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        status_code, headers, body = self.handler(url.path, query, request.headers)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers or {})
+        response.raw = io.BytesIO(body if isinstance(body, bytes) else json.dumps(body).encode('utf-8'))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        """This method satisfies the adapter interface."""
+
+
+def create_session(handler):
+    """This function creates a :py:class:`requests.Session` that is served by a :py:class:`FakeAdapter`.
+
+    :param handler: The function that returns the responses (see :py:class:`FakeAdapter`)
+    :type handler: function
+    :returns: The session with the adapter mounted for every URL
+    """
+    session = requests.Session()
+    session.mount('https://', FakeAdapter(handler))
+    return session
+
+
+@pytest.fixture
+def make_client():
+    """This fixture returns a function that creates a core object whose session is served by a handler function."""
+    clients = []
+
+    def _make_client(_handler, **_options):
+        _options.setdefault('retry_policy', retry.RetryPolicy(backoff_base=0.001, backoff_max=0.002))
+        _options.setdefault('pace_requests', False)
+        _client = FreshPy(TEST_DOMAIN, TEST_API_KEY, **_options)
+        _client.session = create_session(_handler)
+        clients.append(_client)
+        return _client
+
+    yield _make_client
+    for client in clients:
+        client.close()
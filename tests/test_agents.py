@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_agents
+:Synopsis:          Tests for the agent directory used to resolve agent lookups without API calls
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import threading
+
+# Define constants
+AGENTS = [
+    {'id': 1, 'email': 'Jane.Doe@example.com', 'member_of': [10]},
+    {'id': 2, 'email': 'john.roe@example.com', 'member_of': [10, 20]},
+]
+NEW_AGENT = {'id': 3, 'email': 'new.hire@example.com', 'member_of': []}
+
+
+class AgentHandler(object):
+    """This class emulates the agent endpoints and records the requests that are made."""
+    def __init__(self, list_delay=0.0, during_list=None):
+        """This method instantiates the handler.
+
+        :param list_delay: The number of seconds to wait before returning the first page of the agent list
+        :type list_delay: float
+        :param during_list: A function that is called while the first page of the agent list is being served
+        :type during_list: function, None
+        """
+        self.list_delay = list_delay
+        self.during_list = during_list
+        self.paths = []
+        self.list_count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, path, query, headers):
+        """This method returns the response for a request."""
+        with self._lock:
+            self.paths.append(path)
+        if path.endswith('/agents/3'):
+            return 200, {}, {'agent': NEW_AGENT}
+        if path.endswith('/agents') and 'email' not in query:
+            if query.get('page', '1') != '1':
+                return 200, {}, {'agents': []}
+            with self._lock:
+                self.list_count += 1
+            if self.during_list:
+                self.during_list()
+            time.sleep(self.list_delay)
+            return 200, {}, {'agents': AGENTS}
+        return 404, {}, {}
+
+
+def test_hit_makes_no_requests(make_client):
+    """This function verifies that an agent in the directory is returned without calling the API."""
+    handler = AgentHandler()
+    client = make_client(handler)
+    client.agents.build_directory()
+    request_count = len(handler.paths)
+    assert client.agents.get_user_info(2) == AGENTS[1]
+    assert client.agents.get_user_info('1') == AGENTS[0]
+    assert len(handler.paths) == request_count
+
+
+def test_email_lookup_ignores_case(make_client):
+    """This function verifies that email addresses are matched regardless of case."""
+    client = make_client(AgentHandler())
+    directory = client.agents.build_directory()
+    assert directory.lookup('jane.doe@EXAMPLE.com') == AGENTS[0]
+    assert 'JOHN.ROE@example.com' in directory
+
+
+def test_miss_adds_agent(make_client):
+    """This function verifies that an agent missing from the directory is retrieved once and then indexed."""
+    handler = AgentHandler()
+    client = make_client(handler)
+    directory = client.agents.build_directory()
+    assert client.agents.get_user_info(3) == NEW_AGENT
+    request_count = len(handler.paths)
+    assert client.agents.get_user_info('new.hire@example.com') == NEW_AGENT
+    assert len(handler.paths) == request_count
+    assert len(directory) == 3
+
+
+def test_group_members(make_client):
+    """This function verifies that the agents are indexed by group."""
+    directory = make_client(AgentHandler()).agents.build_directory()
+    assert directory.get_group_members(10) == AGENTS
+    assert directory.get_group_members('20') == [AGENTS[1]]
+
+
+def test_stale_refresh_runs_once(make_client):
+    """This function verifies that concurrent lookups on a stale directory only trigger a single refresh."""
+    handler = AgentHandler()
+    client = make_client(handler)
+    directory = client.agents.build_directory(refresh_interval=60)
+    handler.list_delay = 0.2
+    directory.last_refresh -= 120
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(directory.lookup(1))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert handler.list_count == 2
+    assert results == [AGENTS[0]] * 8
+    assert not directory.is_stale()
+
+
+def test_agent_added_during_refresh_is_kept(make_client):
+    """This function verifies that an agent added while the directory is refreshed is retained."""
+    handler = AgentHandler()
+    client = make_client(handler)
+    directory = client.agents.build_directory()
+    handler.during_list = lambda: directory.add(NEW_AGENT)
+    directory.refresh()
+    assert directory.lookup(3) == NEW_AGENT
+    assert directory.lookup('new.hire@example.com') == NEW_AGENT
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_analytics
+:Synopsis:          Tests for the vectorized SLA breach rates and duration percentiles
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import pytest
+
+from freshpy import analytics, errors, records
+
+numpy = pytest.importorskip('numpy')
+
+# Define constants
+NOW = '2026-01-10T00:00:00Z'
+TICKETS = [
+    {
+        # Responded and resolved within both due dates
+        'id': 1, 'status': 5, 'priority': 2, 'group_id': 10, 'responder_id': 100,
+        'created_at': '2026-01-01T00:00:00Z', 'fr_due_by': '2026-01-01T04:00:00Z', 'due_by': '2026-01-02T00:00:00Z',
+        'stats': {'first_responded_at': '2026-01-01T02:00:00Z', 'resolved_at': '2026-01-01T12:00:00Z'},
+    },
+    {
+        # Responded late and closed late without a resolved timestamp
+        'id': 2, 'status': 5, 'priority': 3, 'group_id': 10, 'responder_id': 100,
+        'created_at': '2026-01-01T00:00:00Z', 'fr_due_by': '2026-01-01T04:00:00Z', 'due_by': '2026-01-02T00:00:00Z',
+        'stats': {'first_responded_at': '2026-01-01T06:00:00Z', 'closed_at': '2026-01-03T00:00:00Z'},
+    },
+    {
+        # Unresolved and unassigned past its due date without a first response due date
+        'id': 3, 'status': 2, 'priority': 1, 'group_id': 20, 'responder_id': None,
+        'created_at': '2026-01-05T00:00:00Z', 'fr_due_by': None, 'due_by': '2026-01-06T00:00:00Z',
+        'stats': {'first_responded_at': None, 'resolved_at': None},
+    },
+    {
+        # Unresolved and not yet due
+        'id': 4, 'status': 2, 'priority': 1, 'group_id': 20, 'responder_id': 200,
+        'created_at': '2026-01-09T00:00:00Z', 'due_by': '2026-01-12T00:00:00Z',
+        'stats': {},
+    },
+]
+
+
+def test_missing_first_response_due_date():
+    """This function verifies that a ticket without a first response due date is never in breach of it."""
+    metrics = analytics.compute_sla_metrics(TICKETS, now=NOW)
+    assert metrics['has_first_response_sla'].tolist() == [True, True, False, False]
+    assert metrics['first_response_breached'].tolist() == [False, True, False, False]
+    rates = analytics.get_breach_rates(TICKETS[2:], now=NOW)
+    assert rates['first_response_breach_rate'] is None
+    assert rates['first_response_breaches'] == 0
+
+
+def test_unresolved_tickets_past_due_date():
+    """This function verifies that an unresolved ticket is in breach only once the current time passes its due date."""
+    metrics = analytics.compute_sla_metrics(TICKETS, now=NOW)
+    assert metrics['resolution_breached'].tolist() == [False, True, True, False]
+    assert numpy.isnan(metrics['resolution_hours'][2:]).all()
+    assert metrics['resolution_hours'][:2].tolist() == [12.0, 48.0]
+    later = analytics.compute_sla_metrics(TICKETS, now='2026-01-13T00:00:00Z')
+    assert later['resolution_breached'].tolist() == [False, True, True, True]
+
+
+def test_breach_rates():
+    """This function verifies the overall breach counts and rates."""
+    assert analytics.get_breach_rates(TICKETS, now=NOW) == {
+        'tickets': 4,
+        'first_response_breaches': 1,
+        'first_response_breach_rate': 0.5,
+        'resolution_breaches': 2,
+        'resolution_breach_rate': 0.5,
+    }
+
+
+def test_missing_group_value_is_none():
+    """This function verifies that tickets without a value for the grouping field are grouped under ``None``."""
+    rates = analytics.get_breach_rates(TICKETS, group_by='agent_id', now=NOW)
+    assert list(rates) == [100, 200, None]
+    assert rates[None]['tickets'] == 1
+    assert rates[None]['resolution_breaches'] == 1
+    assert rates[100]['resolution_breach_rate'] == 0.5
+    percentiles = analytics.get_duration_percentiles(TICKETS, group_by='agent_id', percentiles=(50,), now=NOW)
+    assert percentiles == {100: {'count': 2, 'p50': 30.0}, 200: {'count': 0, 'p50': None},
+                           None: {'count': 0, 'p50': None}}
+
+
+def test_ticket_records_are_supported():
+    """This function verifies that ticket records produce the same metrics as the JSON objects."""
+    ticket_records = records.to_records({'tickets': TICKETS}, records.Ticket)
+    expected = analytics.get_breach_rates(TICKETS, group_by='group_id', now=NOW)
+    assert analytics.get_breach_rates(ticket_records, group_by='group_id', now=NOW) == expected
+    assert analytics.get_duration_percentiles(ticket_records, 'first_response_hours', now=NOW) == {
+        'count': 2, 'p50': 4.0, 'p90': pytest.approx(5.6), 'p95': pytest.approx(5.8)}
+
+
+def test_numpy_arrays_are_supported():
+    """This function verifies that the arrays of a NumPy export are accepted with the missing columns completed."""
+    arrays = analytics.get_sla_arrays(TICKETS)
+    exported = {column: arrays[column] for column in ('id', 'created_at', 'due_by', 'stats.resolved_at')}
+    metrics = analytics.compute_sla_metrics(exported, now=NOW)
+    assert metrics['resolution_breached'].tolist() == [False, True, True, False]
+    assert not metrics['has_first_response_sla'].any()
+
+
+def test_unsupported_options():
+    """This function verifies that unsupported metrics and grouping fields are rejected."""
+    with pytest.raises(errors.exceptions.CurrentlyUnsupportedError):
+        analytics.get_duration_percentiles(TICKETS, metric='wait_hours')
+    with pytest.raises(errors.exceptions.CurrentlyUnsupportedError):
+        analytics.get_breach_rates(TICKETS, group_by='requester_id')
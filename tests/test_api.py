@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_api
+:Synopsis:          Tests for the request handling in the freshpy.api module
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import json
+from decimal import Decimal
+
+from freshpy import api
+
+
+class RecordingDecoder(object):
+    """This class is a custom JSON decoder that decodes floats as decimals and records the data it decodes."""
+    def __init__(self):
+        """This method instantiates the decoder."""
+        self.decoded = []
+
+    def __call__(self, data):
+        """This method decodes JSON data."""
+        self.decoded.append(data)
+        return json.loads(data, parse_float=Decimal)
+
+
+def _decoder_handler(_path, _query, _headers):
+    """This function serves a ticket, two pages of tickets and an error response."""
+    if _path.endswith('/tickets/1'):
+        return 200, {}, {'ticket': {'id': 1, 'score': 0.1}}
+    if _path.endswith('/tickets/2'):
+        return 400, {}, b'{"description": "Validation failed", "score": 0.2}'
+    if _path.endswith('/tickets/3'):
+        return 500, {}, b'Internal Server Error'
+    _page = int(_query.get('page', 1))
+    return 200, {}, {'tickets': [{'id': _page * 10 + _index, 'score': 0.5} for _index in range(max(3 - _page, 0))]}
+
+
+def test_injected_session_before_transport_import(make_client, monkeypatch):
+    """This function verifies that a session assigned to the core object works before the transport is imported."""
+    monkeypatch.setattr(api, 'requests', None)
+    monkeypatch.setattr(api, 'transport', None)
+    client = make_client(lambda path, query, headers: (200, {}, {'ticket': {'id': 5}}))
+    assert client.tickets.get_ticket(5) == {'ticket': {'id': 5}}
+    assert api.transport is not None
+
+
+def test_injected_session_reports_connect_phase(make_client, monkeypatch):
+    """This function verifies that the request hooks receive an event when an injected session is used."""
+    monkeypatch.setattr(api, 'transport', None)
+    events = []
+    client = make_client(lambda path, query, headers: (200, {}, {'ticket': {'id': 7}}),
+                         hooks={'on_response': events.append})
+    client.tickets.get_ticket(7)
+    assert len(events) == 1
+    assert events[0].status_code == 200
+    assert events[0].connect == 0.0
+
+
+def test_retryable_status_is_retried(make_client):
+    """This function verifies that a retryable status code is retried until a successful response is returned."""
+    statuses = [503, 429, 200]
+
+    def _handler(_path, _query, _headers):
+        return statuses.pop(0), {}, {'ticket': {'id': 1}}
+
+    client = make_client(_handler)
+    assert client.tickets.get_ticket(1) == {'ticket': {'id': 1}}
+    assert statuses == []
+
+
+def test_custom_decoder_is_used_for_single_responses(make_client):
+    """This function verifies that the configured decoder decodes single and error responses."""
+    decoder = RecordingDecoder()
+    client = make_client(_decoder_handler, json_decoder=decoder)
+    assert client.tickets.get_ticket(1) == {'ticket': {'id': 1, 'score': Decimal('0.1')}}
+    assert client.tickets.get_ticket(2) == {'description': 'Validation failed', 'score': Decimal('0.2')}
+    error = client.tickets.get_ticket(3)
+    assert error['status'] == 'exception' and isinstance(error['error_message'], ValueError)
+    assert decoder.decoded == [b'{"ticket": {"id": 1, "score": 0.1}}',
+                               b'{"description": "Validation failed", "score": 0.2}', b'Internal Server Error']
+
+
+def test_custom_decoder_is_used_for_pages(make_client):
+    """This function verifies that the configured decoder decodes paged and streamed responses."""
+    expected = [{'id': 10, 'score': Decimal('0.5')}, {'id': 11, 'score': Decimal('0.5')},
+                {'id': 20, 'score': Decimal('0.5')}]
+    for options in ({}, {'prefetch': True}, {'stream': True}):
+        decoder = RecordingDecoder()
+        client = make_client(_decoder_handler, json_decoder=decoder)
+        assert list(client.tickets.iter_tickets(per_page=2, **options)) == expected, options
+        assert decoder.decoded, options
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_async
+:Synopsis:          Tests for the asynchronous core object served by a mocked :py:mod:`httpx` transport
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import asyncio
+
+import pytest
+
+from freshpy import AsyncFreshPy, errors
+from freshpy.utils import retry
+
+httpx = pytest.importorskip('httpx')
+
+# Define constants
+TEST_DOMAIN = 'example.freshservice.com'
+TEST_API_KEY = 'test-api-key'
+PER_PAGE = 2
+AGENT = {'id': 16000500001, 'email': 'jane.doe@example.com'}
+
+
+def _create_client(_handler, **_options):
+    """This function creates an asynchronous core object whose client is served by an asynchronous handler."""
+    _options.setdefault('retry_policy', retry.RetryPolicy(backoff_base=0.001, backoff_max=0.002))
+    _options.setdefault('pace_requests', False)
+    _client = AsyncFreshPy(TEST_DOMAIN, TEST_API_KEY, **_options)
+    _client.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    return _client
+
+
+async def _run(_client, _coroutine_function):
+    """This function awaits a coroutine function with the asynchronous core object and then closes it."""
+    async with _client:
+        return await _coroutine_function(_client)
+
+
+async def _collect(_async_iterable):
+    """This function collects the items yielded by an asynchronous iterable into a list."""
+    return [_item async for _item in _async_iterable]
+
+
+class PageHandler(object):
+    """This class emulates the ticket and agent endpoints where each page of tickets can be delayed."""
+    def __init__(self, page_sizes=(2, 2, 1), delays=None):
+        """This method instantiates the handler.
+
+        :param page_sizes: The number of tickets on each page (pages beyond the list are empty)
+        :type page_sizes: list, tuple
+        :param delays: The number of seconds to wait before returning each page keyed by page number
+        :type delays: dict, None
+        """
+        self.page_sizes = page_sizes
+        self.delays = delays or {}
+        self.requested = []
+
+    async def __call__(self, request):
+        """This method returns the response for a request."""
+        path, params = request.url.path, request.url.params
+        self.requested.append((path, dict(params)))
+        if path.endswith('/tickets/1'):
+            return httpx.Response(200, json={'ticket': {'id': 1, 'subject': 'VPN'}})
+        if path.endswith('/tickets/404'):
+            return httpx.Response(404, json={'message': 'Record not found'})
+        if path.endswith('/agents'):
+            agents = [AGENT] if params.get('email') == AGENT['email'] else []
+            return httpx.Response(200, json={'agents': agents})
+        page = int(params.get('page', 1))
+        await asyncio.sleep(self.delays.get(page, 0))
+        size = self.page_sizes[page - 1] if page <= len(self.page_sizes) else 0
+        return httpx.Response(200, json={'tickets': [{'id': page * 100 + index} for index in range(size)]})
+
+
+def test_get_ticket():
+    """This function verifies that a ticket is retrieved through the asynchronous client."""
+    client = _create_client(PageHandler())
+    assert asyncio.run(_run(client, lambda _client: _client.tickets.get_ticket(1))) == {
+        'ticket': {'id': 1, 'subject': 'VPN'}}
+    assert client.client is None
+
+
+def test_not_found_returns_error_dictionary():
+    """This function verifies that a 404 response returns the error dictionary rather than raising an exception."""
+    client = _create_client(PageHandler())
+    assert asyncio.run(_run(client, lambda _client: _client.tickets.get_ticket(404))) == {
+        'status': 'error', 'status_code': 404, 'error_message': 'Data not found'}
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_iter_tickets_page_order(prefetch):
+    """This function verifies that tickets are yielded in page order and pagination stops after a short page."""
+    handler = PageHandler(page_sizes=(2, 2, 2, 1, 2), delays={1: 0.06, 2: 0.04, 3: 0.02})
+    client = _create_client(handler, prefetch_workers=3)
+    tickets = asyncio.run(_run(client, lambda _client: _collect(
+        _client.tickets.iter_tickets(per_page=PER_PAGE, prefetch=prefetch))))
+    assert [ticket['id'] for ticket in tickets] == [100, 101, 200, 201, 300, 301, 400]
+    if not prefetch:
+        assert [int(params['page']) for _, params in handler.requested] == [1, 2, 3, 4]
+
+
+def test_agent_email_lookup():
+    """This function verifies that agents are looked up by email address."""
+    client = _create_client(PageHandler())
+
+    async def _lookup(_client):
+        return (await _client.agents.get_agent_id(AGENT['email']),
+                await _client.agents.get_user_info(AGENT['email']))
+
+    assert asyncio.run(_run(client, _lookup)) == (AGENT['id'], AGENT)
+    with pytest.raises(errors.exceptions.NotFoundResponseError):
+        asyncio.run(_run(_create_client(PageHandler()),
+                         lambda _client: _client.agents.get_agent_id('missing@example.com')))
+
+
+@pytest.mark.parametrize('pace_requests', [False, True])
+def test_retry_does_not_block_event_loop(pace_requests):
+    """This function verifies that the waits before retrying a 503 and 429 response let other coroutines run."""
+    statuses = [503, 429, 200]
+
+    async def _handler(_request):
+        return httpx.Response(statuses.pop(0), headers={'Retry-After': '0.1'}, json={'ticket': {'id': 1}})
+
+    async def _get_ticket_while_ticking(_client):
+        _ticks = []
+
+        async def _tick():
+            while True:
+                _ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        _ticker = asyncio.ensure_future(_tick())
+        _started = time.perf_counter()
+        try:
+            _data = await _client.tickets.get_ticket(1)
+        finally:
+            _ticker.cancel()
+        return _data, time.perf_counter() - _started, len(_ticks)
+
+    client = _create_client(_handler, pace_requests=pace_requests)
+    data, elapsed, ticks = asyncio.run(_run(client, _get_ticket_while_ticking))
+    assert data == {'ticket': {'id': 1}}
+    assert statuses == []
+    assert elapsed >= 0.15
+    assert ticks >= 10
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_cache
+:Synopsis:          Tests for the response cache and the conditional requests used to revalidate its entries
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+
+from freshpy import api
+from freshpy.utils import cache
+
+# Define constants
+SHORT_TTL = 0.05
+ETAG = '"v1"'
+
+
+def _expire():
+    """This function waits until the entries stored with the short TTL have expired."""
+    time.sleep(SHORT_TTL * 2)
+
+
+def test_get_and_expiry():
+    """This function verifies that an entry is returned until it expires and that lookups are counted."""
+    response_cache = cache.ResponseCache()
+    response_cache.set('key', {'id': 1}, SHORT_TTL)
+    assert response_cache.get('key') == {'id': 1}
+    _expire()
+    assert response_cache.get('key') is None
+    stats = response_cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+
+def test_zero_ttl_is_not_stored():
+    """This function verifies that an entry with a TTL of zero is not stored."""
+    response_cache = cache.ResponseCache()
+    response_cache.set('key', {'id': 1}, 0)
+    assert len(response_cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """This function verifies that the least recently used entry is evicted when the cache is full."""
+    response_cache = cache.ResponseCache(max_size=2)
+    response_cache.set('first', 1, 60)
+    response_cache.set('second', 2, 60)
+    response_cache.get('first')
+    response_cache.set('third', 3, 60)
+    assert response_cache.get('second') is None
+    assert response_cache.get('first') == 1
+    assert response_cache.get_stats()['evictions'] == 1
+
+
+def test_expired_entry_with_validators_is_retained():
+    """This function verifies that an expired entry with validators can still be revalidated."""
+    response_cache = cache.ResponseCache()
+    response_cache.set('key', {'id': 1}, SHORT_TTL, {'etag': ETAG, 'size': 10})
+    _expire()
+    assert response_cache.get('key') is None
+    assert response_cache.get_entry('key') == ({'id': 1}, {'etag': ETAG, 'size': 10})
+    assert response_cache.revalidate('key', 60) == {'id': 1}
+    assert response_cache.get('key') == {'id': 1}
+    stats = response_cache.get_stats()
+    assert (stats['not_modified'], stats['bytes_saved']) == (1, 10)
+
+
+def test_revalidate_missing_entry():
+    """This function verifies that revalidating an entry that no longer exists returns ``None``."""
+    assert cache.ResponseCache().revalidate('key', 60) is None
+
+
+def test_invalidate_by_prefix():
+    """This function verifies that only the entries beginning with the prefix are removed."""
+    response_cache = cache.ResponseCache()
+    response_cache.set('https://host/api/v2/tickets/1', 1, 60)
+    response_cache.set('https://host/api/v2/tickets/2', 2, 60)
+    response_cache.set('https://host/api/v2/agents/1', 3, 60)
+    assert response_cache.invalidate('https://host/api/v2/tickets') == 2
+    assert len(response_cache) == 1
+    assert response_cache.invalidate() == 1
+
+
+def test_get_ttl_by_endpoint():
+    """This function verifies that the TTL is looked up using the first segment of the URI."""
+    response_cache = cache.ResponseCache(default_ttl=5, endpoint_ttls={'tickets': 10})
+    assert response_cache.get_ttl('tickets/1?include=stats') == 10
+    assert response_cache.get_ttl('/departments') == 5
+
+
+def test_conditional_headers():
+    """This function verifies that the conditional request headers are built from the validators."""
+    validators = {'etag': ETAG, 'last_modified': 'Sat, 17 Oct 2026 00:00:00 GMT', 'content_hash': 'abc'}
+    assert cache.get_conditional_headers(validators) == {
+        'If-None-Match': ETAG,
+        'If-Modified-Since': 'Sat, 17 Oct 2026 00:00:00 GMT',
+    }
+    assert cache.get_conditional_headers({'content_hash': 'abc'}) == {}
+
+
+def test_not_modified_response_renews_entry(make_client):
+    """This function verifies that an expired entry is revalidated with a conditional request."""
+    received = []
+
+    def _handler(_path, _query, _headers):
+        received.append(_headers.get('If-None-Match'))
+        if _headers.get('If-None-Match') == ETAG:
+            return 304, {'ETag': ETAG}, b''
+        return 200, {'ETag': ETAG}, {'ticket': {'id': 1}}
+
+    client = make_client(_handler, enable_cache=True, cache_ttls={'tickets': SHORT_TTL})
+    first = api.get_request_with_retries(client, 'tickets/1')
+    _expire()
+    assert api.get_request_with_retries(client, 'tickets/1') is first
+    assert received == [None, ETAG]
+    assert client.get_cache_stats()['not_modified'] == 1
+
+
+def test_not_modified_response_after_invalidation(make_client):
+    """This function verifies that the held data is returned and stored again when the entry is invalidated."""
+    def _handler(_path, _query, _headers):
+        if _headers.get('If-None-Match') == ETAG:
+            client.invalidate_cache()
+            return 304, {'ETag': ETAG}, b''
+        return 200, {'ETag': ETAG}, {'ticket': {'id': 1}}
+
+    client = make_client(_handler, enable_cache=True, cache_ttls={'tickets': SHORT_TTL})
+    first = api.get_request_with_retries(client, 'tickets/1')
+    _expire()
+    assert api.get_request_with_retries(client, 'tickets/1') is first
+    assert client.cache.get(client.base_url + 'tickets/1') is first
+
+
+def test_unchanged_body_reuses_cached_data(make_client):
+    """This function verifies that a body with the same content hash reuses the cached data."""
+    client = make_client(lambda path, query, headers: (200, {}, {'ticket': {'id': 1}}),
+                         enable_cache=True, cache_ttls={'tickets': SHORT_TTL})
+    first = api.get_request_with_retries(client, 'tickets/1')
+    _expire()
+    assert api.get_request_with_retries(client, 'tickets/1') is first
+    assert client.get_cache_stats()['unchanged'] == 1
+
+
+def test_decode_error_is_not_cached(make_client):
+    """This function verifies that the error dictionary for a malformed body is returned without being cached."""
+    bodies = [b'{"ticket": ', {'ticket': {'id': 1}}]
+    client = make_client(lambda path, query, headers: (200, {}, bodies.pop(0)), enable_cache=True)
+    error = api.get_request_with_retries(client, 'tickets/1')
+    assert error['status'] == 'exception'
+    assert len(client.cache) == 0
+    assert api.get_request_with_retries(client, 'tickets/1') == {'ticket': {'id': 1}}
+    assert not bodies
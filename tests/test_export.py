@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_export
+:Synopsis:          Tests for the columnar ticket export to Parquet, Feather, Arrow and NumPy
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import logging
+
+import pytest
+
+from freshpy import errors, tickets
+
+numpy = pytest.importorskip('numpy')
+
+# Define constants
+COLUMNS = {'id': 'int', 'subject': 'string', 'responder_id': 'int', 'created_at': 'timestamp', 'tags': 'json'}
+TICKETS = [{
+    'id': number,
+    'subject': f'Ticket {number}',
+    'responder_id': None if number == 7 else 500 + number,
+    'created_at': f'2026-01-{number:02d}T12:00:00Z',
+    'tags': ['vpn'] if number % 2 else [],
+} for number in range(1, 11)]
+
+
+def _tickets_handler(_tickets):
+    """This function returns a handler that emulates the ticket list endpoint for a list of tickets."""
+    def _handler(_path, _query, _headers):
+        _per_page = int(_query.get('per_page', 100))
+        _offset = (int(_query.get('page', 1)) - 1) * _per_page
+        return 200, {}, {'tickets': _tickets[_offset:_offset + _per_page]}
+    return _handler
+
+
+def _assert_ticket_arrays(_arrays):
+    """This function verifies the NumPy arrays exported for the test tickets."""
+    assert list(_arrays) == list(COLUMNS)
+    assert _arrays['id'].tolist() == list(range(1, 11))
+    assert _arrays['responder_id'].dtype == numpy.float64
+    assert numpy.isnan(_arrays['responder_id'][6]) and _arrays['responder_id'][0] == 501
+    assert _arrays['subject'][9] == 'Ticket 10'
+    assert _arrays['created_at'][0] == numpy.datetime64('2026-01-01T12:00:00')
+    assert _arrays['tags'][0] == '["vpn"]'
+
+
+def test_numpy_export_in_memory(make_client):
+    """This function verifies that the NumPy chunks are combined when no file path is supplied."""
+    client = make_client(_tickets_handler(TICKETS))
+    _assert_ticket_arrays(tickets.export_columnar(client, file_format='numpy', columns=COLUMNS, chunk_size=3))
+
+
+def test_numpy_export_to_file(make_client, tmp_path):
+    """This function verifies that the NumPy chunks are written to a ``.npz`` file one chunk at a time."""
+    file_path = str(tmp_path / 'tickets.npz')
+    client = make_client(_tickets_handler(TICKETS))
+    assert tickets.export_columnar(client, file_path, 'numpy', columns=COLUMNS, chunk_size=3) == 10
+    with numpy.load(file_path, allow_pickle=True) as numpy_file:
+        _assert_ticket_arrays({column: numpy_file[column] for column in numpy_file.files})
+    assert [path.name for path in tmp_path.iterdir()] == ['tickets.npz']
+
+
+def test_numpy_export_without_tickets(make_client, tmp_path):
+    """This function verifies that an empty export produces empty arrays for every column."""
+    file_path = str(tmp_path / 'tickets.npz')
+    client = make_client(_tickets_handler([]))
+    assert tickets.export_columnar(client, file_path, 'numpy', columns=COLUMNS) == 0
+    with numpy.load(file_path, allow_pickle=True) as numpy_file:
+        assert numpy_file.files == list(COLUMNS)
+        assert numpy_file['id'].dtype == numpy.int64 and len(numpy_file['id']) == 0
+        assert numpy_file['created_at'].dtype == numpy.dtype('datetime64[s]')
+
+
+def test_large_in_memory_export_is_logged(make_client, monkeypatch, caplog):
+    """This function verifies that a warning is logged once an in-memory export exceeds the row threshold."""
+    monkeypatch.setattr(tickets, 'IN_MEMORY_EXPORT_WARNING_ROWS', 4)
+    client = make_client(_tickets_handler(TICKETS))
+    with caplog.at_level(logging.WARNING, logger='freshpy'):
+        tickets.export_columnar(client, file_format='numpy', columns=COLUMNS, chunk_size=3)
+    assert [record.message for record in caplog.records] == [
+        'The in-memory export has exceeded 4 tickets and is held in memory in full; supply a file path to write '
+        'the tickets one chunk at a time']
+
+
+def test_parquet_export_writes_row_groups(make_client, tmp_path):
+    """This function verifies that each chunk is written to the Parquet file as a row group."""
+    pyarrow = pytest.importorskip('pyarrow')
+    import pyarrow.parquet
+    file_path = str(tmp_path / 'tickets.parquet')
+    client = make_client(_tickets_handler(TICKETS))
+    assert tickets.export_columnar(client, file_path, columns=COLUMNS, chunk_size=4) == 10
+    parquet_file = pyarrow.parquet.ParquetFile(file_path)
+    assert parquet_file.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column('id').to_pylist() == list(range(1, 11))
+    assert table.column('responder_id').to_pylist()[6] is None
+
+
+def test_arrow_export_in_memory(make_client):
+    """This function verifies that the record batches are combined into a table when no file path is supplied."""
+    pyarrow = pytest.importorskip('pyarrow')
+    client = make_client(_tickets_handler(TICKETS))
+    table = tickets.export_columnar(client, file_format='arrow', columns=COLUMNS, chunk_size=4)
+    assert isinstance(table, pyarrow.Table)
+    assert table.num_rows == 10
+    assert table.column('tags').to_pylist()[:2] == ['["vpn"]', '[]']
+
+
+def test_invalid_export_options(make_client):
+    """This function verifies that unsupported formats and missing file paths are rejected."""
+    client = make_client(_tickets_handler(TICKETS))
+    with pytest.raises(errors.exceptions.CurrentlyUnsupportedError):
+        tickets.export_columnar(client, file_format='csv')
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        tickets.export_columnar(client, file_format='parquet')
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_filters
+:Synopsis:          Tests for the expression language used to construct ticket filter queries
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from datetime import date
+
+import pytest
+
+from freshpy import errors, filters
+from freshpy.filters import F
+
+
+def test_unsupported_field_is_rejected():
+    """This function verifies that only the fields supported by the filter endpoint can be used."""
+    with pytest.raises(errors.exceptions.InvalidFieldError):
+        F.bogus
+    with pytest.raises(errors.exceptions.InvalidFieldError):
+        F['bogus']
+    with pytest.raises(AttributeError):
+        F._private
+    assert repr(F['status']) == "Field('status')"
+
+
+def test_expression_cannot_be_instantiated():
+    """This function verifies that the abstract base expression cannot be instantiated."""
+    with pytest.raises(TypeError):
+        filters.Expression()
+
+
+def test_conditions():
+    """This function verifies that the comparison operators produce conditions with formatted values."""
+    assert (F.priority >= 3).query == 'priority:>3'
+    assert (F.due_by <= date(2026, 1, 31)).query == "due_by:<'2026-01-31'"
+    assert (F.tag == 'vpn').query == "tag:'vpn'"
+    assert (F.agent_id == None).query == 'agent_id:null'  # noqa: E711
+    assert filters.format_value(True) == 'true'
+
+
+def test_in_values():
+    """This function verifies that a list of values produces an ``OR`` group or a single condition."""
+    assert F.status.in_([2, 3]).query == 'status:2 OR status:3'
+    assert isinstance(F.status.in_([2]), filters.Condition)
+    with pytest.raises(errors.exceptions.MissingRequiredDataError):
+        F.status.in_([])
+
+
+def test_between_values():
+    """This function verifies that a range produces an inclusive ``AND`` group."""
+    group = F.created_at.between(date(2026, 1, 1), '2026-01-31')
+    assert group.operator == 'AND'
+    assert group.query == "created_at:>'2026-01-01' AND created_at:<'2026-01-31'"
+
+
+def test_same_operator_groups_are_flattened():
+    """This function verifies that nested groups using the same operator are flattened without parentheses."""
+    expression = (F.status == 2) & (F.priority == 3) & F.created_at.between('2026-01-01', '2026-01-31')
+    assert len(expression.expressions) == 4
+    assert all(isinstance(item, filters.Condition) for item in expression.expressions)
+    assert '(' not in expression.query
+
+
+def test_mixed_operator_groups_are_parenthesized():
+    """This function verifies that a nested group using a different operator is enclosed in parentheses."""
+    expression = (F.status.in_([2, 3]) | (F.priority >= 3)) & (F.tag == 'vpn')
+    assert expression.query == "(status:2 OR status:3 OR priority:>3) AND tag:'vpn'"
+    assert ((F.status == 2) | ((F.priority == 1) & (F.urgency == 1))).query == 'status:2 OR (priority:1 AND urgency:1)'
+
+
+def test_expressions_cannot_be_combined_with_other_objects():
+    """This function verifies that an expression can only be combined with another expression."""
+    with pytest.raises(TypeError):
+        (F.status == 2) & 'priority:3'
+
+
+def test_query_and_uri_segment_are_cached():
+    """This function verifies that the query string and URI segment are only constructed once per expression."""
+    expression = (F.status == 2) & (F.priority >= 3)
+    query, uri_segment = expression.query, expression.uri_segment
+    assert expression.query is query
+    assert expression.uri_segment is uri_segment
+    assert uri_segment == '/filter?query="status%3A2+AND+priority%3A%3E3"'
+    assert str(expression) is query
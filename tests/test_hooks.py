@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_hooks
+:Synopsis:          Tests for the request lifecycle hooks and the Prometheus metrics adapter
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import logging
+
+import pytest
+
+from freshpy import errors
+from freshpy.utils import hooks
+
+# Define constants
+TICKET = {'ticket': {'id': 1}}
+
+
+def _ticket_handler(_path, _query, _headers):
+    """This function returns the same ticket for every request."""
+    return 200, {}, TICKET
+
+
+def _create_event(_status_code=200, _exception=None, **_values):
+    """This function creates a request event for the ``tickets/{id}`` endpoint with a given status and values."""
+    _event = hooks.RequestEvent('GET', 'https://example.freshservice.com/api/v2/tickets/1', 'tickets/{id}')
+    _event.status_code, _event.exception = _status_code, _exception
+    for _name, _value in _values.items():
+        setattr(_event, _name, _value)
+    return _event
+
+
+def test_failing_callback_does_not_break_call(make_client, caplog):
+    """This function verifies that an exception raised by a callback is logged and the API call still succeeds."""
+    events = []
+
+    def broken_hook(_event):
+        raise RuntimeError('metrics backend unavailable')
+
+    client = make_client(_ticket_handler, hooks={'on_response': [broken_hook, events.append]})
+    with caplog.at_level(logging.WARNING, logger='freshpy'):
+        assert client.tickets.get_ticket(1) == TICKET
+    assert len(events) == 1
+    assert any("'broken_hook' raised an exception: RuntimeError: metrics backend unavailable" in record.message
+               for record in caplog.records)
+
+
+def test_unregister_removes_callback(make_client):
+    """This function verifies that a callback is no longer called once it has been removed."""
+    events = []
+    client = make_client(_ticket_handler)
+    client.add_hook('on_response', events.append)
+    client.tickets.get_ticket(1)
+    assert client.remove_hook('on_response', events.append) is True
+    assert client.remove_hook('on_response', events.append) is False
+    client.tickets.get_ticket(1)
+    assert len(events) == 1
+    assert not client.hooks
+
+
+def test_invalid_event_is_rejected():
+    """This function verifies that callbacks can only be registered for the supported events."""
+    hook_manager = hooks.HookManager()
+    with pytest.raises(errors.exceptions.InvalidHookEventError):
+        hook_manager.register('on_success', print)
+    with pytest.raises(errors.exceptions.InvalidHookEventError):
+        hooks.HookManager({'on_success': print})
+
+
+def test_prometheus_render_format():
+    """This function verifies the Prometheus text exposition format returned by the adapter."""
+    adapter = hooks.PrometheusAdapter(buckets=(1.0, 0.1))
+    adapter.on_response(_create_event(wire_bytes=100, decoded_bytes=300, total=0.05))
+    adapter.on_response(_create_event(wire_bytes=50, total=0.5))
+    adapter.on_retry(_create_event(503, delay=0.2))
+    adapter.on_retry(_create_event(None, _exception=ConnectionError()))
+    adapter.on_throttle(_create_event(429, delay=1.5))
+    assert adapter.render() == '\n'.join([
+        '# HELP freshpy_requests_total API responses by endpoint and status code',
+        '# TYPE freshpy_requests_total counter',
+        'freshpy_requests_total{endpoint="tickets/{id}",status="200"} 2',
+        '# HELP freshpy_retries_total Retried API request attempts',
+        '# TYPE freshpy_retries_total counter',
+        'freshpy_retries_total{endpoint="tickets/{id}",reason="503"} 1',
+        'freshpy_retries_total{endpoint="tickets/{id}",reason="ConnectionError"} 1',
+        '# HELP freshpy_throttles_total Throttled API requests',
+        '# TYPE freshpy_throttles_total counter',
+        'freshpy_throttles_total{endpoint="tickets/{id}"} 1',
+        '# HELP freshpy_throttle_seconds_total Seconds spent waiting while throttled',
+        '# TYPE freshpy_throttle_seconds_total counter',
+        'freshpy_throttle_seconds_total{endpoint="tickets/{id}"} 1.5',
+        '# HELP freshpy_response_bytes_total Response body bytes over the wire and after decompression',
+        '# TYPE freshpy_response_bytes_total counter',
+        'freshpy_response_bytes_total{endpoint="tickets/{id}",kind="decoded"} 300',
+        'freshpy_response_bytes_total{endpoint="tickets/{id}",kind="wire"} 150',
+        '# HELP freshpy_request_duration_seconds API request duration by phase',
+        '# TYPE freshpy_request_duration_seconds histogram',
+        'freshpy_request_duration_seconds_bucket{endpoint="tickets/{id}",phase="total",le="0.1"} 1',
+        'freshpy_request_duration_seconds_bucket{endpoint="tickets/{id}",phase="total",le="1.0"} 2',
+        'freshpy_request_duration_seconds_bucket{endpoint="tickets/{id}",phase="total",le="+Inf"} 2',
+        'freshpy_request_duration_seconds_sum{endpoint="tickets/{id}",phase="total"} 0.55',
+        'freshpy_request_duration_seconds_count{endpoint="tickets/{id}",phase="total"} 2',
+    ]) + '\n'
+
+
+def test_prometheus_adapter_counts_requests(make_client):
+    """This function verifies that an attached adapter counts the responses and retries of API calls."""
+    statuses = [503, 200]
+
+    def _handler(_path, _query, _headers):
+        return statuses.pop(0), {}, TICKET
+
+    client = make_client(_handler)
+    adapter = hooks.PrometheusAdapter().attach(client)
+    client.tickets.get_ticket(1)
+    assert adapter.requests == {('tickets/{id}', '503'): 1, ('tickets/{id}', '200'): 1}
+    assert adapter.retries == {('tickets/{id}', '503'): 1}
+    assert adapter.durations[('tickets/{id}', 'total')][2] == 2
+
+
+@pytest.mark.parametrize('uri, template', [
+    ('tickets', 'tickets'),
+    ('tickets/123', 'tickets/{id}'),
+    ('/tickets/123/conversations?page=2', 'tickets/{id}/conversations'),
+    ('agents?email=jane.doe%40example.com', 'agents'),
+    ('tickets/filter?query="priority:3"', 'tickets/filter'),
+    ('agents/16000500001/', 'agents/{id}'),
+])
+def test_get_endpoint_template(uri, template):
+    """This function verifies that the query string is removed and numeric IDs are replaced."""
+    assert hooks.get_endpoint_template(uri) == template
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_json_stream
+:Synopsis:          Tests for the incremental decoding of JSON arrays split across arbitrary chunk boundaries
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import json
+
+import pytest
+
+from freshpy.utils.json_stream import iter_array_items
+
+# Define constants
+PAYLOAD = {
+    'meta': {'count': 4, 'note': 'tickets: [ignored]'},
+    'tickets': [
+        {'id': 1, 'subject': 'Printer is jammed ] again', 'priority': 12345678901234567890},
+        {'id': 2, 'subject': 'Café Wi-Fi — \U0001f4f6 down', 'tags': [], 'custom_fields': {'score': -1.5e-3}},
+        {'id': 3, 'subject': 'Escaped \\"quote\\" and \\\\ backslash', 'description': None},
+        17,
+    ],
+    'total': 4,
+}
+
+
+def _split(_data, _size):
+    """This function splits data into chunks of a given size."""
+    return [_data[_offset:_offset + _size] for _offset in range(0, len(_data), _size)]
+
+
+def _custom_decoder(_data):
+    """This function decodes JSON data without being the standard library function itself."""
+    return json.loads(_data)
+
+
+@pytest.mark.parametrize('decoder', [None, _custom_decoder])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_every_chunk_boundary(indent, decoder):
+    """This function verifies that the array is decoded identically regardless of where the chunks are split."""
+    body = json.dumps(PAYLOAD, ensure_ascii=False, indent=indent).encode('utf-8')
+    for size in range(1, len(body) + 1):
+        assert list(iter_array_items(_split(body, size), 'tickets', decoder)) == PAYLOAD['tickets'], size
+
+
+def test_custom_decoder_receives_each_element():
+    """This function verifies that the text of each element is passed to a custom decoder."""
+    decoded = []
+
+    def _decoder(_data):
+        decoded.append(_data)
+        return json.loads(_data, parse_float=str)
+
+    items = iter_array_items([b'{"tickets": [{"score": 0.1, "tags": ["]"]}, 2.50, "x\\"y"]}'], 'tickets', _decoder)
+    assert list(items) == [{'score': '0.1', 'tags': [']']}, '2.50', 'x"y']
+    assert decoded == ['{"score": 0.1, "tags": ["]"]}', '2.50', '"x\\"y"']
+
+
+def test_incomplete_array_raises_with_custom_decoder():
+    """This function verifies that a body that ends inside an element raises an exception with a custom decoder."""
+    items = iter_array_items([b'{"tickets": [{"id": 1}, {"id": "a'], 'tickets', _custom_decoder)
+    assert next(items) == {'id': 1}
+    with pytest.raises(ValueError):
+        next(items)
+
+
+def test_number_split_across_chunks():
+    """This function verifies that a number at the end of a chunk is not yielded before it is complete."""
+    assert list(iter_array_items([b'{"ids": [12', b'34, 5', b'6]}'], 'ids')) == [1234, 56]
+
+
+def test_multibyte_character_split_across_chunks():
+    """This function verifies that a UTF-8 character split between chunks is decoded correctly."""
+    body = json.dumps({'names': ['éè']}, ensure_ascii=False).encode('utf-8')
+    split_at = body.index('é'.encode('utf-8')) + 1
+    assert list(iter_array_items([body[:split_at], body[split_at:]], 'names')) == ['éè']
+
+
+def test_string_chunks():
+    """This function verifies that chunks which have already been decoded to text are supported."""
+    assert list(iter_array_items(_split('{"agents": [{"id": 1}, {"id": 2}]}', 3), 'agents')) == [{'id': 1}, {'id': 2}]
+
+
+def test_empty_array():
+    """This function verifies that an empty array yields nothing."""
+    assert list(iter_array_items([b'{"tickets": [ ]}'], 'tickets')) == []
+
+
+def test_missing_key():
+    """This function verifies that nothing is yielded when the key is not present."""
+    assert list(iter_array_items([b'{"agents": [1, 2]}'], 'tickets')) == []
+
+
+def test_incomplete_array_raises():
+    """This function verifies that a body that ends inside the array raises an exception."""
+    items = iter_array_items([b'{"tickets": [{"id": 1}, {"id": '], 'tickets')
+    assert next(items) == {'id': 1}
+    with pytest.raises(ValueError):
+        next(items)
+
+
+def test_elements_are_yielded_lazily():
+    """This function verifies that an element is yielded before the remaining chunks are consumed."""
+    consumed = []
+
+    def _chunks():
+        for _chunk in (b'{"tickets": [{"id": 1},', b' {"id": 2}]}'):
+            consumed.append(_chunk)
+            yield _chunk
+
+    items = iter_array_items(_chunks(), 'tickets')
+    assert next(items) == {'id': 1}
+    assert len(consumed) == 1
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_log_queue
+:Synopsis:          Tests for the bounded logging queue, its drop policies and the sampling of log records
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import logging
+import threading
+
+import pytest
+
+from freshpy import errors
+from freshpy.utils import log_queue, log_utils
+
+
+class RecordingHandler(logging.Handler):
+    """This class is a logging handler that slowly records the messages it writes."""
+    def __init__(self, delay=0.0):
+        """This method instantiates the handler.
+
+        :param delay: The number of seconds spent writing each record
+        :type delay: float
+        """
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+
+    def emit(self, record):
+        """This method records the message after the delay."""
+        time.sleep(self.delay)
+        self.messages.append(record.getMessage())
+
+
+def _create_record(_message, _level=logging.DEBUG):
+    """This function creates a log record with a given message and level."""
+    return logging.makeLogRecord({'msg': _message, 'levelno': _level, 'levelname': logging.getLevelName(_level)})
+
+
+def _queued_messages(_handler):
+    """This function removes and returns the messages of the records waiting on the queue of a handler."""
+    _messages = []
+    while not _handler.queue.empty():
+        _messages.append(_handler.queue.get_nowait().getMessage())
+    return _messages
+
+
+def test_drop_new_policy():
+    """This function verifies that new records are discarded and counted when the queue is full."""
+    handler = log_queue.BoundedQueueHandler(max_size=2, drop_policy=log_queue.DROP_NEW)
+    for number in range(5):
+        handler.handle(_create_record(f'record {number}'))
+    assert handler.dropped == 3
+    assert _queued_messages(handler) == ['record 0', 'record 1']
+
+
+def test_drop_oldest_policy():
+    """This function verifies that the oldest records are discarded and counted when the queue is full."""
+    handler = log_queue.BoundedQueueHandler(max_size=2, drop_policy=log_queue.DROP_OLDEST)
+    for number in range(5):
+        handler.handle(_create_record(f'record {number}'))
+    assert handler.dropped == 3
+    assert _queued_messages(handler) == ['record 3', 'record 4']
+
+
+def test_block_policy():
+    """This function verifies that the caller waits for space on the queue rather than discarding records."""
+    handler = log_queue.BoundedQueueHandler(max_size=1, drop_policy=log_queue.BLOCK)
+    handler.handle(_create_record('record 0'))
+    thread = threading.Thread(target=handler.handle, args=(_create_record('record 1'),))
+    thread.start()
+    thread.join(0.1)
+    assert thread.is_alive()
+    assert handler.queue.get_nowait().getMessage() == 'record 0'
+    thread.join(1)
+    assert not thread.is_alive()
+    assert handler.dropped == 0
+    assert _queued_messages(handler) == ['record 1']
+
+
+def test_invalid_drop_policy():
+    """This function verifies that an unsupported drop policy is rejected."""
+    with pytest.raises(errors.exceptions.InvalidDropPolicyError):
+        log_queue.BoundedQueueHandler(drop_policy='drop_all')
+
+
+@pytest.mark.parametrize('sample_rate, kept', [(0.1, 10), (0.25, 25), (0.0, 0), (1.0, 100), (5, 100)])
+def test_sampling_filter_rates(sample_rate, kept):
+    """This function verifies that the expected fraction of the records at or below the level are kept."""
+    sampling_filter = log_utils.SamplingFilter(sample_rate)
+    assert sum(sampling_filter.filter(_create_record('sampled')) for _ in range(100)) == kept
+
+
+def test_sampling_filter_keeps_higher_levels():
+    """This function verifies that the records above the sampled level are always kept."""
+    sampling_filter = log_utils.SamplingFilter(0.0, max_level=logging.INFO)
+    assert not sampling_filter.filter(_create_record('sampled', logging.INFO))
+    assert all(sampling_filter.filter(_create_record('kept', logging.WARNING)) for _ in range(10))
+
+
+def test_stop_queue_listeners_drains_queue():
+    """This function verifies that the queued records are written before the background thread is stopped."""
+    recording_handler = RecordingHandler(delay=0.002)
+    handler = log_queue.start_queue_handler([recording_handler], max_size=100)
+    for number in range(50):
+        handler.handle(_create_record(f'record {number}', logging.WARNING))
+    log_queue.stop_queue_listeners()
+    assert recording_handler.messages == [f'record {number}' for number in range(50)]
+    assert handler.listener not in log_queue._listeners
+    assert handler.dropped == 0
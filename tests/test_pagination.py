@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_pagination
+:Synopsis:          Tests for the sequential and concurrent pagination performed by the freshpy.api module
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from freshpy import api
+
+# Define constants
+PER_PAGE = 2
+
+
+class PageHandler(object):
+    """This class emulates a paginated endpoint where each page can be delayed."""
+    def __init__(self, page_sizes, delays=None):
+        """This method instantiates the handler.
+
+        :param page_sizes: The number of records on each page (pages beyond the list are empty)
+        :type page_sizes: list
+        :param delays: The number of seconds to wait before returning each page keyed by page number
+        :type delays: dict, None
+        """
+        self.page_sizes = page_sizes
+        self.delays = delays or {}
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def __call__(self, path, query, headers):
+        """This method returns the records for the requested page."""
+        page = int(query['page'])
+        with self._lock:
+            self.requested.append(page)
+        time.sleep(self.delays.get(page, 0))
+        size = self.page_sizes[page - 1] if page <= len(self.page_sizes) else 0
+        return 200, {}, {'tickets': [{'id': page * 100 + index} for index in range(size)]}
+
+
+def _page_numbers(_pages):
+    """This function returns the page number of each yielded page."""
+    return [_records[0]['id'] // 100 for _records in _pages]
+
+
+def test_sequential_pages_stop_at_short_page(make_client):
+    """This function verifies that sequential pagination stops after a short page."""
+    handler = PageHandler([2, 2, 1, 2])
+    client = make_client(handler)
+    assert _page_numbers(api.iterate_pages(client, 'tickets', 'tickets', per_page=PER_PAGE)) == [1, 2, 3]
+    assert handler.requested == [1, 2, 3]
+
+
+def test_prefetched_pages_are_yielded_in_order(make_client):
+    """This function verifies that pages are yielded in page order even when they complete out of order."""
+    handler = PageHandler([2, 2, 2, 2, 2, 1], delays={1: 0.15, 2: 0.1, 3: 0.05})
+    client = make_client(handler, prefetch_workers=4)
+    pages = list(api.iterate_pages(client, 'tickets', 'tickets', per_page=PER_PAGE, prefetch=True))
+    assert _page_numbers(pages) == [1, 2, 3, 4, 5, 6]
+
+
+def test_no_page_is_requested_after_last_page_completes(make_client):
+    """This function verifies that no new page is requested once a short page has completed."""
+    handler = PageHandler([2, 2, 1, 2, 2, 2], delays={1: 0.1, 2: 0.1})
+    client = make_client(handler, prefetch_workers=3)
+    pages = list(api.iterate_pages(client, 'tickets', 'tickets', per_page=PER_PAGE, prefetch=True))
+    assert _page_numbers(pages) == [1, 2, 3]
+    assert sorted(handler.requested) == [1, 2, 3]
+
+
+def test_no_page_is_requested_after_empty_page_completes(make_client):
+    """This function verifies that no new page is requested once an empty page has completed."""
+    handler = PageHandler([2, 2], delays={1: 0.1})
+    client = make_client(handler, prefetch_workers=3)
+    pages = list(api.iterate_pages(client, 'tickets', 'tickets', per_page=PER_PAGE, prefetch=True))
+    assert _page_numbers(pages) == [1, 2]
+    assert sorted(handler.requested) == [1, 2, 3]
+
+
+def test_closing_generator_cancels_pending_pages(make_client, monkeypatch):
+    """This function verifies that the pages which have not started are cancelled when the consumer stops early."""
+    futures = []
+
+    class SingleThreadExecutor(ThreadPoolExecutor):
+        """This class runs one page at a time so that the remaining pages stay pending."""
+        def __init__(self, max_workers=None):
+            super().__init__(max_workers=1)
+
+        def submit(self, *args, **kwargs):
+            future = super().submit(*args, **kwargs)
+            futures.append(future)
+            return future
+
+    monkeypatch.setattr(api, 'ThreadPoolExecutor', SingleThreadExecutor)
+    handler = PageHandler([2] * 10, delays={1: 0.05})
+    client = make_client(handler, prefetch_workers=4)
+    pages = api.iterate_pages(client, 'tickets', 'tickets', per_page=PER_PAGE, prefetch=True)
+    assert _page_numbers([next(pages)]) == [1]
+    pages.close()
+    time.sleep(0.1)
+    assert sum(future.cancelled() for future in futures) >= len(futures) - 2
+    assert len(handler.requested) <= 2
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_rate_limit
+:Synopsis:          Tests for the token bucket that paces API calls within the rate limit
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from email.utils import formatdate
+
+import pytest
+
+from freshpy.utils import rate_limit
+
+
+class FakeClock(object):
+    """This class replaces :py:func:`time.monotonic` with a clock that only advances when instructed."""
+    def __init__(self):
+        """This method instantiates the clock at an arbitrary starting point."""
+        self.now = 1000.0
+
+    def __call__(self):
+        """This method returns the current value of the clock."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """This fixture replaces the monotonic clock used by the rate limiter."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', fake_clock)
+    return fake_clock
+
+
+def test_requests_are_not_paced_without_budget(clock):
+    """This function verifies that requests are sent immediately until a budget is known."""
+    limiter = rate_limit.RateLimiter()
+    assert all(limiter.reserve() == 0.0 for _ in range(100))
+
+
+def test_bucket_paces_requests_once_empty(clock):
+    """This function verifies that requests wait for tokens to accrue once the bucket is empty."""
+    limiter = rate_limit.RateLimiter(60)
+    assert all(limiter.reserve() == 0.0 for _ in range(60))
+    assert limiter.reserve() == pytest.approx(1.0)
+    assert limiter.reserve() == pytest.approx(2.0)
+    clock.now += 10
+    assert limiter.reserve() == 0.0
+
+
+def test_budget_is_learned_from_headers(clock):
+    """This function verifies that the bucket is sized and drained using the rate limit headers."""
+    limiter = rate_limit.RateLimiter()
+    limiter.update_from_headers({'X-RateLimit-Total': '120', 'X-RateLimit-Remaining': '1'})
+    assert limiter.capacity == 120.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_invalid_headers_are_ignored(clock):
+    """This function verifies that malformed rate limit headers do not change the budget."""
+    limiter = rate_limit.RateLimiter(60)
+    limiter.update_from_headers({'X-RateLimit-Total': 'unlimited', 'X-RateLimit-Remaining': ''})
+    assert (limiter.capacity, limiter.tokens) == (60.0, 60.0)
+
+
+def test_throttle_blocks_every_caller(clock):
+    """This function verifies that a ``Retry-After`` value pauses every request sharing the limiter."""
+    limiter = rate_limit.RateLimiter()
+    assert limiter.throttle('5') == 5.0
+    assert limiter.reserve() == pytest.approx(5.0)
+    clock.now += 3
+    assert limiter.reserve() == pytest.approx(2.0)
+    assert limiter.throttled_count == 1
+
+
+def test_throttle_defaults_when_header_is_missing(clock):
+    """This function verifies that the default pause is used when the ``Retry-After`` header is missing."""
+    assert rate_limit.RateLimiter().throttle() == rate_limit.DEFAULT_RETRY_AFTER
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('30', 30.0),
+    (12, 12.0),
+    ('-5', 0.0),
+    (None, None),
+    ('soon', None),
+])
+def test_parse_retry_after(value, expected):
+    """This function verifies that the ``Retry-After`` header is converted into a number of seconds."""
+    assert rate_limit.parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    """This function verifies that a ``Retry-After`` header with an HTTP date is converted into seconds."""
+    retry_date = formatdate(rate_limit.time.time() + 60, usegmt=True)
+    assert rate_limit.parse_retry_after(retry_date) == pytest.approx(60, abs=2)
+
+
+def test_rate_limited_response_throttles_client(make_client):
+    """This function verifies that a ``429`` response pauses the rate limiter of the core object."""
+    statuses = [429, 200]
+    client = make_client(lambda path, query, headers: (statuses.pop(0), {'Retry-After': '0'}, {'ticket': {'id': 1}}),
+                         pace_requests=True)
+    assert client.tickets.get_ticket(1) == {'ticket': {'id': 1}}
+    assert client.rate_limiter.throttled_count == 1
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_records
+:Synopsis:          Tests for the compact ticket and agent records
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from freshpy import records
+
+# Define constants
+TICKET = {
+    'id': 101,
+    'subject': 'The VPN disconnects every hour',
+    'group_id': 16000123456,
+    'requester_id': 16000500001,
+    'priority': 2,
+    'created_at': '2026-01-31T17:45:00Z',
+    'updated_at': '2026-02-01T08:00:00.123Z',
+    'due_by': None,
+    'cc_emails': ['helpdesk@example.com'],
+    'tags': [],
+    'description_text': 'The VPN client disconnects every hour and has to be restarted. ' * 8,
+    'custom_fields': {'asset_tag': 'LT-1234', 'location': None},
+}
+
+
+def test_round_trip():
+    """This function verifies that a record is converted back into the original JSON object."""
+    assert records.Ticket(TICKET).to_dict() == TICKET
+
+
+def test_timestamps_are_stored_as_epoch_seconds():
+    """This function verifies that every ISO-8601 timestamp is stored as float epoch seconds."""
+    ticket = records.Ticket(TICKET)
+    assert ticket.created_at == 1769881500.0
+    assert ticket.updated_at == pytest.approx(1769932800.123)
+    assert isinstance(ticket.created_at, float) and isinstance(ticket.updated_at, float)
+    assert ticket.updated_at - ticket.created_at == pytest.approx(51300.123)
+    assert ticket.due_by is None
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2026-01-31T17:45:00Z', 1769881500.0),
+    ('2026-01-31T17:45:00.5Z', 1769881500.5),
+    ('2026-01-31T17:45:00.123456Z', 1769881500.123456),
+    ('2026-01-31T19:45:00+02:00', 1769881500.0),
+    ('2026-01-31T16:15:00-0130', 1769881500.0),
+    ('2026-01-31 17:45:00', 1769881500.0),
+])
+def test_iso_timestamps_are_parsed(value, expected):
+    """This function verifies that timestamps with fractional seconds or UTC offsets are parsed."""
+    assert records._parse_timestamp(value) == pytest.approx(expected, abs=1e-6)
+
+
+@pytest.mark.parametrize('value', ['2026-02-30T00:00:00Z', 'tomorrow', '2026-01-31', '', 1769881500, None])
+def test_other_values_are_not_parsed(value):
+    """This function verifies that values which are not valid timestamps are kept as-is."""
+    assert records._parse_timestamp(value) is value
+
+
+def test_timestamps_are_normalized_to_utc():
+    """This function verifies that timestamps are returned in the API format after normalization."""
+    ticket = records.Ticket({'id': 1, 'created_at': '2026-01-31T19:45:00.250+02:00', 'updated_at': 'unknown'})
+    assert ticket.to_dict() == {'id': 1, 'created_at': '2026-01-31T17:45:00.250Z', 'updated_at': 'unknown'}
+
+
+def test_extra_fields_are_decoded_on_access():
+    """This function verifies that fields without slots are available as attributes and from the ``get`` method."""
+    ticket = records.Ticket(TICKET)
+    assert ticket.custom_fields == {'asset_tag': 'LT-1234', 'location': None}
+    assert ticket.get('description_text') == TICKET['description_text']
+    assert ticket.get('missing', 'default') == 'default'
+    assert ticket.cc_emails == ('helpdesk@example.com',)
+    assert ticket.responder_id is None
+
+
+def test_values_are_shared_between_records():
+    """This function verifies that repeated values and the names of the extra fields are shared between records."""
+    first, second = records.to_records({'tickets': [dict(TICKET), {**TICKET, 'id': 102}]}, records.Ticket)
+    assert first.group_id is second.group_id
+    assert first.requester_id is second.requester_id
+    assert first._extra_keys is second._extra_keys
+
+
+def test_intern_tables_are_separated_by_field():
+    """This function verifies that equal values of different types are not substituted between fields."""
+    shared_values = {}
+    records.Agent({'id': 1, 'scoreboard_level_id': 1}, shared_values)
+    agent = records.Agent({'id': 2, 'job_title': True, 'scoreboard_level_id': 1}, shared_values)
+    assert agent.job_title is True
+
+
+def test_records_can_be_copied_and_pickled():
+    """This function verifies that records are restored with the same values when copied or pickled."""
+    ticket = records.Ticket(TICKET)
+    assert copy.copy(ticket) == ticket
+    assert pickle.loads(pickle.dumps(ticket)).to_dict() == TICKET
+
+
+def test_error_responses_are_returned_unchanged():
+    """This function verifies that data which does not contain any records is returned as-is."""
+    error = {'status': 'error', 'status_code': 404, 'error_message': 'Data not found'}
+    assert records.to_records(error, records.Ticket) is error
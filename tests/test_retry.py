@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_retry
+:Synopsis:          Tests for the retry policy and the retries performed for failed API calls
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from freshpy import errors
+from freshpy.utils import retry
+
+
+def test_backoff_ceiling_doubles_until_maximum(monkeypatch):
+    """This function verifies that the jitter is drawn below an exponential ceiling capped at the maximum."""
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: high)
+    policy = retry.RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+    assert [policy.get_backoff(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_backoff_uses_full_jitter():
+    """This function verifies that the backoff is a random value between zero and the ceiling."""
+    policy = retry.RetryPolicy(backoff_base=1.0, backoff_max=10.0)
+    delays = [policy.get_backoff(3) for _ in range(200)]
+    assert all(0.0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_after_header_defines_delay():
+    """This function verifies that the ``Retry-After`` header takes precedence over the backoff."""
+    response = SimpleNamespace(headers={'Retry-After': '7'})
+    assert retry.RetryPolicy().get_delay(1, response) == 7.0
+    assert retry.RetryPolicy(backoff_max=0.1, honor_retry_after=False).get_delay(1, response) <= 0.1
+
+
+def test_retryable_statuses():
+    """This function verifies that only the configured status codes are retried."""
+    policy = retry.RetryPolicy(retry_statuses=(500,))
+    assert policy.is_retryable_status(500)
+    assert not policy.is_retryable_status(503)
+
+
+def test_retryable_exceptions():
+    """This function verifies that connection and timeout errors are retried unless other exceptions are defined."""
+    policy = retry.RetryPolicy()
+    assert policy.is_retryable_exception(requests.exceptions.ConnectionError())
+    assert policy.is_retryable_exception(requests.exceptions.ReadTimeout())
+    assert not policy.is_retryable_exception(ValueError())
+    assert retry.RetryPolicy(retry_exceptions=(ValueError,)).is_retryable_exception(ValueError())
+
+
+def test_connection_error_is_retried(make_client):
+    """This function verifies that a request is retried after a connection error."""
+    failures = [requests.exceptions.ConnectionError('refused')]
+
+    def _handler(_path, _query, _headers):
+        if failures:
+            raise failures.pop()
+        return 200, {}, {'ticket': {'id': 1}}
+
+    client = make_client(_handler)
+    assert client.tickets.get_ticket(1) == {'ticket': {'id': 1}}
+
+
+def test_repeated_connection_errors_raise(make_client):
+    """This function verifies that an exception is raised once every attempt has failed."""
+    attempts = []
+
+    def _handler(_path, _query, _headers):
+        attempts.append(_path)
+        raise requests.exceptions.ConnectTimeout('timed out')
+
+    client = make_client(_handler, retry_policy=retry.RetryPolicy(max_attempts=3, backoff_base=0.001))
+    with pytest.raises(errors.exceptions.APIConnectionError):
+        client.tickets.get_ticket(1)
+    assert len(attempts) == 3
+
+
+def test_other_exceptions_are_not_retried(make_client):
+    """This function verifies that an exception that is not retryable is raised after the first attempt."""
+    attempts = []
+
+    def _handler(_path, _query, _headers):
+        attempts.append(_path)
+        raise ValueError('unexpected')
+
+    client = make_client(_handler)
+    with pytest.raises(RuntimeError):
+        client.tickets.get_ticket(1)
+    assert len(attempts) == 1
+
+
+def test_retryable_status_stops_at_max_attempts(make_client):
+    """This function verifies that the final response is returned once the attempts are exhausted."""
+    attempts = []
+
+    def _handler(_path, _query, _headers):
+        attempts.append(_path)
+        return 503, {}, {'message': 'unavailable'}
+
+    client = make_client(_handler, retry_policy=retry.RetryPolicy(max_attempts=2, backoff_base=0.001))
+    assert client.tickets.get_ticket(1) == {'message': 'unavailable'}
+    assert len(attempts) == 2
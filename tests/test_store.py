@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_store
+:Synopsis:          Tests for the local SQLite mirror of tickets and agents
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import pytest
+
+from freshpy import store
+from freshpy.store import LocalStore
+
+# Define constants
+TICKETS = [
+    {'id': 1, 'status': 2, 'priority': 1, 'group_id': 10, 'responder_id': 100, 'updated_at': '2026-01-01T00:00:00Z'},
+    {'id': 2, 'status': 2, 'priority': 3, 'group_id': 20, 'responder_id': 200, 'updated_at': '2026-01-03T00:00:00Z'},
+    {'id': 3, 'status': 5, 'priority': 3, 'group_id': 10, 'responder_id': None, 'updated_at': '2026-01-02T00:00:00Z'},
+]
+AGENTS = [
+    {'id': 100, 'email': 'Jane.Doe@example.com', 'active': True},
+    {'id': 200, 'email': 'john.roe@example.com', 'active': False},
+]
+
+
+@pytest.fixture
+def local_store():
+    """This fixture returns an in-memory store populated with the sample tickets and agents."""
+    with LocalStore(batch_size=2) as populated_store:
+        populated_store.write_tickets(TICKETS)
+        populated_store.write_agents(AGENTS)
+        yield populated_store
+
+
+def _ids(_records):
+    """This function returns the IDs of a list of records."""
+    return [_record['id'] for _record in _records]
+
+
+def test_get_ticket(local_store):
+    """This function verifies that the full JSON object is returned for a stored ticket."""
+    assert local_store.get_ticket('2') == TICKETS[1]
+    assert local_store.get_ticket(99) is None
+
+
+def test_write_replaces_existing_ticket(local_store):
+    """This function verifies that writing a ticket that is already stored replaces it."""
+    assert local_store.write_tickets([{**TICKETS[0], 'status': 4}]) == 1
+    assert local_store.get_ticket(1)['status'] == 4
+    assert local_store.query('SELECT COUNT(*) AS total FROM tickets') == [{'total': 3}]
+
+
+@pytest.mark.parametrize('criteria, expected', [
+    ({}, [2, 3, 1]),
+    ({'status': 2}, [2, 1]),
+    ({'priority': [1, 3], 'group_id': 10}, [3, 1]),
+    ({'responder_id': {200}}, [2]),
+    ({'updated_since': '2026-01-02T00:00:00Z'}, [2, 3]),
+    ({'limit': 1}, [2]),
+])
+def test_query_tickets(local_store, criteria, expected):
+    """This function verifies that the tickets are filtered and ordered by most recently updated."""
+    assert _ids(local_store.query_tickets(**criteria)) == expected
+
+
+def test_committed_batches_are_kept_after_failure():
+    """This function verifies that the batches written before a failure remain in the store."""
+    def _tickets():
+        yield from TICKETS
+        raise RuntimeError('The API request failed')
+
+    with LocalStore(batch_size=2) as local_store:
+        with pytest.raises(RuntimeError):
+            local_store.write_tickets(_tickets())
+        assert _ids(local_store.query_tickets()) == [2, 1]
+
+
+def test_get_agent(local_store):
+    """This function verifies that agents are looked up by ID or by case-insensitive email address."""
+    assert local_store.get_agent(100) == AGENTS[0]
+    assert local_store.get_agent('jane.doe@EXAMPLE.com') == AGENTS[0]
+    assert local_store.get_agent('missing@example.com') is None
+
+
+def test_query_agents(local_store):
+    """This function verifies that agents can be filtered by whether they are active."""
+    assert _ids(local_store.query_agents()) == [100, 200]
+    assert _ids(local_store.query_agents(only_active=True)) == [100]
+    assert _ids(local_store.query_agents(only_active=False)) == [200]
+
+
+def test_query_join(local_store):
+    """This function verifies that arbitrary read queries can join the tables."""
+    rows = local_store.query('SELECT tickets.id, agents.email FROM tickets JOIN agents '
+                             'ON agents.id = tickets.responder_id WHERE agents.active = ?', (1,))
+    assert rows == [{'id': 1, 'email': 'Jane.Doe@example.com'}]
+
+
+def test_store_persists_to_file(tmp_path):
+    """This function verifies that a file database retains its records after it is closed."""
+    database = str(tmp_path / 'freshpy.db')
+    with LocalStore(database) as local_store:
+        local_store.write_tickets(TICKETS)
+    with LocalStore(database) as local_store:
+        assert local_store.get_ticket(3) == TICKETS[2]
+
+
+def test_sync_tickets_advances_checkpoint(make_client):
+    """This function verifies that the next sync requests the tickets updated since the previous sync."""
+    requested = []
+
+    def _handler(_path, _query, _headers):
+        requested.append(_query.get('updated_since'))
+        _page = TICKETS if _query.get('page', '1') == '1' else []
+        return 200, {}, {'tickets': _page}
+
+    client = make_client(_handler)
+    with LocalStore() as local_store:
+        assert local_store.sync_tickets(client) == 3
+        checkpoint = local_store._get_state(store.TICKETS_CHECKPOINT_KEY)
+        local_store.sync_tickets(client)
+    assert requested[0] == store.DEFAULT_INITIAL_UPDATED_SINCE
+    assert requested[-1] == checkpoint
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_sync
+:Synopsis:          Tests for the incremental ticket synchronization and its persisted checkpoints
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import os
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from freshpy.sync import TicketSync
+from freshpy.utils import core_utils
+
+
+def _recent_timestamp(_seconds_ago=0):
+    """This function returns the UTC timestamp for a number of seconds in the past."""
+    return core_utils.format_timestamp(datetime.now(timezone.utc) - timedelta(seconds=_seconds_ago))
+
+
+def _list_handler(_tickets):
+    """This function returns a handler that emulates the ticket list endpoint and its ``updated_since`` filter."""
+    def _handler(_path, _query, _headers):
+        _updated_since = _query.get('updated_since', '')
+        _matched = sorted((_ticket for _ticket in _tickets if _ticket['updated_at'] >= _updated_since),
+                          key=lambda _ticket: _ticket['id'])
+        _per_page = int(_query.get('per_page', 30))
+        _offset = (int(_query.get('page', 1)) - 1) * _per_page
+        return 200, {}, {'tickets': _matched[_offset:_offset + _per_page]}
+    return _handler
+
+
+@pytest.fixture
+def ticket_data():
+    """This fixture returns tickets that were last updated well before the overlap window."""
+    return [
+        {'id': 1, 'updated_at': '2026-01-01T00:00:00Z'},
+        {'id': 2, 'updated_at': '2026-01-02T00:00:00Z'},
+        {'id': 3, 'updated_at': '2026-01-02T00:00:00Z'},
+    ]
+
+
+@pytest.fixture
+def checkpoint_file(tmp_path):
+    """This fixture returns the path to a checkpoint file that does not exist yet."""
+    return str(tmp_path / 'checkpoint.json')
+
+
+def _run(_sync):
+    """This function performs a complete run and returns the IDs of the tickets that were yielded."""
+    return [_ticket['id'] for _ticket in _sync.run()]
+
+
+def test_first_run_saves_checkpoint(make_client, ticket_data, checkpoint_file):
+    """This function verifies that the first run yields every ticket and records the boundary tickets."""
+    sync = TicketSync(make_client(_list_handler(ticket_data)), checkpoint_file)
+    assert _run(sync) == [1, 2, 3]
+    assert sync.last_run_count == 3
+    with open(checkpoint_file) as file:
+        assert json.load(file) == {'updated_at': '2026-01-02T00:00:00Z', 'boundary_ids': [2, 3]}
+
+
+def test_unchanged_tickets_are_skipped(make_client, ticket_data, checkpoint_file):
+    """This function verifies that the tickets at the high-water mark are not yielded again."""
+    sync = TicketSync(make_client(_list_handler(ticket_data)), checkpoint_file)
+    _run(sync)
+    assert _run(sync) == []
+
+
+def test_updated_tickets_are_yielded(make_client, ticket_data, checkpoint_file):
+    """This function verifies that a ticket updated after the checkpoint is yielded on the next run."""
+    sync = TicketSync(make_client(_list_handler(ticket_data)), checkpoint_file)
+    _run(sync)
+    ticket_data[0]['updated_at'] = '2026-01-03T00:00:00Z'
+    ticket_data.append({'id': 4, 'updated_at': '2026-01-02T00:00:00Z'})
+    assert _run(sync) == [1, 4]
+    assert sync.load_checkpoint() == {'updated_at': '2026-01-03T00:00:00Z', 'boundary_ids': [1]}
+
+
+def test_interrupted_run_keeps_checkpoint(make_client, ticket_data, checkpoint_file):
+    """This function verifies that the checkpoint is not advanced when a run does not complete."""
+    sync = TicketSync(make_client(_list_handler(ticket_data)), checkpoint_file)
+    tickets = sync.run()
+    next(tickets)
+    tickets.close()
+    assert not os.path.exists(checkpoint_file)
+    assert _run(sync) == [1, 2, 3]
+
+
+def test_overlap_window_is_repeated(make_client, ticket_data, checkpoint_file):
+    """This function verifies that tickets updated within the overlap window are yielded again on the next run."""
+    ticket_data.append({'id': 4, 'updated_at': _recent_timestamp(5)})
+    sync = TicketSync(make_client(_list_handler(ticket_data)), checkpoint_file, overlap_seconds=3600)
+    assert _run(sync) == [1, 2, 3, 4]
+    assert sync.load_checkpoint()['updated_at'] == '2026-01-02T00:00:00Z'
+    assert _run(sync) == [4]
+
+
+def test_initial_updated_since(make_client, ticket_data, checkpoint_file):
+    """This function verifies that the initial timestamp is used when no checkpoint exists."""
+    sync = TicketSync(make_client(_list_handler(ticket_data)), checkpoint_file,
+                      initial_updated_since='2026-01-02T00:00:00Z')
+    assert _run(sync) == [2, 3]
+
+
+def test_failed_save_keeps_previous_checkpoint(tmp_path, checkpoint_file):
+    """This function verifies that a checkpoint that cannot be written leaves the previous file intact."""
+    sync = TicketSync(None, checkpoint_file)
+    sync.save_checkpoint({'updated_at': '2026-01-01T00:00:00Z', 'boundary_ids': [1]})
+    with pytest.raises(TypeError):
+        sync.save_checkpoint({'updated_at': object(), 'boundary_ids': []})
+    assert sync.load_checkpoint() == {'updated_at': '2026-01-01T00:00:00Z', 'boundary_ids': [1]}
+    assert os.listdir(tmp_path) == ['checkpoint.json']
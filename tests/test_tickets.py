@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_tickets
+:Synopsis:          Tests for the bulk ticket retrieval and the filter queries that are split to exceed the result cap
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+import logging
+import threading
+
+import requests
+
+from freshpy import tickets
+from freshpy.utils import rate_limit
+
+# Define constants
+START_DATE = '2026-01-01'
+END_DATE = '2026-01-31'
+
+
+def _create_tickets(count, days=1, priorities=(1, 2, 3, 4)):
+    """This function creates ticket data spread evenly across a number of days and priorities."""
+    return [{
+        'id': number,
+        'created_at': f'2026-01-{number % days + 1:02d}T12:00:00Z',
+        'priority': priorities[number % len(priorities)],
+        'status': 2,
+    } for number in range(1, count + 1)]
+
+
+def _matches(_ticket, _condition):
+    """This function evaluates a single condition of a filter query for a ticket."""
+    _field, _value = _condition.split(':', 1)
+    if _field == 'created_at':
+        _created, _bound = _ticket['created_at'][:10], _value[2:-1]
+        return _created >= _bound if _value.startswith('>') else _created <= _bound
+    return str(_ticket[_field]) == _value
+
+
+def _filter_handler(_tickets, _queries=None):
+    """This function returns a handler that emulates the filter endpoint for a list of tickets."""
+    def _handler(_path, _query, _headers):
+        _conditions = _query['query'].strip('"').split(' AND ')
+        if _queries is not None:
+            _queries.append(_conditions)
+        _matched = [_ticket for _ticket in _tickets if all(_matches(_ticket, _cond) for _cond in _conditions)]
+        _offset = (int(_query.get('page', 1)) - 1) * tickets.FILTER_PER_PAGE
+        return 200, {}, {'tickets': _matched[_offset:_offset + tickets.FILTER_PER_PAGE], 'total': len(_matched)}
+    return _handler
+
+
+def test_query_below_cap_is_not_split(make_client):
+    """This function verifies that a query within the result cap is paginated without being split."""
+    queries = []
+    client = make_client(_filter_handler(_create_tickets(75, days=5), queries))
+    results = tickets.get_filtered_tickets(client, start_date=START_DATE, end_date=END_DATE)
+    assert [ticket['id'] for ticket in results] == list(range(1, 76))
+    assert len(queries) == 3
+
+
+def test_date_range_is_split(make_client, caplog):
+    """This function verifies that the date range is halved until each sub-query is within the result cap."""
+    client = make_client(_filter_handler(_create_tickets(1000, days=20)))
+    with caplog.at_level(logging.WARNING, logger='freshpy'):
+        results = tickets.get_filtered_tickets(client, start_date=START_DATE, end_date=END_DATE)
+    assert [ticket['id'] for ticket in results] == list(range(1, 1001))
+    assert not caplog.records
+
+
+def test_single_day_is_split_by_values(make_client):
+    """This function verifies that a single-day query is split by the values of the split fields."""
+    queries = []
+    client = make_client(_filter_handler(_create_tickets(800), queries))
+    results = tickets.get_filtered_tickets(client, start_date='2026-01-01', end_date='2026-01-01')
+    assert len(results) == 800
+    assert any('priority:4' in conditions for conditions in queries)
+
+
+def test_split_total_mismatch_is_logged(make_client, caplog):
+    """This function verifies that a warning is logged when the split values do not cover every ticket."""
+    client = make_client(_filter_handler(_create_tickets(500, priorities=(1, 2, 3, 4, 5))))
+    with caplog.at_level(logging.WARNING, logger='freshpy'):
+        results = tickets.get_filtered_tickets(client, start_date='2026-01-01', end_date='2026-01-01')
+    assert len(results) == 400
+    assert any('match 400 tickets but the query matches 500 tickets' in record.message for record in caplog.records)
+
+
+def test_custom_split_values(make_client, caplog):
+    """This function verifies that custom split values retrieve the tickets the default values would miss."""
+    client = make_client(_filter_handler(_create_tickets(500, priorities=(1, 2, 3, 4, 5))))
+    with caplog.at_level(logging.WARNING, logger='freshpy'):
+        results = tickets.get_filtered_tickets(client, start_date='2026-01-01', end_date='2026-01-01',
+                                               split_values={'priority': [1, 2, 3, 4, 5]})
+    assert len(results) == 500
+    assert not caplog.records
+
+
+class CountingRateLimiter(rate_limit.RateLimiter):
+    """This class is a rate limiter that counts the requests it paces."""
+    def __init__(self):
+        """This method instantiates the rate limiter without a budget."""
+        super().__init__()
+        self.acquired = 0
+        self._count_lock = threading.Lock()
+
+    def acquire(self):
+        """This method counts the request before pacing it."""
+        with self._count_lock:
+            self.acquired += 1
+        return super().acquire()
+
+
+def _bulk_handler(_requested):
+    """This function returns a handler that serves found, missing, failing and broken tickets by number."""
+    def _handler(_path, _query, _headers):
+        _ticket_number = int(_path.rsplit('/', 1)[-1])
+        _requested.append(_ticket_number)
+        if _ticket_number == 404:
+            return 404, {}, {'message': 'Record not found'}
+        if _ticket_number == 500:
+            return 500, {}, b'Internal Server Error'
+        if _ticket_number == 13:
+            raise requests.exceptions.InvalidURL('broken')
+        return 200, {}, {'ticket': {'id': _ticket_number}}
+    return _handler
+
+
+def test_get_tickets_by_ids_mixed_batch(make_client):
+    """This function verifies that found, missing and failing tickets are collected per ticket number."""
+    requested = []
+    client = make_client(_bulk_handler(requested), prefetch_workers=4)
+    client.rate_limiter = CountingRateLimiter()
+    results = tickets.get_tickets_by_ids(client, [1, '2', 404, 500, 13, 2, '1', ' 404', 1])
+    assert results['tickets'] == {1: {'id': 1}, '2': {'id': 2}}
+    assert results['not_found'] == [404]
+    assert set(results['errors']) == {500, 13}
+    assert results['errors'][500].startswith('500: ')
+    assert results['errors'][13].startswith('RuntimeError: InvalidURL')
+    assert sorted(requested) == [1, 2, 13, 404, 500]
+    assert client.rate_limiter.acquired == 5
+
+
+def test_get_tickets_by_ids_as_records(make_client):
+    """This function verifies that the tickets can be returned as records."""
+    client = make_client(_bulk_handler([]))
+    results = tickets.get_tickets_by_ids(client, [7, 8], as_records=True)
+    assert {number: ticket.id for number, ticket in results['tickets'].items()} == {7: 7, 8: 8}
+
+
+def test_get_tickets_by_ids_empty(make_client):
+    """This function verifies that no requests are made when no ticket numbers are supplied."""
+    requested = []
+    assert tickets.get_tickets_by_ids(make_client(_bulk_handler(requested)), []) == {
+        'tickets': {}, 'not_found': [], 'errors': {}}
+    assert not requested
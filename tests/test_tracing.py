@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.test_tracing
+:Synopsis:          Tests for the nesting of the OpenTelemetry spans emitted for requests, pages and bulk retrievals
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     18 Oct 2026
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from freshpy import api, tickets
+from freshpy.utils import tracing
+
+pytest.importorskip('opentelemetry.sdk.trace.export.in_memory_span_exporter')
+from opentelemetry import trace as otel_trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+# Define constants
+PER_PAGE = 2
+
+
+@pytest.fixture
+def span_exporter(monkeypatch):
+    """This fixture records the spans emitted by the package in memory without changing the global tracer provider."""
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, 'otel_trace', otel_trace)
+    monkeypatch.setattr(tracing, '_tracer', tracer_provider.get_tracer(tracing.TRACER_NAME))
+    monkeypatch.setattr(tracing, '_tracer_loaded', True)
+    yield exporter
+    tracer_provider.shutdown()
+
+
+def _page_handler(_path, _query, _headers):
+    """This function serves single tickets and three pages of tickets where the last page is short."""
+    if '/tickets/' in _path:
+        return 200, {}, {'ticket': {'id': int(_path.rsplit('/', 1)[-1])}}
+    _page = int(_query.get('page', 1))
+    return 200, {}, {'tickets': [{'id': _page * 10 + _index} for _index in range(PER_PAGE if _page < 3 else 1)]}
+
+
+def _spans_by_name(_exporter, _name):
+    """This function returns the finished spans with a given name."""
+    return [_span for _span in _exporter.get_finished_spans() if _span.name == _name]
+
+
+def _children(_exporter, _parent, _name):
+    """This function returns the finished spans with a given name whose parent is a given span."""
+    return [_span for _span in _spans_by_name(_exporter, _name)
+            if _span.parent is not None and _span.parent.span_id == _parent.context.span_id]
+
+
+def test_request_span_contains_attempts(make_client, span_exporter):
+    """This function verifies that each retry attempt is a child of the span for the request."""
+    statuses = [503, 200]
+    client = make_client(lambda path, query, headers: (statuses.pop(0), {}, {'ticket': {'id': 1}}))
+    client.tickets.get_ticket(1)
+    (request_span,) = _spans_by_name(span_exporter, tracing.REQUEST_SPAN)
+    attempts = _children(span_exporter, request_span, tracing.ATTEMPT_SPAN)
+    assert [span.attributes['http.response.status_code'] for span in attempts] == [503, 200]
+    assert attempts[0].attributes['error.type'] == '503'
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_page_spans_are_nested(make_client, span_exporter, prefetch):
+    """This function verifies that pages are children of the pagination span and contain their own attempts."""
+    client = make_client(_page_handler, prefetch_workers=3)
+    records = [record for page in api.iterate_pages(client, 'tickets', 'tickets', per_page=PER_PAGE,
+                                                    prefetch=prefetch) for record in page]
+    assert len(records) == 5
+    (pagination_span,) = _spans_by_name(span_exporter, tracing.PAGINATION_SPAN)
+    assert pagination_span.attributes['freshpy.pages'] == 3
+    pages = _children(span_exporter, pagination_span, tracing.PAGE_SPAN)
+    assert len(pages) == len(_spans_by_name(span_exporter, tracing.PAGE_SPAN)) >= 3
+    for page_span in pages:
+        assert len(_children(span_exporter, page_span, tracing.ATTEMPT_SPAN)) == 1
+        assert page_span.context.trace_id == pagination_span.context.trace_id
+
+
+def test_bulk_requests_are_nested_across_threads(make_client, span_exporter):
+    """This function verifies that the requests made by the worker threads are children of the bulk span."""
+    client = make_client(_page_handler, prefetch_workers=4)
+    results = tickets.get_tickets_by_ids(client, [1, 2, 3, 4, 5])
+    assert len(results['tickets']) == 5
+    (bulk_span,) = _spans_by_name(span_exporter, tracing.BULK_SPAN)
+    assert bulk_span.attributes['freshpy.bulk.requests'] == 5
+    requests = _children(span_exporter, bulk_span, tracing.REQUEST_SPAN)
+    assert len(requests) == 5
+    for request_span in requests:
+        assert len(_children(span_exporter, request_span, tracing.ATTEMPT_SPAN)) == 1
+
+
+def test_bind_context_in_thread_pool(span_exporter):
+    """This function verifies that a bound function runs with the current span of the submitting thread."""
+    def _current_span_id():
+        return otel_trace.get_current_span().get_span_context().span_id
+
+    with tracing.start_span(tracing.BULK_SPAN) as span, ThreadPoolExecutor(max_workers=2) as executor:
+        bound = [executor.submit(tracing.bind_context(_current_span_id)) for _ in range(4)]
+        unbound = executor.submit(_current_span_id)
+        assert {future.result() for future in bound} == {span.get_span_context().span_id}
+        assert unbound.result() != span.get_span_context().span_id